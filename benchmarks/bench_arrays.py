@@ -0,0 +1,55 @@
+"""IntArray against List for numeric work on 50k elements.
+
+Summing and adding two sequences elementwise, written with List methods and
+with the vectorised IntArray methods.
+
+    python -m benchmarks.bench_arrays
+"""
+
+from .main import time_source, report
+
+
+SETUP = """
+values = List()
+for i in 50000 {
+    values = values.push(i)
+}
+"""
+
+LIST_WORK = SETUP + """
+total = 0
+doubled = values
+for round in 5 {
+    total = values.reduce(lambda: total, value {
+        return value + total
+    }, 0)
+    doubled = values.map(lambda: value {
+        return value + value
+    })
+}
+print(total, doubled.length())
+"""
+
+ARRAY_WORK = SETUP + """
+array = IntArray(*values)
+total = 0
+doubled = array
+for round in 5 {
+    total = array.sum()
+    doubled = array + array
+}
+print(total, doubled.length())
+"""
+
+
+def main():
+    for engine in ("tree", "vm", "closure"):
+        setup = time_source(SETUP, repeat=1, engine=engine)
+        legacy = time_source(LIST_WORK, repeat=1, engine=engine) - setup
+        current = time_source(ARRAY_WORK, repeat=1, engine=engine) - setup
+        report(f"sum and add 50k x5, List, {engine}", legacy)
+        report(f"sum and add 50k x5, IntArray, {engine}", current, legacy)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,65 @@
+"""Parsing and running a generated program of 100k statements.
+
+The program is made of small functions with local variables, each called
+once. The memory held by its resolved AST is measured with tracemalloc,
+then the whole program is run with Max.
+
+    python -m benchmarks.bench_ast
+"""
+
+from time import perf_counter
+import tracemalloc
+
+from maxlang.lex import Lexer
+from maxlang.parse import Interpreter, Parser, Resolver
+from .main import report, time_source
+
+
+# Five statements per block: the function, the three in its body and the call
+STATEMENTS = 100_000
+
+BLOCK = """\
+f{index}: n {{
+    x = n * 2 + {index}
+    y = x - n / 3
+    return y + x
+}}
+total = f{index}(3) + total
+"""
+
+
+def resolved_ast(tokens) -> tuple[list, Interpreter]:
+    """The statements of the tokens and the interpreter they were resolved
+    for, which holds the resolved AST with them."""
+
+    def error(*args):
+        raise AssertionError(args)
+
+    statements = Parser(tokens, error).parse()
+    interpreter = Interpreter(error)
+    Resolver(interpreter, error).resolve_many(statements)
+    return statements, interpreter
+
+
+def main():
+    source = "total = 0\n" + "".join(
+        BLOCK.format(index=index) for index in range(STATEMENTS // 5)
+    )
+    source += "print(total)\n"
+    tokens = Lexer(source).scan_tokens()
+
+    tracemalloc.start()
+    ast = resolved_ast(tokens)
+    size, _peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print(f"{'resolved AST of 100k statements':<45} {size / 1e6:10.1f} MB")
+    del ast
+
+    start = perf_counter()
+    resolved_ast(tokens)
+    report("parse and resolve 100k statements", perf_counter() - start)
+    report("run 100k statements", time_source(source, repeat=1))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,106 @@
+"""Building collections one persistent version per element against filling
+a builder in place and freezing it once.
+
+    python -m benchmarks.bench_builders
+"""
+
+from time import perf_counter
+
+from maxlang.native_functions.vector import Vector, TransientVector
+from maxlang.native_functions.hamt import Hamt, TransientHamt
+from .main import time_source, report
+
+
+SIZE = 100_000
+
+PUSH_LIST = """
+items = List()
+for i in 100000 {
+    items = items.push(i)
+}
+print(items.length())
+"""
+
+BUILD_LIST = """
+builder = List().toBuilder()
+for i in 100000 {
+    builder.push(i)
+}
+print(builder.freeze().length())
+"""
+
+SET_MAP = """
+map = Map()
+for i in 20000 {
+    map = map.set(i, i)
+}
+print(map.length())
+"""
+
+BUILD_MAP = """
+builder = Map().toBuilder()
+for i in 20000 {
+    builder.set(i, i)
+}
+print(builder.freeze().length())
+"""
+
+
+def best_of(run, repeat: int = 3) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = perf_counter()
+        run()
+        best = min(best, perf_counter() - start)
+    return best
+
+
+def persistent_vector():
+    vector = Vector()
+    for value in range(SIZE):
+        vector = vector.push(value)
+
+
+def transient_vector():
+    transient = TransientVector(Vector())
+    for value in range(SIZE):
+        transient.push(value)
+    transient.persistent()
+
+
+def persistent_hamt():
+    hamt = Hamt()
+    for key in range(SIZE):
+        hamt = hamt.set(key, key)
+
+
+def transient_hamt():
+    transient = TransientHamt(Hamt())
+    for key in range(SIZE):
+        transient.set(key, key)
+    transient.persistent()
+
+
+def main():
+    legacy = best_of(persistent_vector)
+    report(f"vector, {SIZE} pushes (persistent)", legacy)
+    report(f"vector, {SIZE} pushes (transient)", best_of(transient_vector), legacy)
+
+    legacy = best_of(persistent_hamt)
+    report(f"hamt, {SIZE} sets (persistent)", legacy)
+    report(f"hamt, {SIZE} sets (transient)", best_of(transient_hamt), legacy)
+
+    for engine in ("tree", "closure"):
+        legacy = time_source(PUSH_LIST, repeat=1, engine=engine)
+        current = time_source(BUILD_LIST, repeat=1, engine=engine)
+        report(f"100k List, {engine} (push)", legacy)
+        report(f"100k List, {engine} (builder)", current, legacy)
+
+        legacy = time_source(SET_MAP, repeat=1, engine=engine)
+        current = time_source(BUILD_MAP, repeat=1, engine=engine)
+        report(f"20k Map, {engine} (set)", legacy)
+        report(f"20k Map, {engine} (builder)", current, legacy)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,27 @@
+"""Tree-walking interpreter against the closure-compiling engine.
+
+    python -m benchmarks.bench_closure
+"""
+
+from .bench_dispatch import WHILE_LOOP, RECURSIVE_FIB
+from .bench_inline_cache import METHOD_CALLS
+from .main import time_source, report
+
+
+def main():
+    for name, source in (
+        ("while loop", WHILE_LOOP),
+        ("recursive fib", RECURSIVE_FIB),
+        ("method calls", METHOD_CALLS),
+    ):
+        tree = time_source(source, engine="tree")
+        vm = time_source(source, engine="vm")
+        closure = time_source(source, engine="closure")
+
+        report(f"{name} (tree)", tree)
+        report(f"{name} (vm)", vm, tree)
+        report(f"{name} (closure)", closure, tree)
+
+
+if __name__ == "__main__":
+    main()
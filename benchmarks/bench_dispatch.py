@@ -0,0 +1,70 @@
+"""Visitor dispatch micro-benchmark.
+
+Compares the per-class precomputed visitor method against the previous
+dispatch, which rebuilt the snake_case method name on every ``accept``.
+
+    python -m benchmarks.bench_dispatch
+"""
+
+from contextlib import contextmanager
+
+from maxlang.parse.expressions import Expression
+from maxlang.parse.statements import Statement
+from .main import time_source, report
+
+
+WHILE_LOOP = """
+i = 0
+total = 0
+while i < 3000 {
+    total = total + i
+    i = i + 1
+}
+print(total)
+"""
+
+RECURSIVE_FIB = """
+fib: n {
+    if n < 2 {
+        return n
+    }
+    return fib(n - 1) + fib(n - 2)
+}
+print(fib(16))
+"""
+
+
+def legacy_accept(self, visitor):
+    class_name = "".join(
+        "_" + char.lower() if char.isupper() else char
+        for char in self.__class__.__name__
+    ).lstrip("_")
+    func = getattr(visitor, f"visit_{class_name}")
+    return func(self)
+
+
+@contextmanager
+def legacy_dispatch():
+    expression_accept = Expression.accept
+    statement_accept = Statement.accept
+    Expression.accept = legacy_accept
+    Statement.accept = legacy_accept
+    try:
+        yield
+    finally:
+        Expression.accept = expression_accept
+        Statement.accept = statement_accept
+
+
+def main():
+    for name, source in (("while loop", WHILE_LOOP), ("recursive fib", RECURSIVE_FIB)):
+        with legacy_dispatch():
+            legacy = time_source(source)
+        current = time_source(source)
+
+        report(f"{name} (name rebuilt per accept)", legacy)
+        report(f"{name} (precomputed dispatch)", current, legacy)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,67 @@
+"""Lexing a large template full of escaped interpolations.
+
+Lexers used to drop the backslash of every escaped `\\${` by rebuilding the
+source, copying everything after it, which RewritingLexer does again for
+comparison. Both lexers now step over the escape and unescape each string
+once, when adding its token.
+
+    python -m benchmarks.bench_escapes
+"""
+
+from time import perf_counter
+
+from maxlang.lex import Lexer, RegexLexer
+from .main import report
+
+
+LINES = 10_000
+
+TEMPLATE_LINE = (
+    """page = page + "<li id='\\${id}'>${name}: \\${price} (${count} left, """
+    """shipped in \\${days} days)</li>"\n"""
+)
+
+
+class RewritingLexer(Lexer):
+    def string_interpolation(self, delimiter: str):
+        if (
+            self.peek() == "$"
+            and self.peek_next() == "{"
+            and self.previous() == "\\"
+        ):
+            self.source = self.source[: self.current - 1] + self.source[self.current :]
+            return
+
+        super().string_interpolation(delimiter)
+
+
+def best_of(run, repeat: int = 3) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = perf_counter()
+        run()
+        best = min(best, perf_counter() - start)
+    return best
+
+
+def scan(lexer_class, source: str):
+    return lexer_class(source).scan_tokens()
+
+
+def main():
+    source = TEMPLATE_LINE * LINES
+    escapes = source.count("\\${")
+
+    literals = [token.literal for token in scan(RewritingLexer, source)]
+    for lexer_class in (Lexer, RegexLexer):
+        assert [token.literal for token in scan(lexer_class, source)] == literals
+
+    legacy = best_of(lambda: scan(RewritingLexer, source), repeat=1)
+    report(f"lex {LINES} lines, {escapes} escapes (rewrite)", legacy)
+    for name, lexer_class in (("scan", Lexer), ("regex", RegexLexer)):
+        current = best_of(lambda: scan(lexer_class, source))
+        report(f"lex {LINES} lines, {escapes} escapes ({name})", current, legacy)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,60 @@
+"""For loops over native collections, read directly from their storage
+against stepping through next() and a Pair on every iteration.
+
+    python -m benchmarks.bench_for_loops
+"""
+
+from contextlib import contextmanager
+
+from maxlang.parse.interpreter import StatementInterpreter
+from .main import time_source, report
+
+
+LOOPS = """
+items = List(0, 1, 2, 3, 4, 5, 6, 7, 8, 9)
+pairs = Map("a" -> 1, "b" -> 2, "c" -> 3, "d" -> 4)
+count = 0
+for round in 40 {
+    for item in items {
+        count = count + 1
+    }
+    for i in 50 {
+        count = count + 1
+    }
+    for char in "abcdefghijklmnopqrstuvwxyz" {
+        count = count + 1
+    }
+    for pair in pairs {
+        count = count + 1
+    }
+}
+print(count)
+"""
+
+
+def follow_next(self, in_name, statement):
+    return self.follow_next(self.get_iterator(in_name, statement), statement)
+
+
+@contextmanager
+def next_protocol():
+    iterate = StatementInterpreter.iterate
+    StatementInterpreter.iterate = follow_next
+    try:
+        yield
+    finally:
+        StatementInterpreter.iterate = iterate
+
+
+def main():
+    for engine in ("tree", "vm", "closure"):
+        with next_protocol():
+            legacy = time_source(LOOPS, engine=engine)
+        current = time_source(LOOPS, engine=engine)
+
+        report(f"native loops, {engine} (next protocol)", legacy)
+        report(f"native loops, {engine} (direct)", current, legacy)
+
+
+if __name__ == "__main__":
+    main()
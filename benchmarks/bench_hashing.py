@@ -0,0 +1,89 @@
+"""Equality, hashing and toString of Lists and Maps.
+
+Equality of versions sharing most of their storage is measured against
+materialising both sides, as it used to, and through the interpreter by
+looking up List keys in a Map and printing a nested List repeatedly, both
+of which only compute a hash or a string once per value.
+
+    python -m benchmarks.bench_hashing
+"""
+
+from time import perf_counter
+
+from maxlang.native_functions.hamt import Hamt
+from maxlang.native_functions.vector import Vector
+from .main import time_source, report
+
+
+SIZES = (100_000, 200_000)
+COMPARISONS = 100
+
+LIST_KEYS = """
+keys = List()
+for i in 200 {
+    keys = keys.push(List(i, i + 1, List(i)))
+}
+map = Map()
+for key in keys {
+    map = map.set(key, key.length())
+}
+total = 0
+for i in 50 {
+    for key in keys {
+        total = map.get(key) + total
+    }
+}
+print(total)
+"""
+
+NESTED_STRING = """
+values = List()
+for i in 300 {
+    values = values.push(i -> List(i, "i"))
+}
+for i in 100 {
+    values.toString()
+}
+"""
+
+
+def best_of(run, repeat: int = 3) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = perf_counter()
+        run()
+        best = min(best, perf_counter() - start)
+    return best
+
+
+def main():
+    for size in SIZES:
+        vector = Vector.from_iterable(range(size))
+        other = vector.set(size // 2, -1).set(size // 2, size // 2)
+
+        legacy = best_of(
+            lambda: [list(vector) == list(other) for _ in range(COMPARISONS)]
+        )
+        current = best_of(lambda: [vector.equals(other) for _ in range(COMPARISONS)])
+        report(f"List equals x{COMPARISONS}, {size} items (copy)", legacy)
+        report(f"List equals x{COMPARISONS}, {size} items (shared)", current, legacy)
+
+        hamt = Hamt.from_items((i, i) for i in range(size))
+        other = hamt.remove(size // 2).set(size // 2, size // 2)
+
+        legacy = best_of(
+            lambda: [dict(hamt.items()) == dict(other.items()) for _ in range(10)]
+        )
+        current = best_of(lambda: [hamt.equals(other) for _ in range(10)])
+        report(f"Map equals x10, {size} keys (copy)", legacy)
+        report(f"Map equals x10, {size} keys (shared)", current, legacy)
+
+    for engine in ("tree", "vm", "closure"):
+        current = time_source(LIST_KEYS, repeat=1, engine=engine)
+        report(f"10k Map lookups by List key, {engine}", current)
+        current = time_source(NESTED_STRING, repeat=1, engine=engine)
+        report(f"toString of a nested List x100, {engine}", current)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,78 @@
+"""Method and attribute lookup with and without per-node inline caches.
+
+The uncached run restores the previous lookups: InstanceCallable.get for
+properties and internal_find_method for operators, which walk the class
+hierarchy and allocate a Token on every evaluation.
+
+    python -m benchmarks.bench_inline_cache
+"""
+
+from contextlib import contextmanager
+
+from maxlang.parse.interpreter import ExpressionInterpreter
+from maxlang.parse.callable import InstanceCallable
+from .main import time_source, report
+
+
+METHOD_CALLS = """
+class Shape {
+    init: size {
+        return Map("size" -> size)
+    }
+    area {
+        return self.size * self.size
+    }
+}
+class Square: Shape {
+    init: size {
+        return Map("size" -> size)
+    }
+    perimeter {
+        return self.size * 4
+    }
+}
+square = Square(3)
+i = 0
+while i < 3000 {
+    square.area()
+    square.perimeter()
+    i = i + 1
+}
+print(square.area())
+"""
+
+
+@contextmanager
+def uncached_lookups():
+    find_method = ExpressionInterpreter.find_method
+    get_property = ExpressionInterpreter.get_property
+
+    def legacy_find_method(self, expression, receiver, name):
+        return receiver.internal_find_method(name)
+
+    def legacy_get_property(self, expression, obj):
+        if isinstance(obj, InstanceCallable):
+            return obj.get(expression.name)
+        return get_property(self, expression, obj)
+
+    ExpressionInterpreter.find_method = legacy_find_method
+    ExpressionInterpreter.get_property = legacy_get_property
+    try:
+        yield
+    finally:
+        ExpressionInterpreter.find_method = find_method
+        ExpressionInterpreter.get_property = get_property
+
+
+def main():
+    for engine in ("tree", "vm"):
+        with uncached_lookups():
+            legacy = time_source(METHOD_CALLS, engine=engine)
+        current = time_source(METHOD_CALLS, engine=engine)
+
+        report(f"method calls, {engine} (uncached)", legacy)
+        report(f"method calls, {engine} (inline caches)", current, legacy)
+
+
+if __name__ == "__main__":
+    main()
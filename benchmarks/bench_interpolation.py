@@ -0,0 +1,52 @@
+"""Formatting log messages with string interpolation.
+
+Interpolations used to run as a chain of String.add calls, the way the
+same message is built with +, which is kept as the baseline.
+
+    python -m benchmarks.bench_interpolation
+"""
+
+from .main import time_source, report
+
+
+MESSAGES = 20_000
+
+SETUP = """
+class Request {
+    init: id {
+        return Map("id" -> id)
+    }
+    toString {
+        return "Request(${self.id})"
+    }
+}
+request = Request(7)
+user = "alice"
+message = ""
+"""
+
+CONCATENATE = SETUP + f"""
+for i in {MESSAGES} {{
+    message = "[" + i + "] " + user + " sent " + request + " of " + 1.5 + " kB, ok: " + true
+}}
+print(message)
+"""
+
+INTERPOLATE = SETUP + f"""
+for i in {MESSAGES} {{
+    message = "[${{i}}] ${{user}} sent ${{request}} of ${{1.5}} kB, ok: ${{true}}"
+}}
+print(message)
+"""
+
+
+def main():
+    for engine in ("tree", "vm", "closure"):
+        legacy = time_source(CONCATENATE, repeat=3, engine=engine)
+        current = time_source(INTERPOLATE, repeat=3, engine=engine)
+        report(f"format {MESSAGES} messages with +, {engine}", legacy)
+        report(f"format {MESSAGES} messages, interpolated, {engine}", current, legacy)
+
+
+if __name__ == "__main__":
+    main()
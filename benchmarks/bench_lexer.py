@@ -0,0 +1,77 @@
+"""Lexing a generated 50k-line source with both lexers.
+
+The source repeats a block of typical code, with classes, lambdas, string
+interpolations nested in one another, escaped interpolations and both kinds
+of comments. The token streams are checked to be the same before timing.
+
+    python -m benchmarks.bench_lexer
+"""
+
+from dataclasses import astuple
+from time import perf_counter
+
+from maxlang.lex import Lexer, RegexLexer
+from .main import report
+
+
+LINES = 50_000
+
+BLOCK = """\
+-- Points and their distances
+class Point {
+    init: x, y {
+        return Map("x" -> x, "y" -> y)
+    }
+    toString {
+        return "Point(${self.x}, ${self.y})"
+    }
+}
+-* Sums the squares
+   of the differences *-
+distance: a, b {
+    dx = a.x - b.x
+    dy = a.y - b.y
+    return dx * dx + dy * dy
+}
+points = List(Point(1, 2), Point(3.5, 4.25), Point(-1, 0))
+total = 0
+for point in points {
+    total += distance(point, Point(0, 0)) // 2
+    if total >= 10 and total != 12 or !false {
+        print("total ${total} at ${"point ${point}"} costs \\${cost}")
+    }
+}
+square = lambda: n { return n * n }
+print('single ${square(3)}', `back ${total / 4}`)
+"""
+
+
+def best_of(run, repeat: int = 5) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = perf_counter()
+        run()
+        best = min(best, perf_counter() - start)
+    return best
+
+
+def scan(lexer_class, source: str):
+    return lexer_class(source).scan_tokens()
+
+
+def main():
+    source = BLOCK * (LINES // BLOCK.count("\n"))
+    lines = source.count("\n")
+
+    # Tokens only compare their type and lexeme
+    expected = [astuple(token) for token in scan(Lexer, source)]
+    assert [astuple(token) for token in scan(RegexLexer, source)] == expected
+
+    legacy = best_of(lambda: scan(Lexer, source))
+    current = best_of(lambda: scan(RegexLexer, source))
+    report(f"lex {lines} lines (scan)", legacy)
+    report(f"lex {lines} lines (regex)", current, legacy)
+
+
+if __name__ == "__main__":
+    main()
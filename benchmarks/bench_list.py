@@ -0,0 +1,76 @@
+"""List operations on 100k+ elements.
+
+The persistent vector is measured against copying a Python list on every
+update, the other way to keep old versions of a List intact, and through
+the interpreter by building and updating a 100k-element List.
+
+    python -m benchmarks.bench_list
+"""
+
+from time import perf_counter
+
+from maxlang.native_functions.vector import Vector
+from .main import time_source, report
+
+
+SIZES = (100_000, 200_000)
+UPDATES = 2_000
+
+BUILD_AND_UPDATE = """
+items = List()
+for i in 100000 {
+    items = items.push(i)
+}
+last = null
+for i in 2000 {
+    items = items.set(i * 50, 0)
+    last = items.get(i * 49)
+}
+print(items.length(), last)
+"""
+
+
+def best_of(run, repeat: int = 3) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = perf_counter()
+        run()
+        best = min(best, perf_counter() - start)
+    return best
+
+
+def copied_updates(values: list):
+    for i in range(UPDATES):
+        values = values.copy()
+        values[i * 7] = None
+        values = [*values, i]
+        values = values[:-1]
+
+
+def vector_updates(vector: Vector):
+    for i in range(UPDATES):
+        vector = vector.set(i * 7, None).push(i).pop()
+
+
+def main():
+    for size in SIZES:
+        values = list(range(size))
+        vector = Vector.from_iterable(values)
+
+        legacy = best_of(lambda: copied_updates(values))
+        current = best_of(lambda: vector_updates(vector))
+        report(f"set/push/pop x{UPDATES}, {size} items (copy)", legacy)
+        report(f"set/push/pop x{UPDATES}, {size} items (vector)", current, legacy)
+
+        legacy = best_of(lambda: [values[i] for i in range(0, size, 3)])
+        current = best_of(lambda: [vector.get(i) for i in range(0, size, 3)])
+        report(f"get every 3rd, {size} items (flat list)", legacy)
+        report(f"get every 3rd, {size} items (vector)", current, legacy)
+
+    for engine in ("tree", "vm", "closure"):
+        current = time_source(BUILD_AND_UPDATE, repeat=1, engine=engine)
+        report(f"build and update 100k List, {engine}", current)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,65 @@
+"""Data processing written as for loops with push against the native map,
+filter, reduce and sortBy methods.
+
+    python -m benchmarks.bench_list_methods
+"""
+
+from .main import time_source, report
+
+
+SETUP = """
+builder = List().toBuilder()
+for i in 5000 {
+    builder.push(i)
+}
+items = builder.freeze()
+"""
+
+LOOPS = SETUP + """
+doubled = List()
+for item in items {
+    doubled = doubled.push(item * 2)
+}
+large = List()
+for item in doubled {
+    if item > 3000 {
+        large = large.push(item)
+    }
+}
+total = 0
+for item in large {
+    total = item + total
+}
+print(total)
+"""
+
+METHODS = SETUP + """
+doubled = items.map(lambda: item {
+    return item * 2
+})
+large = doubled.filter(lambda: item {
+    return item > 3000
+})
+print(large.reduce(lambda: total, item {
+    return total + item
+}, 0))
+"""
+
+SORT = SETUP + """
+print(items.sortBy(lambda: item {
+    return 0 - item
+}).slice(0, 3))
+"""
+
+
+def main():
+    for engine in ("tree", "vm", "closure"):
+        legacy = time_source(LOOPS, engine=engine)
+        current = time_source(METHODS, engine=engine)
+        report(f"map/filter/reduce 5k, {engine} (loops)", legacy)
+        report(f"map/filter/reduce 5k, {engine} (methods)", current, legacy)
+        report(f"sortBy 5k, {engine}", time_source(SORT, engine=engine))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,78 @@
+"""Map operations on 100k+ entries.
+
+The hash array mapped trie is measured against copying a dict on every
+update, the other way to keep old versions of a Map intact, and through the
+interpreter by building, updating and iterating a 20k-entry Map.
+
+    python -m benchmarks.bench_map
+"""
+
+from time import perf_counter
+
+from maxlang.native_functions.hamt import Hamt
+from .main import time_source, report
+
+
+SIZES = (100_000, 200_000)
+UPDATES = 1_000
+
+BUILD_AND_UPDATE = """
+map = Map()
+for i in 20000 {
+    map = map.set(i, i)
+}
+for i in 1000 {
+    map = map.remove(i * 7).first
+}
+count = 0
+for pair in map {
+    count = count + 1
+}
+print(map.length(), count)
+"""
+
+
+def best_of(run, repeat: int = 3) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = perf_counter()
+        run()
+        best = min(best, perf_counter() - start)
+    return best
+
+
+def copied_updates(values: dict):
+    for i in range(UPDATES):
+        values = values.copy()
+        values[-i] = i
+        values = values.copy()
+        del values[i]
+
+
+def hamt_updates(hamt: Hamt):
+    for i in range(UPDATES):
+        hamt = hamt.set(-i, i).remove(i)
+
+
+def main():
+    for size in SIZES:
+        values = {i: i for i in range(size)}
+        hamt = Hamt.from_items(values.items())
+
+        legacy = best_of(lambda: copied_updates(values))
+        current = best_of(lambda: hamt_updates(hamt))
+        report(f"set/remove x{UPDATES}, {size} keys (copy)", legacy)
+        report(f"set/remove x{UPDATES}, {size} keys (hamt)", current, legacy)
+
+        legacy = best_of(lambda: [values[i] for i in range(0, size, 3)])
+        current = best_of(lambda: [hamt[i] for i in range(0, size, 3)])
+        report(f"get every 3rd, {size} keys (dict)", legacy)
+        report(f"get every 3rd, {size} keys (hamt)", current, legacy)
+
+    for engine in ("tree", "vm", "closure"):
+        current = time_source(BUILD_AND_UPDATE, repeat=1, engine=engine)
+        report(f"build, update and iterate 20k Map, {engine}", current)
+
+
+if __name__ == "__main__":
+    main()
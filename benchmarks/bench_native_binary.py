@@ -0,0 +1,49 @@
+"""Binary operators on native values, with and without the fast path.
+
+The method run disables ExpressionInterpreter.native_binary, so every
+operator goes through the operand's add/greaterThan/equals methods.
+
+    python -m benchmarks.bench_native_binary
+"""
+
+from contextlib import contextmanager
+
+from maxlang.parse.interpreter import ExpressionInterpreter
+from .main import time_source, report
+
+
+NUMERIC_LOOP = """
+i = 0
+total = 0
+ratio = 0.5
+while i < 3000 {
+    total = total + i * 2 - 1
+    ratio = ratio * 1.0001
+    i = i + 1
+}
+print(total, ratio)
+"""
+
+
+@contextmanager
+def method_operators():
+    native_binary = ExpressionInterpreter.native_binary
+    ExpressionInterpreter.native_binary = lambda self, *args: None
+    try:
+        yield
+    finally:
+        ExpressionInterpreter.native_binary = native_binary
+
+
+def main():
+    for engine in ("tree", "vm"):
+        with method_operators():
+            legacy = time_source(NUMERIC_LOOP, engine=engine)
+        current = time_source(NUMERIC_LOOP, engine=engine)
+
+        report(f"numeric loop, {engine} (methods)", legacy)
+        report(f"numeric loop, {engine} (native fast path)", current, legacy)
+
+
+if __name__ == "__main__":
+    main()
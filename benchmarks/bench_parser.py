@@ -0,0 +1,81 @@
+"""Parsing generated 10k-line sources.
+
+One source repeats a block of typical code with classes, functions, loops
+and lambdas, the other is made of long expressions mixing every infix
+operator. Both are lexed once, only parsing the tokens is timed.
+
+    python -m benchmarks.bench_parser
+"""
+
+from time import perf_counter
+
+from maxlang.lex import Lexer
+from maxlang.parse.parser import Parser
+from .main import report
+
+
+LINES = 10_000
+
+PROGRAM = """\
+class Point {
+    init: x, y {
+        return Map("x" -> x, "y" -> y)
+    }
+    toString {
+        return "Point(${self.x}, ${self.y})"
+    }
+}
+distance: a, b {
+    dx = a.x - b.x
+    dy = a.y - b.y
+    return dx * dx + dy * dy
+}
+points = List(Point(1, 2), Point(3.5, 4.25), Point(-1, 0))
+total = 0
+for point in points {
+    total = distance(point, Point(0, 0)) / 2 + total
+    if total >= 10 and total != 12 or !false {
+        print("total ${total} at ${point}")
+    }
+}
+square = lambda: n {
+    return n * n
+}
+"""
+
+EXPRESSIONS = """\
+a = x + y * 2 - z / 4 >= 10 and !done or count != limit and name == "max"
+b = p.x * p.x + p.y * p.y -> "norm" -> -(q.z - 1.5) * 3
+c = f(a, b + 1, key: -c * (d + e)).field.other(1 < 2, 3 <= 4, 5 > 6)
+d = "sum ${a + b * c} of ${f(x).y} and ${-z}" + label
+"""
+
+
+def best_of(run, repeat: int = 3) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = perf_counter()
+        run()
+        best = min(best, perf_counter() - start)
+    return best
+
+
+def parse(tokens):
+    errors = []
+    statements = Parser(tokens, lambda token, message: errors.append(message)).parse()
+    assert not errors, errors
+    return statements
+
+
+def main():
+    for name, block in (("program", PROGRAM), ("expressions", EXPRESSIONS)):
+        source = block * (LINES // block.count("\n"))
+        tokens = Lexer(source).scan_tokens()
+
+        seconds = best_of(lambda: parse(tokens))
+        report(f"parse {source.count(chr(10))} lines ({name})", seconds)
+        print(f"{'':<45} {len(tokens) / seconds / 1000:10.1f} k tokens/s")
+
+
+if __name__ == "__main__":
+    main()
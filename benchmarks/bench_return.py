@@ -0,0 +1,74 @@
+"""Function returns passed up as values against the Return exception.
+
+The exception run patches the previous behaviour back in: return statements
+raise and FunctionCallable.call catches.
+
+    python -m benchmarks.bench_return
+"""
+
+from contextlib import contextmanager
+
+from maxlang.parse.callable import FunctionCallable, _NO_RETURN_VALUE
+from maxlang.parse.environment import Environment
+from maxlang.parse.interpreter import StatementInterpreter
+from .bench_dispatch import RECURSIVE_FIB
+from .bench_inline_cache import METHOD_CALLS
+from .main import time_source, report
+
+
+class Return(Exception):
+    def __init__(self, value):
+        self.value = value
+
+
+def raise_return(self, statement):
+    value = _NO_RETURN_VALUE
+    if statement.value is not None:
+        value = self.evaluate(statement.value)
+
+    raise Return(value)
+
+
+def catch_return(self, interpreter, arguments):
+    environment = Environment(self.closure)
+    environment.slots = list(arguments)
+
+    try:
+        interpreter.execute_block(self.declaration.body, environment)
+    except Return as ret:
+        if ret.value is _NO_RETURN_VALUE:
+            return self.return_self()
+
+        return ret.value
+
+    return self.return_self()
+
+
+@contextmanager
+def exception_returns():
+    visit_return_statement = StatementInterpreter.visit_return_statement
+    call = FunctionCallable.call
+    StatementInterpreter.visit_return_statement = raise_return
+    FunctionCallable.call = catch_return
+    try:
+        yield
+    finally:
+        StatementInterpreter.visit_return_statement = visit_return_statement
+        FunctionCallable.call = call
+
+
+def main():
+    for name, source in (
+        ("recursive fib", RECURSIVE_FIB),
+        ("method calls", METHOD_CALLS),
+    ):
+        with exception_returns():
+            legacy = time_source(source)
+        current = time_source(source)
+
+        report(f"{name} (Return exception)", legacy)
+        report(f"{name} (returned values)", current, legacy)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,84 @@
+"""Set against a Map with dummy values, the way to deduplicate before it.
+
+Deduplicates 20k values drawn from 1000 through the interpreter and looks
+each of them up, then measures the bulk operations at the Hamt level on two
+100k-key sets sharing most of their structure, against Python sets rebuilt
+from their keys.
+
+    python -m benchmarks.bench_set
+"""
+
+from time import perf_counter
+
+from maxlang.native_functions.hamt import Hamt
+from .main import time_source, report
+
+
+SIZE = 100_000
+
+MAP_DEDUPLICATE = """
+seen = Map()
+for round in 20 {
+    for i in 1000 {
+        seen = seen.set(i, true)
+    }
+}
+hits = 0
+for round in 20 {
+    for i in 1000 {
+        if seen.length() > 0 and seen.get(i) {
+            hits = hits + 1
+        }
+    }
+}
+print(seen.length(), hits)
+"""
+
+SET_DEDUPLICATE = """
+seen = Set()
+for round in 20 {
+    for i in 1000 {
+        seen = seen.add(i)
+    }
+}
+hits = 0
+for round in 20 {
+    for i in 1000 {
+        if seen.length() > 0 and seen.contains(i) {
+            hits = hits + 1
+        }
+    }
+}
+print(seen.length(), hits)
+"""
+
+
+def best_of(run, repeat: int = 3) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = perf_counter()
+        run()
+        best = min(best, perf_counter() - start)
+    return best
+
+
+def main():
+    for engine in ("tree", "vm", "closure"):
+        legacy = time_source(MAP_DEDUPLICATE, repeat=1, engine=engine)
+        current = time_source(SET_DEDUPLICATE, repeat=1, engine=engine)
+        report(f"deduplicate 20k, Map, {engine}", legacy)
+        report(f"deduplicate 20k, Set, {engine}", current, legacy)
+
+    hamt = Hamt.from_items((i, True) for i in range(SIZE))
+    other = hamt.remove(0).set(-1, True)
+
+    for name in ("union", "intersection", "difference"):
+        operation = getattr(set, name)
+        legacy = best_of(lambda: operation(set(hamt), set(other)))
+        current = best_of(lambda: getattr(hamt, name)(other))
+        report(f"{name}, {SIZE} shared keys (rebuilt)", legacy)
+        report(f"{name}, {SIZE} shared keys (hamt)", current, legacy)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,107 @@
+"""Running a generated script of some 12k lines whole and streamed.
+
+The script is written to a temporary file and run with Max.run_file, once
+reading the whole file first and once one statement at a time. Peak memory
+is measured with tracemalloc, time separately without it. Lexing a block
+comment and a string of 80k lines each is then timed with both lexers.
+
+    python -m benchmarks.bench_streaming
+"""
+
+from contextlib import redirect_stdout
+from tempfile import NamedTemporaryFile
+from time import perf_counter
+import io
+import os
+import tracemalloc
+
+from maxlang import Max
+from maxlang.lex import Lexer, StreamingLexer
+from .main import report
+
+
+BLOCKS = 2_000
+
+LONG_TOKEN_LINES = 80_000
+
+BLOCK = """\
+-- Block {index}
+value = {index} * 3 + 1
+total = total + value
+if value > 100 and total != 0 {{
+    label = "value ${{value}} of block {index}, running total ${{total}}"
+}}
+"""
+
+
+def write_script() -> str:
+    with NamedTemporaryFile("w", suffix=".max", delete=False) as file:
+        file.write("total = 0\nlabel = \"\"\n")
+        for index in range(BLOCKS):
+            file.write(BLOCK.format(index=index))
+        file.write("print(total, label)\n")
+    return file.name
+
+
+def run(path: str, stream: bool) -> str:
+    out = io.StringIO()
+    with redirect_stdout(out):
+        Max(stream=stream).run_file(path)
+    return out.getvalue()
+
+
+def peak_memory(path: str, stream: bool) -> int:
+    tracemalloc.start()
+    run(path, stream)
+    _current, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return peak
+
+
+def long_tokens():
+    body = "".join(
+        f"line {index} of a long token\n" for index in range(LONG_TOKEN_LINES)
+    )
+    lines = LONG_TOKEN_LINES // 1000
+    for name, source in (("comment", f"-* {body} *-\n"), ("string", f'"{body}"\n')):
+        start = perf_counter()
+        Lexer(source).scan_tokens()
+        legacy = perf_counter() - start
+        start = perf_counter()
+        for _token in StreamingLexer(io.StringIO(source)).stream_tokens():
+            pass
+        current = perf_counter() - start
+        report(f"lex {lines}k-line {name} (whole)", legacy)
+        report(f"lex {lines}k-line {name} (streamed)", current, legacy)
+
+
+def main():
+    path = write_script()
+    try:
+        megabytes = os.path.getsize(path) / 1e6
+        assert run(path, stream=True) == run(path, stream=False)
+
+        legacy = peak_memory(path, stream=False)
+        current = peak_memory(path, stream=True)
+        print(f"peak memory, {megabytes:.1f} MB script (whole)    {legacy / 1e6:8.1f} MB")
+        print(
+            f"peak memory, {megabytes:.1f} MB script (streamed) {current / 1e6:8.1f} MB"
+            f"   x{legacy / current:.2f}"
+        )
+
+        start = perf_counter()
+        run(path, stream=False)
+        legacy = perf_counter() - start
+        start = perf_counter()
+        run(path, stream=True)
+        current = perf_counter() - start
+        report(f"run {megabytes:.1f} MB script (whole)", legacy)
+        report(f"run {megabytes:.1f} MB script (streamed)", current, legacy)
+    finally:
+        os.remove(path)
+
+    long_tokens()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,51 @@
+"""Building a long String by repeated concatenation, and with String.join.
+
+Concatenation is measured with ropes and with every concatenation copied,
+as it was before, by raising the rope threshold out of reach.
+
+    python -m benchmarks.bench_strings
+"""
+
+from maxlang.native_functions.BaseTypes import String
+from .main import time_source, report
+
+
+PIECES = 20_000
+
+CONCATENATE = f"""
+output = ""
+for i in {PIECES} {{
+    output = output + "line " + i + ", "
+}}
+print(output.toUpper().toLower() == output)
+"""
+
+JOIN = f"""
+lines = List().toBuilder()
+for i in {PIECES} {{
+    lines.push("line " + i)
+}}
+output = ", ".join(lines.freeze())
+print(output.toUpper().toLower() == output)
+"""
+
+
+def main():
+    threshold = String.ROPE_THRESHOLD
+    for engine in ("tree", "vm", "closure"):
+        String.ROPE_THRESHOLD = float("inf")
+        try:
+            legacy = time_source(CONCATENATE, repeat=1, engine=engine)
+        finally:
+            String.ROPE_THRESHOLD = threshold
+
+        current = time_source(CONCATENATE, repeat=1, engine=engine)
+        report(f"concatenate {PIECES} pieces (copy), {engine}", legacy)
+        report(f"concatenate {PIECES} pieces (rope), {engine}", current, legacy)
+
+        current = time_source(JOIN, repeat=1, engine=engine)
+        report(f"join {PIECES} pieces, {engine}", current, legacy)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,37 @@
+"""Memory held by the tokens of a generated 50k-line source.
+
+The tokens of both lexers are measured with tracemalloc, counting the
+tokens, their lexemes and the list holding them but not the source.
+
+    python -m benchmarks.bench_tokens
+"""
+
+import tracemalloc
+
+from maxlang.lex import Lexer, RegexLexer
+from .bench_parser import PROGRAM
+
+
+LINES = 50_000
+
+
+def token_memory(lexer_class, source: str) -> tuple[int, int]:
+    tracemalloc.start()
+    tokens = lexer_class(source).scan_tokens()
+    size, _peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return size, len(tokens)
+
+
+def main():
+    source = PROGRAM * (LINES // PROGRAM.count("\n"))
+    for name, lexer_class in (("scan", Lexer), ("regex", RegexLexer)):
+        size, count = token_memory(lexer_class, source)
+        print(
+            f"tokens of {source.count(chr(10))} lines ({name})".ljust(45),
+            f"{size / 1e6:10.1f} MB   {size / count:6.1f} bytes/token",
+        )
+
+
+if __name__ == "__main__":
+    main()
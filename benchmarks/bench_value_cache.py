@@ -0,0 +1,54 @@
+"""Int- and Bool-heavy loops, with and without shared value instances.
+
+The fresh run allocates a new Bool for every comparison and an empty
+small_ints range turns Int interning off.
+
+    python -m benchmarks.bench_value_cache
+"""
+
+from contextlib import contextmanager
+
+from maxlang.native_functions.BaseTypes.Bool import BoolInstance
+from maxlang.parse.interpreter import InterpreterBase
+from .main import time_source, report
+
+
+COUNTING_LOOP = """
+hits = 0
+flag = false
+step = 0
+for i in 3000 {
+    if i == 0 or i < 100 {
+        hits = hits + 1
+    }
+    flag = i > 10 and i != 20
+    step = i * 0 + 1
+}
+print(hits, flag, step)
+"""
+
+
+@contextmanager
+def fresh_bools():
+    make_bool = InterpreterBase.make_bool
+    InterpreterBase.make_bool = lambda self, value: BoolInstance(self).set_value(
+        value
+    )
+    try:
+        yield
+    finally:
+        InterpreterBase.make_bool = make_bool
+
+
+def main():
+    for engine in ("tree", "vm"):
+        with fresh_bools():
+            legacy = time_source(COUNTING_LOOP, engine=engine, small_ints=range(0))
+        current = time_source(COUNTING_LOOP, engine=engine)
+
+        report(f"counting loop, {engine} (fresh values)", legacy)
+        report(f"counting loop, {engine} (shared values)", current, legacy)
+
+
+if __name__ == "__main__":
+    main()
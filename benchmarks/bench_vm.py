@@ -0,0 +1,64 @@
+"""Tree-walking interpreter against the bytecode virtual machine, with the
+closure compiler for reference.
+
+The programs run long enough for the fixed cost of lexing, parsing and
+resolving to be negligible: a loop over globals, one over the locals of a
+function with Float arithmetic and recursive calls.
+
+    python -m benchmarks.bench_vm
+"""
+
+from .main import time_source, report
+
+
+GLOBAL_LOOP = """
+i = 0
+total = 0
+while i < 100000 {
+    total = total + i
+    i = i + 1
+}
+print(total)
+"""
+
+LOCAL_LOOP = """
+sum: n {
+    i = 0
+    total = 0.0
+    while i < n {
+        total = total + 1.5
+        i = i + 1
+    }
+    return total
+}
+print(sum(100000))
+"""
+
+RECURSIVE_FIB = """
+fib: n {
+    if n < 2 {
+        return n
+    }
+    return fib(n - 1) + fib(n - 2)
+}
+print(fib(20))
+"""
+
+
+def main():
+    for name, source in (
+        ("global loop", GLOBAL_LOOP),
+        ("local loop", LOCAL_LOOP),
+        ("recursive fib", RECURSIVE_FIB),
+    ):
+        tree = time_source(source, engine="tree")
+        vm = time_source(source, engine="vm")
+        closure = time_source(source, engine="closure")
+
+        report(f"{name} (tree)", tree)
+        report(f"{name} (vm)", vm, tree)
+        report(f"{name} (closure)", closure, tree)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,25 @@
+from contextlib import redirect_stdout, redirect_stderr
+from time import perf_counter
+import io
+
+from maxlang import Max
+
+
+def time_source(source: str, repeat: int = 3, **options) -> float:
+    """Run a source several times and return the best wall-clock time."""
+    best = float("inf")
+    for _ in range(repeat):
+        out = io.StringIO()
+        with redirect_stdout(out), redirect_stderr(out):
+            start = perf_counter()
+            Max(**options).run_source(source)
+            best = min(best, perf_counter() - start)
+
+    return best
+
+
+def report(name: str, seconds: float, baseline: float | None = None):
+    line = f"{name:<45} {seconds * 1000:10.1f} ms"
+    if baseline is not None:
+        line += f"   x{baseline / seconds:.2f}"
+    print(line)
@@ -0,0 +1,2 @@
+from .compiler import ClosureCompiler  # noqa: F401
+from .interpreter import ClosureInterpreter  # noqa: F401
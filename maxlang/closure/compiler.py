@@ -0,0 +1,408 @@
+from __future__ import annotations
+from typing import TYPE_CHECKING, Any, Callable
+import operator
+
+from maxlang.lex import TokenType
+from maxlang.native_functions.BaseTypes.Bool import BoolInstance
+from maxlang.native_functions.BaseTypes.Int import IntInstance
+from maxlang.native_functions.BaseTypes.Pair import PairInstance
+from maxlang.parse.callable import (
+    FunctionCallable,
+    _NO_RETURN_VALUE,
+    _NULL_RETURN_VALUE,
+)
+from maxlang.parse.environment import Environment, VARIABLE_VALUE_SENTINEL
+from maxlang.parse.expressions import ExpressionVisitor, Expression, Unpack
+from maxlang.parse.interpreter import INT_COMPARISONS
+from maxlang.parse.statements import StatementVisitor, Statement
+
+if TYPE_CHECKING:
+    from .interpreter import ClosureInterpreter
+
+
+# A compiled expression returns its value, a compiled statement returns None
+# or, when a return statement ran, the value being returned, the same way
+# Interpreter.execute does
+Closure = Callable[[Environment], Any]
+
+# Operators between two Ints, the only operands they are inlined for
+INT_ARITHMETIC = {
+    TokenType.PLUS: operator.add,
+    TokenType.MINUS: operator.sub,
+    TokenType.STAR: operator.mul,
+}
+
+
+class ClosureCompiler(ExpressionVisitor, StatementVisitor):
+    """Turns resolved nodes into nested Python closures taking the current
+    Environment.
+
+    Everything that can be decided from the node alone (operator, variable
+    depth and slot, literal value) is decided once, here, so running a
+    closure never dispatches on the node again. Nodes that are rare or tied
+    to the tree-walker's state (classes, super, field updates) are delegated
+    back to it.
+    """
+
+    def __init__(self, interpreter: ClosureInterpreter):
+        self.interpreter = interpreter
+
+    def compile(self, statements: list[Statement]) -> Closure:
+        return self.sequence([statement.accept(self) for statement in statements])
+
+    def compile_expression(self, expression: Expression) -> Closure:
+        return expression.accept(self)
+
+    def sequence(self, runs: list[Closure]) -> Closure:
+        if len(runs) == 1:
+            return runs[0]
+
+        def run(env):
+            for statement in runs:
+                signal = statement(env)
+                if signal is not None:
+                    return signal
+
+        return run
+
+    def condition(self, expression: Expression, keyword) -> Closure:
+        evaluate = self.compile_expression(expression)
+        truthy = self.interpreter.truthy
+
+        def test(env):
+            value = evaluate(env)
+            if type(value) is BoolInstance:
+                return value.value
+            return truthy(value, keyword)
+
+        return test
+
+    def define(self, declaration: Statement | Expression, name) -> Callable:
+        local = declaration.local
+        if local is None:
+            return lambda env, value: env.define(name, value)
+
+        slot = local[1]
+        return lambda env, value: env.define_slot(slot, value)
+
+    # Statements
+
+    def visit_expression_statement(self, statement):
+        evaluate = self.compile_expression(statement.expression)
+
+        def run(env):
+            evaluate(env)
+
+        return run
+
+    def visit_function(self, statement):
+        name = statement.name
+        declaration = statement.function
+        define = self.define(statement, name)
+
+        def run(env):
+            define(env, FunctionCallable(name, declaration, env))
+
+        return run
+
+    def visit_variable_statement(self, statement):
+        define = self.define(statement, statement.name)
+        if statement.initializer is None:
+
+            def run(env):
+                define(env, VARIABLE_VALUE_SENTINEL)
+
+            return run
+
+        evaluate = self.compile_expression(statement.initializer)
+
+        def run(env):
+            define(env, evaluate(env))
+
+        return run
+
+    def visit_block(self, statement):
+        body = self.compile(statement.statements)
+        interpreter = self.interpreter
+
+        def run(env):
+            previous = interpreter.environment
+            interpreter.environment = block = Environment(env)
+            try:
+                return body(block)
+            finally:
+                interpreter.environment = previous
+
+        return run
+
+    def visit_class(self, statement):
+        execute = self.interpreter.execute
+
+        def run(env):
+            execute(statement)
+
+        return run
+
+    def visit_if_statement(self, statement):
+        test = self.condition(statement.condition, statement.keyword)
+        then_branch = statement.then_branch.accept(self)
+        if statement.else_branch is None:
+
+            def run(env):
+                if test(env):
+                    return then_branch(env)
+
+            return run
+
+        else_branch = statement.else_branch.accept(self)
+
+        def run(env):
+            if test(env):
+                return then_branch(env)
+            return else_branch(env)
+
+        return run
+
+    def visit_return_statement(self, statement):
+        if statement.value is None:
+            return lambda env: _NO_RETURN_VALUE
+
+        evaluate = self.compile_expression(statement.value)
+
+        def run(env):
+            value = evaluate(env)
+            return _NULL_RETURN_VALUE if value is None else value
+
+        return run
+
+    def visit_while_statement(self, statement):
+        test = self.condition(statement.condition, statement.keyword)
+        body = statement.body.accept(self)
+
+        def run(env):
+            while test(env):
+                signal = body(env)
+                if signal is not None:
+                    return signal
+
+        return run
+
+    def visit_for_statement(self, statement):
+        in_name = self.compile_expression(statement.in_name)
+        define = self.define(statement.for_name, statement.for_name.name)
+        body = self.compile(statement.body)
+        interpreter = self.interpreter
+        iterate = interpreter.iterate
+
+        def run(env):
+            previous = interpreter.environment
+            interpreter.environment = loop = Environment(env)
+            try:
+                for item in iterate(in_name(loop), statement):
+                    define(loop, item)
+                    signal = body(loop)
+                    if signal is not None:
+                        return signal
+            finally:
+                interpreter.environment = previous
+
+        return run
+
+    # Expressions
+
+    def visit_literal(self, expression):
+        # Literals are immutable, a single instance serves every evaluation
+        value = self.interpreter.visit_literal(expression)
+        return lambda env: value
+
+    def visit_grouping(self, expression):
+        return self.compile_expression(expression.expression)
+
+    def visit_variable(self, expression):
+        return self.load_variable(expression.name, expression)
+
+    def visit_self(self, expression):
+        return self.load_variable(expression.keyword, expression)
+
+    def load_variable(self, name, expression: Expression) -> Closure:
+        local = expression.local
+        if local is None:
+            globals = self.interpreter.globals
+            values = globals.values
+            lexeme = name.lexeme
+
+            def load_global(env):
+                try:
+                    return values[lexeme]
+                except KeyError:
+                    return globals.get(name)
+
+            return load_global
+
+        distance, slot = local
+        if distance == 0:
+            return lambda env: env.slots[slot]
+        if distance == 1:
+            return lambda env: env.enclosing.slots[slot]
+        return lambda env: env.get_at(distance, slot)
+
+    def visit_assignment(self, expression):
+        evaluate = self.compile_expression(expression.value)
+
+        local = expression.local
+        if local is None:
+            assign = self.interpreter.globals.assign
+            name = expression.name.name
+
+            def store_global(env):
+                value = evaluate(env)
+                assign(name, value)
+                return value
+
+            return store_global
+
+        distance, slot = local
+
+        def store_local(env):
+            value = evaluate(env)
+            env.assign_at(distance, slot, value)
+            return value
+
+        return store_local
+
+    def visit_binary(self, expression):
+        left = self.compile_expression(expression.left)
+        right = self.compile_expression(expression.right)
+        interpreter = self.interpreter
+        binary_values = interpreter.binary_values
+
+        arithmetic = INT_ARITHMETIC.get(expression.operator.type_)
+        if arithmetic is not None:
+            make_int = interpreter.make_int
+
+            def int_arithmetic(env):
+                a = left(env)
+                b = right(env)
+                if type(a) is IntInstance and type(b) is IntInstance:
+                    return make_int(arithmetic(a.value, b.value))
+                return binary_values(expression, a, b)
+
+            return int_arithmetic
+
+        comparison = INT_COMPARISONS.get(expression.operator.type_)
+        if comparison is not None:
+            true = interpreter.true
+            false = interpreter.false
+
+            def int_comparison(env):
+                a = left(env)
+                b = right(env)
+                if type(a) is IntInstance and type(b) is IntInstance:
+                    return true if comparison(a.value, b.value) else false
+                return binary_values(expression, a, b)
+
+            return int_comparison
+
+        return lambda env: binary_values(expression, left(env), right(env))
+
+    def visit_interpolation(self, expression):
+        parts = [self.compile_expression(part) for part in expression.parts]
+        interpolate_values = self.interpreter.interpolate_values
+        return lambda env: interpolate_values(
+            expression, [part(env) for part in parts]
+        )
+
+    def visit_unary(self, expression):
+        right = self.compile_expression(expression.right)
+        unary_values = self.interpreter.unary_values
+        return lambda env: unary_values(expression, right(env))
+
+    def visit_logical(self, expression):
+        left = self.compile_expression(expression.left)
+        right = self.compile_expression(expression.right)
+        keyword = expression.operator
+        truthy = self.interpreter.truthy
+        is_or = expression.operator.type_ == TokenType.OR
+
+        def logical(env):
+            value = left(env)
+            if type(value) is BoolInstance:
+                is_true = value.value
+            else:
+                is_true = truthy(value, keyword)
+
+            if is_true is is_or:
+                return value
+            return right(env)
+
+        return logical
+
+    def visit_if_expression(self, expression):
+        test = self.condition(expression.condition, expression.keyword)
+        then_branch = self.compile_expression(expression.then_branch)
+        else_branch = self.compile_expression(expression.else_branch)
+        return lambda env: then_branch(env) if test(env) else else_branch(env)
+
+    def visit_call(self, expression):
+        callee = self.compile_expression(expression.callee)
+        positional = []
+        for argument in expression.arguments:
+            if argument.name is not None:
+                break
+            positional.append(self.compile_expression(argument.value))
+
+        interpreter = self.interpreter
+        call = interpreter.call_value
+        finish_arguments = interpreter.finish_arguments
+        flatten_unpacked = interpreter.flatten_unpacked
+        has_unpack = any(
+            isinstance(argument.value, Unpack)
+            for argument in expression.arguments[: len(positional)]
+        )
+        token = expression.paren
+        arguments = expression.arguments
+
+        def run(env):
+            function = callee(env)
+            values = [argument(env) for argument in positional]
+            if has_unpack:
+                values = flatten_unpacked(values)
+            return call(token, function, finish_arguments(function, values, arguments))
+
+        return run
+
+    def visit_unpack(self, expression):
+        evaluate = self.compile_expression(expression.expression)
+        unpack_values = self.interpreter.unpack_values
+        return lambda env: unpack_values(expression, evaluate(env))
+
+    def visit_get(self, expression):
+        obj = self.compile_expression(expression.obj)
+        get_property = self.interpreter.get_property
+        return lambda env: get_property(expression, obj(env))
+
+    def visit_set(self, expression):
+        obj = self.compile_expression(expression.obj)
+        value = self.compile_expression(expression.value)
+        set_property = self.interpreter.set_property
+        return lambda env: set_property(expression, obj(env), value(env))
+
+    def visit_pair(self, expression):
+        left = self.compile_expression(expression.left)
+        right = self.compile_expression(expression.right)
+        interpreter = self.interpreter
+        return lambda env: PairInstance(interpreter).set_values(left(env), right(env))
+
+    def visit_lambda(self, expression):
+        return lambda env: FunctionCallable(None, expression, env)
+
+    def visit_super(self, expression):
+        evaluate = self.interpreter.evaluate
+        return lambda env: evaluate(expression)
+
+    def visit_field_update(self, expression):
+        evaluate = self.interpreter.evaluate
+        return lambda env: evaluate(expression)
+
+    def visit_argument(self, expression):
+        return self.compile_expression(expression.value)
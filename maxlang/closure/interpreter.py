@@ -0,0 +1,88 @@
+from typing import Any, Callable
+
+from maxlang.errors import InterpreterError, InternalError
+from maxlang.parse.callable import (
+    FunctionCallable,
+    _NO_RETURN_VALUE,
+    _NULL_RETURN_VALUE,
+)
+from maxlang.parse.environment import Environment
+from maxlang.parse.interpreter import Interpreter, SMALL_INTS
+from maxlang.parse.statements import Statement
+from maxlang.lex import Token
+from .compiler import ClosureCompiler, Closure
+
+
+class ClosureInterpreter(Interpreter):
+    """Engine running the closures produced by the ClosureCompiler.
+
+    A list of statements is compiled the first time it runs and cached for
+    the lifetime of the interpreter, function bodies included. Calls to user
+    functions run their compiled body directly and get the returned value
+    back from it; every other callable goes through the regular
+    Interpreter.call.
+    """
+
+    def __init__(
+        self,
+        interpreter_error: Callable[[InterpreterError], None],
+        small_ints: range = SMALL_INTS,
+    ):
+        super().__init__(interpreter_error, small_ints)
+        self.compiler = ClosureCompiler(self)
+        self.closures: dict[int, tuple[list[Statement], Closure]] = {}
+
+    def interpret(self, statements: list[Statement]):
+        try:
+            # Run once, the script is not worth caching
+            self.compiler.compile(statements)(self.environment)
+        except InterpreterError as e:
+            self.interpreter_error(e)
+
+    def compile(self, statements: list[Statement]) -> Closure:
+        # The statement list is kept alongside its closure so its id stays unique
+        cached = self.closures.get(id(statements))
+        if cached is None:
+            cached = (statements, self.compiler.compile(statements))
+            self.closures[id(statements)] = cached
+
+        return cached[1]
+
+    def execute_block(self, statements: list[Statement], environment: Environment):
+        previous = self.environment
+        self.environment = environment
+        try:
+            return self.compile(statements)(environment)
+        finally:
+            self.environment = previous
+
+    def call_value(self, token: Token, function: Any, arguments: list[Any]):
+        if type(function) is not FunctionCallable:
+            return self.call(token, function, arguments)
+
+        if not function.check_arity(len(arguments)):
+            raise InterpreterError(
+                token,
+                f"Expected between {function.lower_arity()} and {function.upper_arity()} arguments but got {len(arguments)}.",
+            )
+
+        environment = Environment(function.closure)
+        environment.slots = arguments
+
+        previous = self.environment
+        previous_call = self.current_call
+        self.environment = environment
+        self.current_call = function
+        try:
+            signal = self.compile(function.declaration.body)(environment)
+        except InternalError as e:
+            raise InterpreterError(token, str(e))
+        finally:
+            self.environment = previous
+            self.current_call = previous_call
+
+        if signal is None or signal is _NO_RETURN_VALUE:
+            return function.return_self()
+        if signal is _NULL_RETURN_VALUE:
+            return None
+        return signal
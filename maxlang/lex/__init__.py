@@ -1,2 +1,4 @@
-from .lexer import Lexer, Token
+from .lexer import Lexer, Token, internal_token
+from .regex_lexer import RegexLexer
+from .streaming_lexer import StreamingLexer
 from .token_type import TokenType
@@ -1,11 +1,17 @@
 from __future__ import annotations
 from dataclasses import dataclass
+from sys import intern
 
 from .token_type import TokenType
 
 
-@dataclass
+@dataclass(slots=True)
 class Token:
+    """A token of the source, or a name used by the implementation itself
+    with line -1. Tokens are never modified once created, which lets them be
+    shared, see internal_token. Identifier and keyword lexemes are interned.
+    """
+
     type_: TokenType
     lexeme: str
     literal: object
@@ -21,6 +27,17 @@ class Token:
         return self.lexeme == other.lexeme and self.type_ == other.type_
 
 
+# Shared tokens of the names used by the implementation, by lexeme
+INTERNAL_TOKENS: dict[str, Token] = {}
+
+
+def internal_token(lexeme: str) -> Token:
+    token = INTERNAL_TOKENS.get(lexeme)
+    if token is None:
+        token = INTERNAL_TOKENS[lexeme] = Token(TokenType.IDENTIFIER, lexeme, None, -1)
+    return token
+
+
 @dataclass
 class Error:
     line: int
@@ -47,6 +64,12 @@ KEYWORDS = {
 }
 
 
+def unescape(text: str) -> str:
+    """The value of the text of a string literal, in which a backslash keeps
+    `${` from starting an interpolation."""
+    return text.replace("\\${", "${")
+
+
 class Lexer:
     def __init__(self, source: str):
         self.source = source
@@ -127,15 +150,7 @@ class Lexer:
                     while self.peek() != "\n" and not self.is_at_end():
                         self.advance()
                 elif self.match("*"):
-                    while (
-                        not (self.peek() == "*" and self.peek_next() == "-")
-                        and not self.is_at_end()
-                    ):
-                        if self.peek() == "\n":
-                            self.line += 1
-                        self.advance()
-                    self.advance()
-                    self.advance()
+                    self.block_comment()
                 elif self.match(">"):
                     self.add_token(TokenType.RIGHT_ARROW)
                 else:
@@ -165,6 +180,17 @@ class Lexer:
                 else:
                     self.errors.append(Error(self.line, f"Unexpected character '{c}'."))
 
+    def block_comment(self):
+        while (
+            not (self.peek() == "*" and self.peek_next() == "-")
+            and not self.is_at_end()
+        ):
+            if self.peek() == "\n":
+                self.line += 1
+            self.advance()
+        self.advance()
+        self.advance()
+
     def string(self, delimiter: str):
         while self.peek() != delimiter and not self.is_at_end():
             if self.peek() == "\n":
@@ -178,19 +204,19 @@ class Lexer:
 
         self.advance()
 
-        value = self.source[self.start + 1 : self.current - 1]
-        self.add_token(TokenType.STRING, value)
+        value = self.text(self.start + 1, self.current - 1)
+        self.add_token(TokenType.STRING, unescape(value))
 
     def string_interpolation(self, delimiter: str):
         if not (self.peek() == "$" and self.peek_next() == "{"):
             return
 
+        # Escaped, the backslash is dropped from the value of the string
         if self.previous() == "\\":
-            self.source = self.source[: self.current - 1] + self.source[self.current :]
             return
 
-        value = self.source[self.start + 1 : self.current]
-        self.add_token(TokenType.STRING, value)
+        value = self.text(self.start + 1, self.current)
+        self.add_token(TokenType.STRING, unescape(value))
         self.start = self.current
         self.advance()
         self.advance()
@@ -230,12 +256,12 @@ class Lexer:
         while self.peek().isalnum() or self.peek() in "_":
             self.advance()
 
-        value = self.source[self.start : self.current]
+        value = intern(self.source[self.start : self.current])
         token_type = KEYWORDS.get(value)
         if token_type is None:
             token_type = TokenType.IDENTIFIER
 
-        self.add_token(token_type)
+        self.tokens.append(Token(token_type, value, None, self.line))
 
     def match(self, expected: str) -> bool:
         if self.is_at_end():
@@ -264,8 +290,12 @@ class Lexer:
             return "\0"
         return self.source[self.current + 1]
 
+    def text(self, start: int, end: int) -> str:
+        """The source between two positions, for tokens that may span lines."""
+        return self.source[start:end]
+
     def add_token(self, token_type: TokenType, literal: object | None = None):
-        lexeme = self.source[self.start : self.current]
+        lexeme = self.text(self.start, self.current)
         self.tokens.append(Token(token_type, lexeme, literal, self.line))
 
     def is_at_end(self) -> bool:
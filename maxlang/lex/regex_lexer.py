@@ -0,0 +1,206 @@
+from __future__ import annotations
+import re
+from sys import intern
+
+from .lexer import KEYWORDS, Error, Lexer, Token, unescape
+from .token_type import TokenType
+
+
+OPERATORS = {
+    "(": TokenType.LEFT_PAREN,
+    ")": TokenType.RIGHT_PAREN,
+    "{": TokenType.LEFT_BRACE,
+    "}": TokenType.RIGHT_BRACE,
+    "[": TokenType.LEFT_BRACKET,
+    "]": TokenType.RIGHT_BRACKET,
+    ",": TokenType.COMMA,
+    ".": TokenType.DOT,
+    ":": TokenType.COLON,
+    ";": TokenType.SEMICOLON,
+    "+": TokenType.PLUS,
+    "+=": TokenType.PLUS_EQUALS,
+    "-": TokenType.MINUS,
+    "-=": TokenType.MINUS_EQUALS,
+    "->": TokenType.RIGHT_ARROW,
+    "*": TokenType.STAR,
+    "*=": TokenType.STAR_EQUALS,
+    "/": TokenType.SLASH,
+    "/=": TokenType.SLASH_EQUALS,
+    "//": TokenType.DOUBLE_SLASH,
+    "!": TokenType.BANG,
+    "!=": TokenType.BANG_EQUAL,
+    "=": TokenType.EQUAL,
+    "==": TokenType.EQUAL_EQUAL,
+    "<": TokenType.LESS,
+    "<=": TokenType.LESS_EQUAL,
+    ">": TokenType.GREATER,
+    ">=": TokenType.GREATER_EQUAL,
+}
+
+# One alternative per kind of token, tried in order after skipping the
+# whitespace in front of it. Comments come before the operators sharing their
+# first character, two character operators before one character ones.
+TOKEN = re.compile(
+    r"""
+    [ \t\r]*
+    (?:
+        (?P<identifier>[A-Za-z]\w*)
+        | (?P<operator>->|[-+*/]=|//|[!=<>]=?|[+/(){}\[\],.:;]|-(?![-*])|\*(?!-))
+        | (?P<newline>\n)
+        | (?P<number>[0-9]\d*(?:\.\d+)?)
+        | (?P<string>["'`])
+        | (?P<comment>--[^\n]*)
+        | (?P<block_comment>-\*(?s:.*?)\*-)
+        | (?P<open_block_comment>-\*(?s:.*))
+        | (?P<comment_end>\*-)
+        | (?P<end>$)
+    )
+    """,
+    re.VERBOSE,
+)
+
+# What ends a stretch of plain characters in a string of each delimiter
+STRING_STOPS = {
+    delimiter: re.compile(re.escape(delimiter) + r"|\n|\$\{")
+    for delimiter in ('"', "'", "`")
+}
+
+
+class RegexLexer(Lexer):
+    """Lexer matching whole tokens with one compiled regular expression.
+
+    It produces the same tokens and errors as Lexer, which scans the source
+    one character at a time. Strings jump from one delimiter, newline or
+    interpolation to the next instead of visiting every character.
+    Characters none of the alternatives of TOKEN start with, like non-ASCII
+    letters and digits, are left to Lexer.scan_token.
+    """
+
+    def scan_tokens(self) -> list[Token]:
+        self.scan()
+        self.tokens.append(Token(TokenType.EOF, "", None, self.line))
+        return self.tokens
+
+    def scan(self, interpolation: bool = False):
+        """Add the tokens up to the end of the source or, when scanning an
+        interpolation, up to its closing brace."""
+        append = self.tokens.append
+        match_token = TOKEN.match
+        source = self.source
+        position = self.current
+        line = self.line
+
+        while True:
+            match = match_token(source, position)
+            kind = None if match is None else match.lastgroup
+
+            # The most common tokens are added without leaving the loop
+            if kind == "identifier":
+                text = intern(match[kind])
+                token_type = KEYWORDS.get(text, TokenType.IDENTIFIER)
+                append(Token(token_type, text, None, line))
+                position = match.end()
+            elif kind == "operator":
+                text = match[kind]
+                if interpolation and text == "}":
+                    self.current = match.start(kind)
+                    self.line = line
+                    return
+                append(Token(OPERATORS[text], text, None, line))
+                position = match.end()
+            elif kind == "newline":
+                append(Token(TokenType.NEWLINE, "\n", None, line))
+                line += 1
+                position = match.end()
+            elif kind == "number":
+                text = match[kind]
+                if "." in text:
+                    append(Token(TokenType.FLOAT, text, float(text), line))
+                else:
+                    append(Token(TokenType.INT, text, int(text), line))
+                position = match.end()
+            elif kind == "end" and (match.start(kind) > position or not interpolation):
+                # Trailing whitespace
+                position = match.end()
+                if not interpolation:
+                    self.current = position
+                    self.line = line
+                    return
+            else:
+                self.start = position if match is None else match.start(kind)
+                self.current = self.start if match is None else match.end()
+                self.line = line
+                self.scan_other(kind, match)
+                position = self.current
+                line = self.line
+
+            if interpolation and position >= len(source):
+                self.current = position
+                self.line = line
+                self.errors.append(
+                    Error(line, "Unterminated string interpolation.")
+                )
+                return
+
+    def scan_other(self, kind: str | None, match: re.Match | None):
+        if kind == "string":
+            self.string(match[kind])
+        elif kind == "comment":
+            pass
+        elif kind == "block_comment":
+            self.line += match[kind].count("\n")
+        elif kind == "open_block_comment":
+            self.line += match[kind].count("\n")
+            # Lexer steps over the missing end of comment regardless
+            self.current += 2
+        elif kind == "comment_end":
+            self.errors.append(
+                Error(self.line, "Comment ending without a comment start.")
+            )
+        else:
+            # Whitespace before a character TOKEN does not know is skipped
+            # one character at a time, as is the end of the source inside
+            # an interpolation
+            self.scan_token()
+
+    def string(self, delimiter: str):
+        source = self.source
+        find_stop = STRING_STOPS[delimiter].search
+
+        while True:
+            stop = find_stop(source, self.current)
+            if stop is None:
+                self.current = max(self.current, len(source))
+                break
+
+            text = stop.group()
+            if text == "\n":
+                self.line += 1
+                self.current = stop.end()
+            elif text == delimiter:
+                self.current = stop.end()
+                value = source[self.start + 1 : self.current - 1]
+                self.add_token(TokenType.STRING, unescape(value))
+                return
+            elif source[stop.start() - 1] == "\\":
+                # Escaped, the backslash is dropped from the value of the string
+                self.current = stop.end()
+            else:
+                self.current = stop.start()
+                value = source[self.start + 1 : self.current]
+                self.add_token(TokenType.STRING, unescape(value))
+                self.start = self.current
+                self.current += 2
+                self.add_token(TokenType.INTERPOLATION)
+
+                self.scan(interpolation=True)
+
+                self.start = self.current
+                self.add_token(TokenType.INTERPOLATION)
+                # The rest of the string starts at the closing brace
+                self.current += 1
+
+        self.errors.append(Error(self.line, "Unterminated string."))
+        self.current += 1
+        value = source[self.start + 1 : self.current - 1]
+        self.add_token(TokenType.STRING, unescape(value))
@@ -0,0 +1,74 @@
+from __future__ import annotations
+from typing import Iterator, TextIO
+
+from .lexer import Lexer, Token
+from .token_type import TokenType
+
+
+class StreamingLexer(Lexer):
+    """Lexer reading its source line by line from a file object and yielding
+    its tokens as they are scanned.
+
+    The source only holds the last line read and the character before it.
+    A token spanning lines, like a string, keeps its earlier lines in
+    `pending` and starts at a negative position, they are joined once when
+    its text is needed. Comments produce no token, their lines are dropped.
+    Lexer reads past the end of a line through peek, peek_next and
+    is_at_end, which read the next line from the file before giving up on
+    the source.
+    """
+
+    def __init__(self, file: TextIO):
+        super().__init__("")
+        self.lines = iter(file)
+        self.pending: list[str] = []
+        self.in_comment = False
+
+    def stream_tokens(self) -> Iterator[Token]:
+        while not self.is_at_end():
+            self.start = self.current
+            self.scan_token()
+            yield from self.tokens
+            self.tokens.clear()
+
+        yield Token(TokenType.EOF, "", None, self.line)
+
+    def read_line(self) -> bool:
+        """Replace the source with the next line of the file, moving the part
+        of the token being scanned to pending. False at the end of the file."""
+        line = next(self.lines, "")
+        if not line:
+            return False
+
+        # The last character stays in the source for previous()
+        kept = max(len(self.source) - 1, 0)
+        if self.start >= 0:
+            # The token starts in the source, pending holds an earlier one
+            self.pending.clear()
+        if not self.in_comment:
+            self.pending.append(self.source[max(self.start, 0) : kept])
+
+        self.source = self.source[kept:] + line
+        self.start -= kept
+        self.current -= kept
+        return True
+
+    def text(self, start: int, end: int) -> str:
+        if start >= 0:
+            return self.source[start:end]
+
+        pending = "".join(self.pending)
+        return pending[len(pending) + start :] + self.source[:end]
+
+    def block_comment(self):
+        self.in_comment = True
+        super().block_comment()
+        self.in_comment = False
+
+    def is_at_end(self) -> bool:
+        return self.current >= len(self.source) and not self.read_line()
+
+    def peek_next(self) -> str:
+        while self.current + 1 >= len(self.source) and self.read_line():
+            pass
+        return super().peek_next()
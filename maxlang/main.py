@@ -1,26 +1,71 @@
+import io
 import sys
-
-from .lex import Lexer, Token, TokenType
-from .parse import Parser, AstPrinter, Interpreter, Resolver, TypeChecker
+from typing import TextIO
+
+from .lex import Lexer, RegexLexer, StreamingLexer, Token, TokenType
+from .parse import (
+    Parser,
+    StreamingParser,
+    AstPrinter,
+    Interpreter,
+    Resolver,
+    TypeChecker,
+)
+from .parse.interpreter import SMALL_INTS
 from .errors import InterpreterError
+from .vm import VirtualMachine
+from .closure import ClosureInterpreter
+
+
+ENGINES = {"tree": Interpreter, "vm": VirtualMachine, "closure": ClosureInterpreter}
+LEXERS = {"scan": Lexer, "regex": RegexLexer}
 
 
 class Max:
     had_error: bool
 
-    def __init__(self, show_ast=False):
+    def __init__(
+        self,
+        show_ast=False,
+        engine="tree",
+        small_ints=SMALL_INTS,
+        lexer="scan",
+        stream=False,
+    ):
+        if engine not in ENGINES:
+            raise ValueError(
+                f"Unknown engine '{engine}', expected one of {', '.join(ENGINES)}."
+            )
+        if lexer not in LEXERS:
+            raise ValueError(
+                f"Unknown lexer '{lexer}', expected one of {', '.join(LEXERS)}."
+            )
+        if stream and lexer != "scan":
+            # StreamingLexer scans like Lexer, the other lexers need the
+            # whole source
+            raise ValueError(f"Cannot stream with the {lexer} lexer.")
+
         self.show_ast = show_ast
+        self.engine = engine
+        self.lexer = lexer
+        self.stream = stream
+        self.small_ints = small_ints
         self.had_error = False
         self.had_runtime_error = False
 
     def run_source(self, source: str):
-        self.run(source)
+        if self.stream:
+            self.run_stream(io.StringIO(source))
+        else:
+            self.run(source)
 
     def run_file(self, script: str):
         with open(script) as file:
-            source = file.read()
+            if self.stream:
+                self.run_stream(file)
+            else:
+                self.run(file.read())
 
-        self.run(source)
         if self.had_error:
             sys.exit(65)
         if self.had_runtime_error:
@@ -38,7 +83,7 @@ class Max:
                 break
 
     def run(self, source: str):
-        lexer = Lexer(source)
+        lexer = LEXERS[self.lexer](source)
         tokens = lexer.scan_tokens()
         parser = Parser(tokens, self.parser_error)
         statements = parser.parse()
@@ -49,7 +94,7 @@ class Max:
         if self.had_error:
             return
 
-        interpreter = Interpreter(self.interpreter_error)
+        interpreter = ENGINES[self.engine](self.interpreter_error, self.small_ints)
         resolver = Resolver(interpreter, self.parser_error)
         resolver.resolve_many(statements)
 
@@ -70,6 +115,44 @@ class Max:
         if self.had_runtime_error:
             return
 
+    def run_stream(self, file: TextIO):
+        """Run the script read from file one top-level statement at a time.
+
+        Each statement is resolved, type-checked and executed as soon as it
+        is parsed, before the rest of the file is read, so neither the
+        source nor its tokens are ever held whole. The first error stops
+        execution, statements after it are still parsed to report their
+        syntax errors, but the statements before it have already run.
+        """
+        lexer = StreamingLexer(file)
+        parser = StreamingParser(lexer.stream_tokens(), self.parser_error)
+        interpreter = ENGINES[self.engine](self.interpreter_error, self.small_ints)
+        resolver = Resolver(interpreter, self.parser_error)
+        type_checker = TypeChecker(interpreter, self.parser_error)
+
+        for statement in parser.statements():
+            for error in lexer.errors:
+                self.error(error.line, error.message)
+            lexer.errors.clear()
+
+            if self.had_error or self.had_runtime_error:
+                continue
+
+            resolver.resolve(statement)
+            if self.had_error:
+                continue
+
+            type_checker.launch([statement])
+            if self.show_ast:
+                AstPrinter().print([statement])
+            if self.had_error:
+                continue
+
+            interpreter.interpret([statement])
+
+        for error in lexer.errors:
+            self.error(error.line, error.message)
+
     def error(self, line: int, message: str):
         self.report(line, "", message)
 
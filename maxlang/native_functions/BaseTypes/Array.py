@@ -0,0 +1,412 @@
+from __future__ import annotations
+from abc import ABC, abstractmethod
+from array import array
+from itertools import repeat
+from operator import add, mul, sub, truediv
+from typing import Iterable
+
+from ..main import (
+    BaseInternalClass,
+    BaseInternalInstance,
+    BaseInternalMethod,
+    is_instance,
+    make_internal_token,
+)
+from maxlang.errors import InternalError
+from maxlang.parse.expressions import Parameter
+from .List import to_index
+
+
+class ArrayInit(BaseInternalMethod):
+    name = make_internal_token("init")
+
+    @property
+    def parameters(self):
+        return [Parameter(make_internal_token("items"), is_varargs=True)]
+
+    def call(self, interpreter, arguments):
+        self.instance.set_values(map(self.instance.unbox, arguments[0].values))
+
+
+class ArrayGet(BaseInternalMethod):
+    name = make_internal_token("get")
+
+    @property
+    def parameters(self):
+        return [Parameter(make_internal_token("index"))]
+
+    @property
+    def allowed_types(self):
+        from .Int import IntClass
+
+        return [IntClass.name]
+
+    @property
+    def return_token(self):
+        return self.instance.element_class.name
+
+    def call(self, interpreter, arguments):
+        try:
+            return self.instance.box(self.instance.view[to_index(arguments[0])])
+        except IndexError:
+            raise InternalError(f"{arguments[0]} is not a valid index.")
+
+
+class ArraySet(BaseInternalMethod):
+    name = make_internal_token("set")
+
+    @property
+    def parameters(self):
+        return [
+            Parameter(make_internal_token("index")),
+            Parameter(make_internal_token("value")),
+        ]
+
+    @property
+    def allowed_types(self):
+        from .Int import IntClass
+
+        return [IntClass.name]
+
+    def call(self, interpreter, arguments):
+        index = to_index(arguments[0])
+        view = self.instance.view
+        if not 0 <= index < len(view):
+            raise InternalError(f"Index {index} out of range")
+
+        values = array(view.format, view)
+        values[index] = self.instance.unbox(arguments[1])
+        return self.instance.with_view(memoryview(values).toreadonly())
+
+
+class ArrayLength(BaseInternalMethod):
+    name = make_internal_token("length")
+
+    @property
+    def return_token(self):
+        from .Int import IntClass
+
+        return IntClass.name
+
+    def call(self, interpreter, arguments):
+        return interpreter.make_int(len(self.instance.view))
+
+
+class ArraySlice(BaseInternalMethod):
+    name = make_internal_token("slice")
+
+    @property
+    def parameters(self):
+        return [
+            Parameter(make_internal_token("start")),
+            Parameter(make_internal_token("end")),
+        ]
+
+    @property
+    def allowed_types(self):
+        from .Int import IntClass
+
+        return [IntClass.name]
+
+    def call(self, interpreter, arguments):
+        # A view over the same storage, bounds behave as for Python slices
+        view = self.instance.view
+        return self.instance.with_view(
+            view[to_index(arguments[0]) : to_index(arguments[1])]
+        )
+
+
+class ArraySum(BaseInternalMethod):
+    name = make_internal_token("sum")
+
+    @property
+    def return_token(self):
+        return self.instance.element_class.name
+
+    def call(self, interpreter, arguments):
+        return self.instance.box(sum(self.instance.view))
+
+
+class ArrayMin(BaseInternalMethod):
+    name = make_internal_token("min")
+    reduce = staticmethod(min)
+
+    @property
+    def return_token(self):
+        return self.instance.element_class.name
+
+    def call(self, interpreter, arguments):
+        if not self.instance.view:
+            raise InternalError(
+                f"Cannot take the {self.name.lexeme} of an empty {self.instance.class_name}."
+            )
+        return self.instance.box(self.reduce(self.instance.view))
+
+
+class ArrayMax(ArrayMin):
+    name = make_internal_token("max")
+    reduce = staticmethod(max)
+
+
+class ArrayMean(BaseInternalMethod):
+    name = make_internal_token("mean")
+
+    @property
+    def return_token(self):
+        from .Float import FloatClass
+
+        return FloatClass.name
+
+    def call(self, interpreter, arguments):
+        from .Float import FloatInstance
+
+        view = self.instance.view
+        if not view:
+            raise InternalError(
+                f"Cannot take the {self.name.lexeme} of an empty {self.instance.class_name}."
+            )
+        return FloatInstance(interpreter).set_value(sum(view) / len(view))
+
+
+class ArrayAdd(BaseInternalMethod):
+    """Elementwise operation with an array of the same length, or with a
+    number applied to every element."""
+
+    name = make_internal_token("add")
+    operation = staticmethod(add)
+
+    @property
+    def parameters(self):
+        return [Parameter(make_internal_token("other"))]
+
+    @property
+    def allowed_types(self):
+        return self.instance.operand_types
+
+    def result_class(self) -> type[BaseArrayInstance]:
+        return type(self.instance)
+
+    def call(self, interpreter, arguments):
+        instance = self.instance
+        other = arguments[0]
+        if not is_instance(interpreter, other, *instance.operand_types):
+            raise InternalError(
+                f"Cannot {self.name.lexeme} {instance.class_name} and {other.class_name}"
+            )
+
+        if isinstance(other, BaseArrayInstance):
+            if len(other.view) != len(instance.view):
+                raise InternalError(
+                    f"Cannot {self.name.lexeme} arrays of lengths {len(instance.view)} and {len(other.view)}."
+                )
+            operands = other.view
+        else:
+            operands = repeat(other.value)
+
+        try:
+            return self.result_class()(interpreter).set_values(
+                map(self.operation, instance.view, operands)
+            )
+        except ZeroDivisionError:
+            raise InternalError("Attempted division by zero.")
+
+
+class ArraySubstract(ArrayAdd):
+    name = make_internal_token("substract")
+    operation = staticmethod(sub)
+
+
+class ArrayMultiply(ArrayAdd):
+    name = make_internal_token("multiply")
+    operation = staticmethod(mul)
+
+
+class ArrayDivide(ArrayAdd):
+    name = make_internal_token("divide")
+    operation = staticmethod(truediv)
+
+    @property
+    def return_token(self):
+        return self.result_class().CLASS.name
+
+    def result_class(self) -> type[BaseArrayInstance]:
+        from .FloatArray import FloatArrayInstance
+
+        return FloatArrayInstance
+
+
+class ArrayEquals(BaseInternalMethod):
+    name = make_internal_token("equals")
+
+    @property
+    def parameters(self):
+        return [Parameter(make_internal_token("other"))]
+
+    @property
+    def allowed_types(self):
+        return [self.instance.CLASS.name]
+
+    @property
+    def return_token(self):
+        from .Bool import BoolClass
+
+        return BoolClass.name
+
+    def call(self, interpreter, arguments):
+        if isinstance(arguments[0], BaseArrayInstance):
+            return interpreter.make_bool(self.instance == arguments[0])
+
+        raise InternalError(
+            f"Cannot compare {self.instance.class_name} and {arguments[0].class_name}"
+        )
+
+
+class ArrayIterate(BaseInternalMethod):
+    name = make_internal_token("iterate")
+
+    @property
+    def return_token(self):
+        return self.instance.iterator_class.CLASS.name
+
+    def call(self, interpreter, arguments):
+        return self.instance.iterator_class(interpreter).set_value(self.instance)
+
+
+class ArrayToBool(BaseInternalMethod):
+    name = make_internal_token("toBool")
+
+    @property
+    def return_token(self):
+        from .Bool import BoolClass
+
+        return BoolClass.name
+
+    def call(self, interpreter, arguments):
+        return interpreter.make_bool(len(self.instance.view) > 0)
+
+
+class ArrayToList(BaseInternalMethod):
+    name = make_internal_token("toList")
+
+    @property
+    def return_token(self):
+        from .List import ListClass
+
+        return ListClass.name
+
+    def call(self, interpreter, arguments):
+        from .List import ListInstance
+
+        return ListInstance(interpreter).set_values(
+            *map(self.instance.box, self.instance.view)
+        )
+
+
+class ArrayToString(BaseInternalMethod):
+    name = make_internal_token("toString")
+
+    @property
+    def return_token(self):
+        from .String import StringClass
+
+        return StringClass.name
+
+    def call(self, interpreter, arguments):
+        from .String import StringInstance
+
+        stringified = ", ".join(map(str, self.instance.view))
+        return StringInstance(interpreter).set_value(
+            f"{self.instance.klass.name.lexeme}({stringified})"
+        )
+
+
+class BaseArrayClass(BaseInternalClass):
+    FIELDS = (
+        ArrayInit,
+        ArrayGet,
+        ArraySet,
+        ArrayLength,
+        ArraySlice,
+        ArraySum,
+        ArrayMin,
+        ArrayMax,
+        ArrayMean,
+        ArrayAdd,
+        ArraySubstract,
+        ArrayMultiply,
+        ArrayDivide,
+        ArrayEquals,
+        ArrayIterate,
+        ArrayToBool,
+        ArrayToList,
+        ArrayToString,
+    )
+
+    def upper_arity(self):
+        return float("inf")
+
+
+class BaseArrayInstance(BaseInternalInstance, ABC):
+    """A fixed sequence of numbers stored unboxed in an array.array.
+
+    Arrays are immutable: `view` is a read-only memoryview of the storage,
+    so slices are views sharing it, and every update builds a new array.
+    Elements are only boxed into Int or Float instances when read.
+    """
+
+    TYPECODE: str
+    frozen = True
+
+    def __init__(self, interpreter):
+        super().__init__(interpreter)
+        self.view = memoryview(array(self.TYPECODE)).toreadonly()
+        self.cached_hash = None
+
+    def set_values(self, values: Iterable):
+        try:
+            self.view = memoryview(array(self.TYPECODE, values)).toreadonly()
+        except OverflowError:
+            raise InternalError(f"Value out of range for {self.class_name}.")
+        self.cached_hash = None
+        return self
+
+    def with_view(self, view: memoryview):
+        """A new array of the same class and interpreter over `view`."""
+        new_array = type(self)(self.interpreter)
+        new_array.view = view
+        return new_array
+
+    @property
+    @abstractmethod
+    def element_class(self) -> type[BaseInternalClass]: ...
+
+    @property
+    @abstractmethod
+    def operand_types(self) -> list:
+        """Arrays and numbers this array can be combined with elementwise."""
+
+    @property
+    @abstractmethod
+    def iterator_class(self) -> type[BaseInternalInstance]: ...
+
+    @abstractmethod
+    def box(self, value): ...
+
+    @abstractmethod
+    def unbox(self, value): ...
+
+    def __str__(self) -> str:
+        return self.internal_find_method("toString").call(self.interpreter, [])
+
+    def __eq__(self, other):
+        if self is other:
+            return True
+        if type(other) is not type(self):
+            return False
+
+        return self.view == other.view
+
+    def __hash__(self):
+        if self.cached_hash is None:
+            self.cached_hash = hash(tuple(self.view))
+        return self.cached_hash
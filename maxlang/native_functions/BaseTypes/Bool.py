@@ -39,9 +39,7 @@ class BoolEquals(BaseInternalMethod):
 
     def call(self, interpreter, arguments):
         if is_instance(interpreter, arguments[0], BoolClass.name):
-            return BoolInstance(interpreter).set_value(
-                self.instance.value is arguments[0].value
-            )
+            return interpreter.make_bool(self.instance.value is arguments[0].value)
 
         raise InternalError(
             f"Cannot compare {self.instance.class_name} and {arguments[0].class_name}"
@@ -52,7 +50,7 @@ class BoolToBool(BaseInternalMethod):
     name = make_internal_token("toBool")
 
     def call(self, interpreter, arguments):
-        return BoolInstance(interpreter).set_value(self.instance.value)
+        return interpreter.make_bool(self.instance.value)
 
 
 class BoolToString(BaseInternalMethod):
@@ -88,6 +86,7 @@ class BoolClass(BaseInternalClass):
 
 class BoolInstance(BaseInternalInstance):
     CLASS = BoolClass
+    frozen = True
 
     def __init__(self, interpreter):
         super().__init__(interpreter)
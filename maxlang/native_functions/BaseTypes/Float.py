@@ -150,13 +150,10 @@ class FloatEquals(BaseInternalMethod):
         return BoolClass.name
 
     def call(self, interpreter, arguments):
-        from .Bool import BoolInstance
         from .Int import IntClass
 
         if is_instance(interpreter, arguments[0], FloatClass.name, IntClass.name):
-            return BoolInstance(interpreter).set_value(
-                self.instance.value == arguments[0].value
-            )
+            return interpreter.make_bool(self.instance.value == arguments[0].value)
 
         raise InternalError(
             f"Cannot compare {self.instance.class_name} and {arguments[0].class_name}"
@@ -183,13 +180,10 @@ class FloatGreaterThan(BaseInternalMethod):
         return BoolClass.name
 
     def call(self, interpreter, arguments):
-        from .Bool import BoolInstance
         from .Int import IntClass
 
         if is_instance(interpreter, arguments[0], FloatClass.name, IntClass.name):
-            return BoolInstance(interpreter).set_value(
-                self.instance.value > arguments[0].value
-            )
+            return interpreter.make_bool(self.instance.value > arguments[0].value)
 
         raise InternalError(
             f"Cannot compare {self.instance.class_name} and {arguments[0].class_name}"
@@ -228,9 +222,7 @@ class FloatToInt(BaseInternalMethod):
         return IntClass.name
 
     def call(self, interpreter, arguments):
-        from .Int import IntInstance
-
-        return IntInstance(interpreter).set_value(int(self.instance.value))
+        return interpreter.make_int(int(self.instance.value))
 
 
 class FloatToFloat(BaseInternalMethod):
@@ -254,9 +246,7 @@ class FloatToBool(BaseInternalMethod):
         return BoolClass.name
 
     def call(self, interpreter, arguments):
-        from .Bool import BoolInstance
-
-        return BoolInstance(interpreter).set_value(self.instance.value != 0.0)
+        return interpreter.make_bool(self.instance.value != 0.0)
 
 
 class FloatClass(BaseInternalClass):
@@ -289,6 +279,7 @@ class FloatClass(BaseInternalClass):
 
 class FloatInstance(BaseInternalInstance):
     CLASS = FloatClass
+    frozen = True
 
     def __init__(self, interpreter):
         super().__init__(interpreter)
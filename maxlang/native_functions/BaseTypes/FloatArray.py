@@ -0,0 +1,45 @@
+from ..main import is_instance, make_internal_token
+from maxlang.errors import InternalError
+from .Array import BaseArrayClass, BaseArrayInstance
+from .Float import FloatClass, FloatInstance
+from .Int import IntClass
+
+
+class FloatArrayClass(BaseArrayClass):
+    name = make_internal_token("FloatArray")
+
+    @property
+    def instance_class(self):
+        return FloatArrayInstance
+
+
+class FloatArrayInstance(BaseArrayInstance):
+    """Floats stored as doubles. Ints and IntArrays are accepted wherever
+    a Float or a FloatArray is, and converted."""
+
+    CLASS = FloatArrayClass
+    TYPECODE = "d"
+
+    @property
+    def element_class(self):
+        return FloatClass
+
+    @property
+    def operand_types(self):
+        from .IntArray import IntArrayClass
+
+        return [FloatArrayClass.name, IntArrayClass.name, FloatClass.name, IntClass.name]
+
+    @property
+    def iterator_class(self):
+        from ..Interators.ArrayIterator import FloatArrayIteratorInstance
+
+        return FloatArrayIteratorInstance
+
+    def box(self, value):
+        return FloatInstance(self.interpreter).set_value(value)
+
+    def unbox(self, value):
+        if not is_instance(self.interpreter, value, FloatClass.name, IntClass.name):
+            raise InternalError(f"Invalid value passed to {self.class_name}.")
+        return float(value.value)
@@ -42,9 +42,7 @@ class IntAdd(BaseInternalMethod):
         from .Float import FloatInstance, FloatClass
 
         if is_instance(interpreter, arguments[0], IntClass.name):
-            return IntInstance(interpreter).set_value(
-                self.instance.value + arguments[0].value
-            )
+            return interpreter.make_int(self.instance.value + arguments[0].value)
         if is_instance(interpreter, arguments[0], FloatClass.name):
             return FloatInstance(interpreter).set_value(
                 self.instance.value + arguments[0].value
@@ -72,9 +70,7 @@ class IntSubstract(BaseInternalMethod):
         from .Float import FloatInstance, FloatClass
 
         if is_instance(interpreter, arguments[0], IntClass.name):
-            return IntInstance(interpreter).set_value(
-                self.instance.value - arguments[0].value
-            )
+            return interpreter.make_int(self.instance.value - arguments[0].value)
         if is_instance(interpreter, arguments[0], FloatClass.name):
             return FloatInstance(interpreter).set_value(
                 self.instance.value - arguments[0].value
@@ -102,9 +98,7 @@ class IntMultiply(BaseInternalMethod):
         from .Float import FloatInstance, FloatClass
 
         if is_instance(interpreter, arguments[0], IntClass.name):
-            return IntInstance(interpreter).set_value(
-                self.instance.value * arguments[0].value
-            )
+            return interpreter.make_int(self.instance.value * arguments[0].value)
         if is_instance(interpreter, arguments[0], FloatClass.name):
             return FloatInstance(interpreter).set_value(
                 self.instance.value * arguments[0].value
@@ -168,13 +162,10 @@ class IntEquals(BaseInternalMethod):
         return BoolClass.name
 
     def call(self, interpreter, arguments):
-        from .Bool import BoolInstance
         from .Float import FloatClass
 
         if is_instance(interpreter, arguments[0], IntClass.name, FloatClass.name):
-            return BoolInstance(interpreter).set_value(
-                self.instance.value == arguments[0].value
-            )
+            return interpreter.make_bool(self.instance.value == arguments[0].value)
 
         raise InternalError(
             f"Cannot compare {self.instance.class_name} and {arguments[0].class_name}"
@@ -201,13 +192,10 @@ class IntGreaterThan(BaseInternalMethod):
         return BoolClass.name
 
     def call(self, interpreter, arguments):
-        from .Bool import BoolInstance
         from .Float import FloatClass
 
         if is_instance(interpreter, arguments[0], IntClass.name, FloatClass.name):
-            return BoolInstance(interpreter).set_value(
-                self.instance.value > arguments[0].value
-            )
+            return interpreter.make_bool(self.instance.value > arguments[0].value)
 
         raise InternalError(
             f"Cannot compare {self.instance.class_name} and {arguments[0].class_name}"
@@ -218,7 +206,7 @@ class IntNegate(BaseInternalMethod):
     name = make_internal_token("negate")
 
     def call(self, interpreter, arguments):
-        return IntInstance(interpreter).set_value(-self.instance.value)
+        return interpreter.make_int(-self.instance.value)
 
 
 class IntIterate(BaseInternalMethod):
@@ -246,9 +234,7 @@ class IntToBool(BaseInternalMethod):
         return BoolClass.name
 
     def call(self, interpreter, arguments):
-        from .Bool import BoolInstance
-
-        return BoolInstance(interpreter).set_value(self.instance.value != 0)
+        return interpreter.make_bool(self.instance.value != 0)
 
 
 class IntToString(BaseInternalMethod):
@@ -285,7 +271,7 @@ class IntToInt(BaseInternalMethod):
     name = make_internal_token("toInt")
 
     def call(self, interpreter, arguments):
-        return IntInstance(interpreter).set_value(int(self.instance.value))
+        return interpreter.make_int(int(self.instance.value))
 
 
 class IntClass(BaseInternalClass):
@@ -313,6 +299,7 @@ class IntClass(BaseInternalClass):
 
 class IntInstance(BaseInternalInstance):
     CLASS = IntClass
+    frozen = True
 
     def __init__(self, interpreter):
         super().__init__(interpreter)
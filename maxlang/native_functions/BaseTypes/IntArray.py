@@ -0,0 +1,41 @@
+from ..main import is_instance, make_internal_token
+from maxlang.errors import InternalError
+from .Array import BaseArrayClass, BaseArrayInstance
+from .Int import IntClass
+
+
+class IntArrayClass(BaseArrayClass):
+    name = make_internal_token("IntArray")
+
+    @property
+    def instance_class(self):
+        return IntArrayInstance
+
+
+class IntArrayInstance(BaseArrayInstance):
+    """Ints stored as signed 64-bit integers."""
+
+    CLASS = IntArrayClass
+    TYPECODE = "q"
+
+    @property
+    def element_class(self):
+        return IntClass
+
+    @property
+    def operand_types(self):
+        return [IntArrayClass.name, IntClass.name]
+
+    @property
+    def iterator_class(self):
+        from ..Interators.ArrayIterator import IntArrayIteratorInstance
+
+        return IntArrayIteratorInstance
+
+    def box(self, value):
+        return self.interpreter.make_int(value)
+
+    def unbox(self, value):
+        if not is_instance(self.interpreter, value, IntClass.name):
+            raise InternalError(f"Invalid value passed to {self.class_name}.")
+        return value.value
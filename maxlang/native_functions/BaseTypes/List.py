@@ -1,10 +1,16 @@
+from functools import reduce
+from itertools import islice
+from operator import itemgetter
+
 from ..main import (
     BaseInternalClass,
     BaseInternalMethod,
     BaseInternalInstance,
+    is_frozen,
     is_instance,
     make_internal_token,
 )
+from ..vector import Vector
 from maxlang.errors import InternalError
 from maxlang.parse.expressions import Parameter
 
@@ -32,11 +38,10 @@ class ListPush(BaseInternalMethod):
         return ListClass.name
 
     def call(self, interpreter, arguments):
-        new_list = self.instance._copy()
         # Support varargs - add all items
-        for item in arguments[0].values:
-            new_list.additions.append(item)
-        return new_list
+        return self.instance.with_vector(
+            self.instance.vector.extend(arguments[0].values)
+        )
 
 
 class ListPop(BaseInternalMethod):
@@ -51,21 +56,14 @@ class ListPop(BaseInternalMethod):
     def call(self, interpreter, arguments):
         from .Pair import PairInstance
 
-        total_len = self.instance._total_length()
-        if total_len == 0:
+        vector = self.instance.vector
+        if len(vector) == 0:
             raise InternalError(f"No more items in {self.instance.class_name}.")
 
-        # Get the last item
-        last_item = self.instance._get_value(total_len - 1)
-
-        # Create new list without last item by compacting all but the last
-        new_list = ListInstance(interpreter)
-        new_list.base_values = [
-            self.instance._get_value(i) for i in range(total_len - 1)
-        ]
-
         # Return Pair(new_list, popped_value)
-        return PairInstance(interpreter).set_values(new_list, last_item)
+        return PairInstance(interpreter).set_values(
+            self.instance.with_vector(vector.pop()), vector.get(-1)
+        )
 
 
 class ListGet(BaseInternalMethod):
@@ -90,7 +88,7 @@ class ListGet(BaseInternalMethod):
     def call(self, interpreter, arguments):
         try:
             index = int(arguments[0].value)
-            return self.instance._get_value(index)
+            return self.instance.vector.get(index)
         except (ValueError, IndexError, TypeError, AttributeError):
             raise InternalError(f"{arguments[0]} is not a valid index.")
 
@@ -123,12 +121,10 @@ class ListSet(BaseInternalMethod):
             value = arguments[1]
 
             # Validate index is in range
-            if index < 0 or index >= self.instance._total_length():
+            if index < 0 or index >= len(self.instance.vector):
                 raise InternalError(f"Index {index} out of range")
 
-            new_list = self.instance._copy()
-            new_list.modifications[index] = value
-            return new_list
+            return self.instance.with_vector(self.instance.vector.set(index, value))
         except (ValueError, TypeError, AttributeError):
             raise InternalError(f"{arguments[0]} is not a valid index.")
 
@@ -157,9 +153,9 @@ class ListExtend(BaseInternalMethod):
         if arguments[0] == self.instance:
             raise InternalError("Cannot extend a List with itself.")
 
-        new_list = self.instance._copy()
-        new_list.extend(arguments[0].values)
-        return new_list
+        return self.instance.with_vector(
+            self.instance.vector.extend(arguments[0].vector)
+        )
 
 
 class ListIterate(BaseInternalMethod):
@@ -177,6 +173,21 @@ class ListIterate(BaseInternalMethod):
         return ListIteratorInstance(interpreter).set_value(self.instance)
 
 
+class ListToBuilder(BaseInternalMethod):
+    name = make_internal_token("toBuilder")
+
+    @property
+    def return_token(self):
+        from ..Builders.ListBuilder import ListBuilderClass
+
+        return ListBuilderClass.name
+
+    def call(self, interpreter, arguments):
+        from ..Builders.ListBuilder import ListBuilderInstance
+
+        return ListBuilderInstance(interpreter).set_value(self.instance)
+
+
 class ListAdd(BaseInternalMethod):
     name = make_internal_token("add")
 
@@ -190,9 +201,9 @@ class ListAdd(BaseInternalMethod):
 
     def call(self, interpreter, arguments):
         if is_instance(interpreter, arguments[0], ListClass.name):
-            new_list = ListInstance(interpreter).set_values(*self.instance.values)
-            new_list.extend(arguments[0].values)
-            return new_list
+            return self.instance.with_vector(
+                self.instance.vector.extend(arguments[0].vector)
+            )
 
         raise InternalError(
             "Can only add a List to a List. Use the push method to add items to a List."
@@ -216,8 +227,8 @@ class ListMultiply(BaseInternalMethod):
         from .Int import IntClass
 
         if is_instance(interpreter, arguments[0], IntClass.name):
-            return ListInstance(interpreter).set_values(
-                *(self.instance.values * arguments[0].value)
+            return self.instance.with_vector(
+                Vector.from_iterable(self.instance.values * arguments[0].value)
             )
 
         raise InternalError(
@@ -243,10 +254,8 @@ class ListEquals(BaseInternalMethod):
         return BoolClass.name
 
     def call(self, interpreter, arguments):
-        from .Bool import BoolInstance
-
         if is_instance(interpreter, arguments[0], ListClass.name):
-            return BoolInstance(interpreter).set_value(self.instance == arguments[0])
+            return interpreter.make_bool(self.instance == arguments[0])
 
         raise InternalError(
             f"Cannot compare {self.instance.class_name} and {arguments[0].class_name}"
@@ -263,9 +272,7 @@ class ListLength(BaseInternalMethod):
         return IntClass.name
 
     def call(self, interpreter, arguments):
-        from .Int import IntInstance
-
-        return IntInstance(interpreter).set_value(self.instance._total_length())
+        return interpreter.make_int(len(self.instance.vector))
 
 
 class ListToBool(BaseInternalMethod):
@@ -278,9 +285,7 @@ class ListToBool(BaseInternalMethod):
         return BoolClass.name
 
     def call(self, interpreter, arguments):
-        from .Bool import BoolInstance
-
-        return BoolInstance(interpreter).set_value(len(self.instance.values) != 0)
+        return interpreter.make_bool(len(self.instance.vector) != 0)
 
 
 class ListToString(BaseInternalMethod):
@@ -295,12 +300,245 @@ class ListToString(BaseInternalMethod):
     def call(self, interpreter, arguments):
         from .String import StringInstance
 
-        stringified = (
-            self.instance.klass.interpreter.stringify(v, True)
-            for v in self.instance.values
+        instance = self.instance
+        string = instance.cached_string
+        if string is None:
+            stringified = (
+                instance.klass.interpreter.stringify(v, True) for v in instance.vector
+            )
+            string = f"{instance.klass.name.lexeme}({', '.join(stringified)})"
+            if instance.frozen:
+                instance.cached_string = string
+
+        return StringInstance(interpreter).set_value(string)
+
+
+def to_bool(value) -> bool:
+    """Truthiness of a value a callback returned."""
+    from .Bool import BoolInstance
+
+    if not isinstance(value, BoolInstance):
+        try:
+            value = value.internal_find_method("toBool").call(value.interpreter, [])
+        except (KeyError, AttributeError):
+            raise InternalError(
+                f"class {getattr(value, 'class_name', value)} does not implement the toBool method."
+            )
+
+    return value.value
+
+
+def sort_key(value):
+    from .Int import IntInstance
+    from .Float import FloatInstance
+    from .String import StringInstance
+
+    if type(value) in (IntInstance, FloatInstance, StringInstance):
+        return value.value
+
+    raise InternalError(
+        f"Cannot sort by {getattr(value, 'class_name', value)}, only by Int, Float or String keys."
+    )
+
+
+def to_index(argument) -> int:
+    from .Int import IntInstance
+
+    if type(argument) is not IntInstance:
+        raise InternalError(f"{argument} is not a valid index.")
+    return argument.value
+
+
+class ListMap(BaseInternalMethod):
+    name = make_internal_token("map")
+
+    @property
+    def parameters(self):
+        return [Parameter(make_internal_token("function"))]
+
+    @property
+    def return_token(self):
+        return ListClass.name
+
+    def call(self, interpreter, arguments):
+        function = interpreter.callback(arguments[0], 1)
+        return self.instance.with_vector(
+            Vector.from_iterable(map(function, self.instance.vector))
         )
-        return StringInstance(interpreter).set_value(
-            f"{self.instance.klass.name.lexeme}({', '.join(stringified)})"
+
+
+class ListFilter(BaseInternalMethod):
+    name = make_internal_token("filter")
+
+    @property
+    def parameters(self):
+        return [Parameter(make_internal_token("function"))]
+
+    @property
+    def return_token(self):
+        return ListClass.name
+
+    def call(self, interpreter, arguments):
+        function = interpreter.callback(arguments[0], 1)
+        return self.instance.with_vector(
+            Vector.from_iterable(
+                value for value in self.instance.vector if to_bool(function(value))
+            )
+        )
+
+
+class ListReduce(BaseInternalMethod):
+    name = make_internal_token("reduce")
+
+    @property
+    def parameters(self):
+        return [
+            Parameter(make_internal_token("function")),
+            Parameter(make_internal_token("initial")),
+        ]
+
+    @property
+    def return_token(self):
+        from .Object import ObjectClass
+
+        return ObjectClass.name
+
+    def call(self, interpreter, arguments):
+        function = interpreter.callback(arguments[0], 2)
+        return reduce(function, self.instance.vector, arguments[1])
+
+
+class ListFlatMap(BaseInternalMethod):
+    name = make_internal_token("flatMap")
+
+    @property
+    def parameters(self):
+        return [Parameter(make_internal_token("function"))]
+
+    @property
+    def return_token(self):
+        return ListClass.name
+
+    def call(self, interpreter, arguments):
+        function = interpreter.callback(arguments[0], 1)
+
+        def flatten():
+            for value in self.instance.vector:
+                result = function(value)
+                if not isinstance(result, ListInstance):
+                    raise InternalError(
+                        f"flatMap expects the function to return a List but got {getattr(result, 'class_name', result)}."
+                    )
+                yield from result.vector
+
+        return self.instance.with_vector(Vector.from_iterable(flatten()))
+
+
+class ListSortBy(BaseInternalMethod):
+    name = make_internal_token("sortBy")
+
+    @property
+    def parameters(self):
+        return [Parameter(make_internal_token("function"))]
+
+    @property
+    def return_token(self):
+        return ListClass.name
+
+    def call(self, interpreter, arguments):
+        function = interpreter.callback(arguments[0], 1)
+        # Each key is computed once, the sort is stable
+        keyed = [(sort_key(function(value)), value) for value in self.instance.vector]
+        try:
+            keyed.sort(key=itemgetter(0))
+        except TypeError:
+            raise InternalError("Cannot compare the keys returned to sortBy.")
+
+        return self.instance.with_vector(Vector.from_iterable(map(itemgetter(1), keyed)))
+
+
+class ListSlice(BaseInternalMethod):
+    name = make_internal_token("slice")
+
+    @property
+    def parameters(self):
+        return [
+            Parameter(make_internal_token("start")),
+            Parameter(make_internal_token("end")),
+        ]
+
+    @property
+    def allowed_types(self):
+        from .Int import IntClass
+
+        return [IntClass.name]
+
+    @property
+    def return_token(self):
+        return ListClass.name
+
+    def call(self, interpreter, arguments):
+        vector = self.instance.vector
+        # Negative and out of range bounds behave as for Python slices
+        indexes = range(len(vector))[to_index(arguments[0]) : to_index(arguments[1])]
+        if len(indexes) == len(vector):
+            return self.instance
+
+        return self.instance.with_vector(
+            Vector.from_iterable(
+                islice(vector.iterate_from(indexes.start), len(indexes))
+            )
+        )
+
+
+class ListIndexOf(BaseInternalMethod):
+    name = make_internal_token("indexOf")
+
+    @property
+    def parameters(self):
+        return [Parameter(make_internal_token("value"))]
+
+    @property
+    def return_token(self):
+        from .Int import IntClass
+
+        return IntClass.name
+
+    def call(self, interpreter, arguments):
+        for index, value in enumerate(self.instance.vector):
+            if value == arguments[0]:
+                return interpreter.make_int(index)
+
+        return interpreter.make_int(-1)
+
+
+class ListContains(BaseInternalMethod):
+    name = make_internal_token("contains")
+
+    @property
+    def parameters(self):
+        return [Parameter(make_internal_token("value"))]
+
+    @property
+    def return_token(self):
+        from .Bool import BoolClass
+
+        return BoolClass.name
+
+    def call(self, interpreter, arguments):
+        return interpreter.make_bool(arguments[0] in self.instance.vector)
+
+
+class ListReverse(BaseInternalMethod):
+    name = make_internal_token("reverse")
+
+    @property
+    def return_token(self):
+        return ListClass.name
+
+    def call(self, interpreter, arguments):
+        return self.instance.with_vector(
+            Vector.from_iterable(reversed(self.instance.values))
         )
 
 
@@ -314,12 +552,22 @@ class ListClass(BaseInternalClass):
         ListPop,
         ListExtend,
         ListIterate,
+        ListToBuilder,
         ListAdd,
         ListMultiply,
         ListEquals,
         ListLength,
         ListToBool,
         ListToString,
+        ListMap,
+        ListFilter,
+        ListReduce,
+        ListFlatMap,
+        ListSortBy,
+        ListSlice,
+        ListIndexOf,
+        ListContains,
+        ListReverse,
     )
 
     @property
@@ -331,129 +579,72 @@ class ListClass(BaseInternalClass):
 
 
 class ListInstance(BaseInternalInstance):
+    """A List is immutable, every update returns a new List sharing all but
+    O(log32 n) of its storage with the original through a persistent Vector.
+
+    Its hash is computed from its items on first use and kept, as is its
+    string once the items are known to be frozen.
+    """
+
     CLASS = ListClass
-    COMPACTION_THRESHOLD = 100
 
     def __init__(self, interpreter):
         super().__init__(interpreter)
-        self.base_values = []  # Original immutable base
-        self.modifications = {}  # {index: value} overrides
-        self.additions = []  # Items appended after base
-        self.parent = None  # Previous version reference
-        self.depth = 0  # Chain depth for compaction
-        self._ref_count = 0  # Track external references
+        self.vector = Vector()
+        self.clear_caches()
+
+    def clear_caches(self):
+        self.cached_hash = None
+        self.cached_string = None
+        self.cached_frozen = None
 
     def set_values(self, *args):
-        self.base_values = [*args]
+        self.vector = Vector.from_iterable(args)
+        self.clear_caches()
         return self
 
-    def _total_length(self):
-        """Calculate total length including parent chain."""
-        base_len = len(self.base_values)
-        additions_len = len(self.additions)
-
-        # Count items from parent if exists
-        if self.parent:
-            parent_len = self.parent._total_length()
-            return max(parent_len, base_len) + additions_len
-
-        return base_len + additions_len
-
-    def _get_value(self, index):
-        """Get value with modification chain lookup."""
-        # Check additions first
-        base_len = (
-            len(self.base_values) if not self.parent else self.parent._total_length()
-        )
-        if index >= base_len:
-            addition_index = index - base_len
-            if addition_index < len(self.additions):
-                return self.additions[addition_index]
-            raise IndexError(f"Index {index} out of range")
-
-        # Check modifications
-        if index in self.modifications:
-            value = self.modifications[index]
-            if value is None:  # Marked as removed
-                raise IndexError(f"Index {index} has been removed")
-            return value
-
-        # Check base values
-        if index < len(self.base_values):
-            return self.base_values[index]
-
-        # Walk parent chain
-        if self.parent:
-            return self.parent._get_value(index)
-
-        raise IndexError(f"Index {index} out of range")
-
-    def _copy(self):
-        """Create a new version for modifications."""
-        new_instance = ListInstance(self.interpreter)
-        new_instance.parent = self
-        new_instance.depth = self.depth + 1
-
-        # Auto-compact if chain is deep AND old instances are unreferenced
-        if new_instance.depth > self.COMPACTION_THRESHOLD:
-            if self._should_compact():
-                new_instance._compact()
-
-        return new_instance
-
-    def _should_compact(self):
-        """Check if we should compact the chain.
-
-        Compaction should occur if:
-        1. Depth exceeds threshold
-        2. There are no external references to intermediate nodes (Python's GC handles this)
-
-        Since Python uses reference counting, unreferenced objects will be GC'd automatically.
-        We just need to check if compaction makes sense based on depth.
-        """
-        # For now, always compact when threshold is exceeded
-        # Python's GC will clean up unreferenced intermediate nodes
-        return True
-
-    def _compact(self):
-        """Flatten the modification chain."""
-        # Collect all values into new base
-        total_len = self._total_length()
-        self.base_values = [self._get_value(i) for i in range(total_len)]
-        self.modifications = {}
-        self.additions = []
-        self.parent = None
-        self.depth = 0
+    def with_vector(self, vector: Vector):
+        """A new List of the same interpreter holding `vector`."""
+        new_list = ListInstance(self.interpreter)
+        new_list.vector = vector
+        return new_list
 
     @property
     def values(self):
         """Property to maintain compatibility with existing code."""
-        # Return all values as a list
-        try:
-            return [self._get_value(i) for i in range(self._total_length())]
-        except IndexError:
-            return []
+        return list(self.vector)
 
     @values.setter
     def values(self, new_values):
         """Setter to maintain compatibility."""
-        self.base_values = new_values
-        self.modifications = {}
-        self.additions = []
-        self.parent = None
-        self.depth = 0
+        self.vector = Vector.from_iterable(new_values)
+        self.clear_caches()
+
+    @property
+    def frozen(self) -> bool:
+        if self.cached_frozen is None:
+            self.cached_frozen = all(map(is_frozen, self.vector))
+        return self.cached_frozen
 
     def __str__(self) -> str:
         return self.internal_find_method("toString").call(self.interpreter, [])
 
     def extend(self, other_list):
-        self.additions.extend(other_list)
+        self.vector = self.vector.extend(other_list)
+        self.clear_caches()
 
     def __eq__(self, other):
+        if self is other:
+            return True
         if not isinstance(other, ListInstance):
             return False
+        if self.cached_hash is not None and other.cached_hash is not None:
+            if self.cached_hash != other.cached_hash:
+                return False
 
-        return self.values == other.values
+        return self.vector.equals(other.vector)
 
     def __hash__(self):
-        return hash(str(self))
+        if self.cached_hash is None:
+            self.cached_hash = hash(tuple(self.vector))
+        return self.cached_hash
@@ -4,11 +4,13 @@ from ..main import (
     BaseInternalClass,
     BaseInternalMethod,
     BaseInternalInstance,
+    is_frozen,
     is_instance,
     make_internal_token,
 )
 from .Pair import PairInstance, PairClass
 from .VarArgs import VarArgsInstance
+from ..hamt import Hamt, TransientHamt
 from maxlang.errors import InternalError
 from maxlang.parse.expressions import Parameter
 
@@ -44,20 +46,18 @@ class MapPush(BaseInternalMethod):
         return MapClass.name
 
     def call(self, interpreter, arguments):
-        new_map = self.instance._copy()
+        transient = TransientHamt(self.instance.hamt)
 
         # Support varargs - add all pairs
         for item in arguments[0].values:
             if is_instance(interpreter, item, PairClass.name):
-                new_map.modifications[item.first] = item.second
-                if item.first in new_map.removals:
-                    new_map.removals.remove(item.first)
+                transient.set(item.first, item.second)
             else:
                 raise InternalError(
                     f"Invalid value passed to {self.instance.class_name}."
                 )
 
-        return new_map
+        return self.instance.with_hamt(transient.persistent())
 
 
 class MapGet(BaseInternalMethod):
@@ -102,12 +102,7 @@ class MapSet(BaseInternalMethod):
         key = arguments[0]
         value = arguments[1]
 
-        new_map = self.instance._copy()
-        new_map.modifications[key] = value
-        if key in new_map.removals:
-            new_map.removals.remove(key)
-
-        return new_map
+        return self.instance.with_hamt(self.instance.hamt.set(key, value))
 
 
 class MapIterate(BaseInternalMethod):
@@ -125,6 +120,21 @@ class MapIterate(BaseInternalMethod):
         return MapIteratorInstance(interpreter).set_value(self.instance)
 
 
+class MapToBuilder(BaseInternalMethod):
+    name = make_internal_token("toBuilder")
+
+    @property
+    def return_token(self):
+        from ..Builders.MapBuilder import MapBuilderClass
+
+        return MapBuilderClass.name
+
+    def call(self, interpreter, arguments):
+        from ..Builders.MapBuilder import MapBuilderInstance
+
+        return MapBuilderInstance(interpreter).set_value(self.instance)
+
+
 class MapRemove(BaseInternalMethod):
     name = make_internal_token("remove")
     instance: MapInstance
@@ -143,8 +153,7 @@ class MapRemove(BaseInternalMethod):
             value = self.instance._get_value(arguments[0])
 
             # Create new map without this key
-            new_map = self.instance._copy()
-            new_map.removals.add(arguments[0])
+            new_map = self.instance.with_hamt(self.instance.hamt.remove(arguments[0]))
 
             # Return Pair(new_map, removed_value)
             return PairInstance(interpreter).set_values(new_map, value)
@@ -167,9 +176,7 @@ class MapAdd(BaseInternalMethod):
         return [MapClass.name, PairClass.name]
 
     def call(self, interpreter, arguments):
-        new_map = MapInstance(interpreter).set_values(
-            VarArgsInstance(interpreter).set_values(*self.instance.get_pairs())
-        )
+        new_map = self.instance.with_hamt(self.instance.hamt)
         if is_instance(interpreter, arguments[0], MapClass.name):
             new_map.update(arguments[0])
         elif is_instance(interpreter, arguments[0], PairClass.name):
@@ -198,10 +205,8 @@ class MapEquals(BaseInternalMethod):
         return BoolClass.name
 
     def call(self, interpreter, arguments):
-        from .Bool import BoolInstance
-
         if is_instance(interpreter, arguments[0], MapClass.name):
-            return BoolInstance(interpreter).set_value(self.instance == arguments[0])
+            return interpreter.make_bool(self.instance == arguments[0])
 
         raise InternalError(
             f"Cannot compare {self.instance.class_name} and {arguments[0].class_name}"
@@ -218,9 +223,7 @@ class MapLength(BaseInternalMethod):
         return IntClass.name
 
     def call(self, interpreter, arguments):
-        from .Int import IntInstance
-
-        return IntInstance(interpreter).set_value(len(self.instance._all_keys()))
+        return interpreter.make_int(len(self.instance.hamt))
 
 
 class MapToBool(BaseInternalMethod):
@@ -233,9 +236,7 @@ class MapToBool(BaseInternalMethod):
         return BoolClass.name
 
     def call(self, interpreter, arguments):
-        from .Bool import BoolInstance
-
-        return BoolInstance(interpreter).set_value(len(self.instance.values) != 0)
+        return interpreter.make_bool(len(self.instance.hamt) != 0)
 
 
 class MapToString(BaseInternalMethod):
@@ -250,15 +251,20 @@ class MapToString(BaseInternalMethod):
     def call(self, interpreter, arguments):
         from .String import StringInstance
 
-        stringified = (
-            " -> ".join(
-                (interpreter.stringify(k, True), interpreter.stringify(v, True))
+        instance = self.instance
+        string = instance.cached_string
+        if string is None:
+            stringified = (
+                " -> ".join(
+                    (interpreter.stringify(k, True), interpreter.stringify(v, True))
+                )
+                for k, v in instance.hamt.items()
             )
-            for k, v in self.instance.values.items()
-        )
-        return StringInstance(interpreter).set_value(
-            f"{self.instance.klass.name.lexeme}({', '.join(stringified)})"
-        )
+            string = f"{instance.klass.name.lexeme}({', '.join(stringified)})"
+            if instance.frozen:
+                instance.cached_string = string
+
+        return StringInstance(interpreter).set_value(string)
 
 
 class MapClass(BaseInternalClass):
@@ -270,6 +276,7 @@ class MapClass(BaseInternalClass):
         MapSet,
         MapRemove,
         MapIterate,
+        MapToBuilder,
         MapAdd,
         MapEquals,
         MapLength,
@@ -286,131 +293,73 @@ class MapClass(BaseInternalClass):
 
 
 class MapInstance(BaseInternalInstance):
+    """A Map is immutable, every update returns a new Map sharing all but
+    O(log32 n) of its storage with the original through a persistent Hamt.
+
+    Its hash is computed from its entries on first use and kept, as is its
+    string once the keys and values are known to be frozen.
+    """
+
     CLASS = MapClass
-    COMPACTION_THRESHOLD = 100
 
     def __init__(self, interpreter):
         super().__init__(interpreter)
-        self.base_values = {}  # Original immutable base
-        self.modifications = {}  # {key: value} overrides/additions
-        self.removals = set()  # Keys marked for removal
-        self.parent = None  # Previous version reference
-        self.depth = 0  # Chain depth for compaction
-        self._ref_count = 0  # Track external references
+        self.hamt = Hamt()
+        self.clear_caches()
+
+    def clear_caches(self):
+        self.cached_hash = None
+        self.cached_string = None
+        self.cached_frozen = None
 
     def set_values(self, args: VarArgsInstance):
+        transient = TransientHamt(self.hamt)
         for arg in args.values:
             if not is_instance(self.interpreter, arg, PairClass.name):
                 raise InternalError(f"Invalid value passed to {self.class_name}.")
-            self.base_values[arg.first] = arg.second
+            transient.set(arg.first, arg.second)
 
+        self.hamt = transient.persistent()
+        self.clear_caches()
         return self
 
-    def _get_value(self, key):
-        """Get value with modification chain lookup."""
-        # Check if removed
-        if key in self.removals:
-            raise KeyError(key)
-
-        # Check modifications
-        if key in self.modifications:
-            return self.modifications[key]
-
-        # Check base
-        if key in self.base_values:
-            return self.base_values[key]
-
-        # Walk parent chain
-        if self.parent:
-            return self.parent._get_value(key)
+    def with_hamt(self, hamt: Hamt):
+        """A new Map of the same interpreter holding `hamt`."""
+        new_map = MapInstance(self.interpreter)
+        new_map.hamt = hamt
+        return new_map
 
-        raise KeyError(key)
+    def _get_value(self, key):
+        return self.hamt[key]
 
     def _has_key(self, key):
-        """Check if key exists in chain."""
-        if key in self.removals:
-            return False
-        if key in self.modifications or key in self.base_values:
-            return True
-        if self.parent:
-            return self.parent._has_key(key)
-        return False
+        return key in self.hamt
 
     def _all_keys(self):
-        """Get all keys from chain."""
-        keys = set()
-
-        # Collect from base
-        keys.update(self.base_values.keys())
-
-        # Collect from modifications
-        keys.update(self.modifications.keys())
-
-        # Collect from parent
-        if self.parent:
-            keys.update(self.parent._all_keys())
-
-        # Remove deleted keys
-        keys -= self.removals
-
-        return keys
-
-    def _copy(self):
-        """Create a new version for modifications."""
-        new_instance = MapInstance(self.interpreter)
-        new_instance.parent = self
-        new_instance.depth = self.depth + 1
+        return iter(self.hamt)
 
-        # Auto-compact if chain is deep AND old instances are unreferenced
-        if new_instance.depth > self.COMPACTION_THRESHOLD:
-            if self._should_compact():
-                new_instance._compact()
-
-        return new_instance
-
-    def _should_compact(self):
-        """Check if we should compact the chain.
-
-        Compaction should occur if:
-        1. Depth exceeds threshold
-        2. There are no external references to intermediate nodes (Python's GC handles this)
-
-        Since Python uses reference counting, unreferenced objects will be GC'd automatically.
-        We just need to check if compaction makes sense based on depth.
-        """
-        # For now, always compact when threshold is exceeded
-        # Python's GC will clean up unreferenced intermediate nodes
-        return True
-
-    def _compact(self):
-        """Flatten the modification chain."""
-        # Collect all key-value pairs into new base
-        all_keys = self._all_keys()
-        self.base_values = {key: self._get_value(key) for key in all_keys}
-        self.modifications = {}
-        self.removals = set()
-        self.parent = None
-        self.depth = 0
+    def items(self):
+        """The (key, value) tuples of the map, read lazily from the trie."""
+        return self.hamt.items()
 
     @property
     def values(self):
         """Property to maintain compatibility with existing code."""
-        result = {}
-        for key in self._all_keys():
-            try:
-                result[key] = self._get_value(key)
-            except KeyError:
-                pass
-        return result
+        return dict(self.hamt.items())
 
     @values.setter
     def values(self, new_values):
         """Setter to maintain compatibility."""
-        self.base_values = new_values
-        self.modifications = {}
-        self.removals = set()
-        self.parent = None
-        self.depth = 0
+        self.hamt = Hamt.from_items(new_values.items())
+        self.clear_caches()
+
+    @property
+    def frozen(self) -> bool:
+        if self.cached_frozen is None:
+            self.cached_frozen = all(
+                is_frozen(key) and is_frozen(value) for key, value in self.items()
+            )
+        return self.cached_frozen
 
     def __str__(self) -> str:
         return (
@@ -418,32 +367,42 @@ class MapInstance(BaseInternalInstance):
         )
 
     def __iter__(self):
-        return iter(self.get_pairs())
+        return self.iterate_pairs()
+
+    def iterate_pairs(self):
+        """The entries of the map as Pairs, created as they are consumed."""
+        interpreter = self.interpreter
+        return (
+            PairInstance(interpreter).set_values(key, value)
+            for key, value in self.hamt.items()
+        )
 
     def get_pairs(self):
-        pairs = []
-        for key in self._all_keys():
-            try:
-                value = self._get_value(key)
-                pairs.append(PairInstance(self.interpreter).set_values(key, value))
-            except KeyError:
-                pass
-        return pairs
+        return list(self.iterate_pairs())
 
     def update(self, other_map):
-        for pair in other_map:
-            self.add_pair(pair)
+        transient = TransientHamt(self.hamt)
+        for key, value in other_map.items():
+            transient.set(key, value)
+        self.hamt = transient.persistent()
+        self.clear_caches()
 
     def add_pair(self, pair):
-        self.modifications[pair.first] = pair.second
-        if pair.first in self.removals:
-            self.removals.remove(pair.first)
+        self.hamt = self.hamt.set(pair.first, pair.second)
+        self.clear_caches()
 
     def __eq__(self, other):
+        if self is other:
+            return True
         if not isinstance(other, MapInstance):
             return False
+        if self.cached_hash is not None and other.cached_hash is not None:
+            if self.cached_hash != other.cached_hash:
+                return False
 
-        return self.values == other.values
+        return self.hamt.equals(other.hamt)
 
     def __hash__(self):
-        return hash(id(self))
+        if self.cached_hash is None:
+            self.cached_hash = hash(frozenset(self.hamt.items()))
+        return self.cached_hash
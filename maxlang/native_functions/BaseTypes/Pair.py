@@ -3,6 +3,7 @@ from ..main import (
     BaseInternalAttribute,
     BaseInternalInstance,
     BaseInternalMethod,
+    is_frozen,
     make_internal_token,
 )
 from maxlang.errors import InternalError
@@ -63,10 +64,8 @@ class PairEquals(BaseInternalMethod):
         return BoolClass.name
 
     def call(self, interpreter, arguments):
-        from .Bool import BoolInstance
-
         if isinstance(arguments[0], PairInstance):
-            return BoolInstance(interpreter).set_value(self.instance == arguments[0])
+            return interpreter.make_bool(self.instance == arguments[0])
 
         raise InternalError(
             f"Cannot compare {self.instance.class_name} and {arguments[0].class_name}"
@@ -85,7 +84,13 @@ class PairToString(BaseInternalMethod):
     def call(self, interpreter, arguments):
         from .String import StringInstance
 
-        stringified = f"{self.instance.klass.name.lexeme}({interpreter.stringify(self.instance.first, True)}, {interpreter.stringify(self.instance.second, True)})"
+        instance = self.instance
+        stringified = instance.cached_string
+        if stringified is None:
+            stringified = f"{instance.klass.name.lexeme}({interpreter.stringify(instance.first, True)}, {interpreter.stringify(instance.second, True)})"
+            if instance.frozen:
+                instance.cached_string = stringified
+
         return StringInstance(interpreter).set_value(stringified)
 
 
@@ -105,20 +110,35 @@ class PairInstance(BaseInternalInstance):
         super().__init__(interpreter)
         self.first = None
         self.second = None
+        self.cached_hash = None
+        self.cached_string = None
 
     def set_values(self, first, second):
         self.first = first
         self.second = second
+        self.cached_hash = None
+        self.cached_string = None
         return self
 
+    @property
+    def frozen(self) -> bool:
+        return is_frozen(self.first) and is_frozen(self.second)
+
     def __str__(self):
         return self.internal_find_method("toString").call(self.klass.interpreter, [])
 
     def __eq__(self, other):
+        if self is other:
+            return True
         if not isinstance(other, PairInstance):
             return False
+        if self.cached_hash is not None and other.cached_hash is not None:
+            if self.cached_hash != other.cached_hash:
+                return False
 
         return self.first == other.first and self.second == other.second
 
     def __hash__(self):
-        return hash(str(self))
+        if self.cached_hash is None:
+            self.cached_hash = hash((self.first, self.second))
+        return self.cached_hash
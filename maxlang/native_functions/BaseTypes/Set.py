@@ -0,0 +1,324 @@
+from __future__ import annotations
+
+from ..main import (
+    BaseInternalClass,
+    BaseInternalMethod,
+    BaseInternalInstance,
+    is_frozen,
+    is_instance,
+    make_internal_token,
+)
+from ..hamt import Hamt, TransientHamt
+from maxlang.errors import InternalError
+from maxlang.parse.expressions import Parameter
+
+
+class SetInit(BaseInternalMethod):
+    name = make_internal_token("init")
+
+    @property
+    def parameters(self):
+        return [Parameter(make_internal_token("items"), is_varargs=True)]
+
+    def call(self, interpreter, arguments):
+        self.instance.set_values(arguments[0].values)
+
+
+class SetAdd(BaseInternalMethod):
+    name = make_internal_token("add")
+
+    @property
+    def parameters(self):
+        return [Parameter(make_internal_token("item"))]
+
+    @property
+    def return_token(self):
+        return SetClass.name
+
+    def call(self, interpreter, arguments):
+        hamt = self.instance.hamt.set(arguments[0], True)
+        if hamt is self.instance.hamt:
+            return self.instance
+        return self.instance.with_hamt(hamt)
+
+
+class SetRemove(BaseInternalMethod):
+    name = make_internal_token("remove")
+
+    @property
+    def parameters(self):
+        return [Parameter(make_internal_token("item"))]
+
+    @property
+    def return_token(self):
+        return SetClass.name
+
+    def call(self, interpreter, arguments):
+        hamt = self.instance.hamt.remove(arguments[0])
+        if hamt is self.instance.hamt:
+            raise InternalError(
+                f"Could not find {arguments[0]} in {self.instance.class_name}."
+            )
+        return self.instance.with_hamt(hamt)
+
+
+class SetContains(BaseInternalMethod):
+    name = make_internal_token("contains")
+
+    @property
+    def parameters(self):
+        return [Parameter(make_internal_token("item"))]
+
+    @property
+    def return_token(self):
+        from .Bool import BoolClass
+
+        return BoolClass.name
+
+    def call(self, interpreter, arguments):
+        return interpreter.make_bool(arguments[0] in self.instance.hamt)
+
+
+class SetUnion(BaseInternalMethod):
+    name = make_internal_token("union")
+
+    @property
+    def parameters(self):
+        return [Parameter(make_internal_token("other"))]
+
+    @property
+    def allowed_types(self):
+        return [SetClass.name]
+
+    @property
+    def return_token(self):
+        return SetClass.name
+
+    def combine(self, hamt: Hamt, other: Hamt) -> Hamt:
+        return hamt.union(other)
+
+    def call(self, interpreter, arguments):
+        other = arguments[0]
+        if not is_instance(interpreter, other, SetClass.name):
+            raise InternalError(
+                f"Cannot {self.name.lexeme} {self.instance.class_name} and {other.class_name}"
+            )
+
+        hamt = self.combine(self.instance.hamt, other.hamt)
+        if hamt is self.instance.hamt:
+            return self.instance
+        if hamt is other.hamt:
+            return other
+        return self.instance.with_hamt(hamt)
+
+
+class SetIntersection(SetUnion):
+    name = make_internal_token("intersection")
+
+    def combine(self, hamt: Hamt, other: Hamt) -> Hamt:
+        return hamt.intersection(other)
+
+
+class SetDifference(SetUnion):
+    name = make_internal_token("difference")
+
+    def combine(self, hamt: Hamt, other: Hamt) -> Hamt:
+        return hamt.difference(other)
+
+
+class SetIterate(BaseInternalMethod):
+    name = make_internal_token("iterate")
+
+    @property
+    def return_token(self):
+        from ..Interators.SetIterator import SetIteratorClass
+
+        return SetIteratorClass.name
+
+    def call(self, interpreter, arguments):
+        from ..Interators.SetIterator import SetIteratorInstance
+
+        return SetIteratorInstance(interpreter).set_value(self.instance)
+
+
+class SetEquals(BaseInternalMethod):
+    name = make_internal_token("equals")
+
+    @property
+    def parameters(self):
+        return [Parameter(make_internal_token("other"))]
+
+    @property
+    def allowed_types(self):
+        return [SetClass.name]
+
+    @property
+    def return_token(self):
+        from .Bool import BoolClass
+
+        return BoolClass.name
+
+    def call(self, interpreter, arguments):
+        if is_instance(interpreter, arguments[0], SetClass.name):
+            return interpreter.make_bool(self.instance == arguments[0])
+
+        raise InternalError(
+            f"Cannot compare {self.instance.class_name} and {arguments[0].class_name}"
+        )
+
+
+class SetLength(BaseInternalMethod):
+    name = make_internal_token("length")
+
+    @property
+    def return_token(self):
+        from .Int import IntClass
+
+        return IntClass.name
+
+    def call(self, interpreter, arguments):
+        return interpreter.make_int(len(self.instance.hamt))
+
+
+class SetToBool(BaseInternalMethod):
+    name = make_internal_token("toBool")
+
+    @property
+    def return_token(self):
+        from .Bool import BoolClass
+
+        return BoolClass.name
+
+    def call(self, interpreter, arguments):
+        return interpreter.make_bool(len(self.instance.hamt) != 0)
+
+
+class SetToList(BaseInternalMethod):
+    name = make_internal_token("toList")
+
+    @property
+    def return_token(self):
+        from .List import ListClass
+
+        return ListClass.name
+
+    def call(self, interpreter, arguments):
+        from .List import ListInstance
+
+        return ListInstance(interpreter).set_values(*self.instance.hamt)
+
+
+class SetToString(BaseInternalMethod):
+    name = make_internal_token("toString")
+
+    @property
+    def return_token(self):
+        from .String import StringClass
+
+        return StringClass.name
+
+    def call(self, interpreter, arguments):
+        from .String import StringInstance
+
+        instance = self.instance
+        string = instance.cached_string
+        if string is None:
+            stringified = (interpreter.stringify(v, True) for v in instance.hamt)
+            string = f"{instance.klass.name.lexeme}({', '.join(stringified)})"
+            if instance.frozen:
+                instance.cached_string = string
+
+        return StringInstance(interpreter).set_value(string)
+
+
+class SetClass(BaseInternalClass):
+    name = make_internal_token("Set")
+    FIELDS = (
+        SetInit,
+        SetAdd,
+        SetRemove,
+        SetContains,
+        SetUnion,
+        SetIntersection,
+        SetDifference,
+        SetIterate,
+        SetEquals,
+        SetLength,
+        SetToBool,
+        SetToList,
+        SetToString,
+    )
+
+    @property
+    def instance_class(self):
+        return SetInstance
+
+    def upper_arity(self):
+        return float("inf")
+
+
+class SetInstance(BaseInternalInstance):
+    """A Set is immutable, every update returns a new Set sharing all but
+    O(log32 n) of its storage with the original through a persistent Hamt
+    whose keys are the items.
+
+    Its hash is computed from its items on first use and kept, as is its
+    string once the items are known to be frozen.
+    """
+
+    CLASS = SetClass
+
+    def __init__(self, interpreter):
+        super().__init__(interpreter)
+        self.hamt = Hamt()
+        self.clear_caches()
+
+    def clear_caches(self):
+        self.cached_hash = None
+        self.cached_string = None
+        self.cached_frozen = None
+
+    def set_values(self, items):
+        transient = TransientHamt(self.hamt)
+        for item in items:
+            transient.set(item, True)
+
+        self.hamt = transient.persistent()
+        self.clear_caches()
+        return self
+
+    def with_hamt(self, hamt: Hamt):
+        """A new Set of the same interpreter holding `hamt`."""
+        new_set = SetInstance(self.interpreter)
+        new_set.hamt = hamt
+        return new_set
+
+    @property
+    def frozen(self) -> bool:
+        if self.cached_frozen is None:
+            self.cached_frozen = all(map(is_frozen, self.hamt))
+        return self.cached_frozen
+
+    def __str__(self) -> str:
+        return (
+            self.internal_find_method("toString").call(self.klass.interpreter, []).value
+        )
+
+    def __iter__(self):
+        return iter(self.hamt)
+
+    def __eq__(self, other):
+        if self is other:
+            return True
+        if not isinstance(other, SetInstance):
+            return False
+        if self.cached_hash is not None and other.cached_hash is not None:
+            if self.cached_hash != other.cached_hash:
+                return False
+
+        return self.hamt.equals(other.hamt)
+
+    def __hash__(self):
+        if self.cached_hash is None:
+            self.cached_hash = hash(frozenset(self.hamt))
+        return self.cached_hash
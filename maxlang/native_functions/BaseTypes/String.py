@@ -1,4 +1,5 @@
 from __future__ import annotations
+from itertools import islice
 
 from ..main import (
     BaseInternalClass,
@@ -11,6 +12,10 @@ from maxlang.errors import InternalError
 from maxlang.parse.expressions import Parameter
 
 
+# Concatenations shorter than this are copied, longer ones build a rope
+ROPE_THRESHOLD = 256
+
+
 def set_value(instance: StringInstance, value: str):
     instance.value = value
     return instance
@@ -45,16 +50,16 @@ class StringAdd(BaseInternalMethod):
         ]
 
     def call(self, interpreter, arguments):
-        to_string_method = arguments[0].internal_find_method("toString")
-        string_value = to_string_method.call(interpreter, [])
-        if not is_instance(interpreter, string_value, StringClass.name):
-            raise InternalError(
-                f"toString method did not return a String for {arguments[0].class_name}."
-            )
+        string_value = arguments[0]
+        if type(string_value) is not StringInstance:
+            to_string_method = string_value.internal_find_method("toString")
+            string_value = to_string_method.call(interpreter, [])
+            if not is_instance(interpreter, string_value, StringClass.name):
+                raise InternalError(
+                    f"toString method did not return a String for {arguments[0].class_name}."
+                )
 
-        return StringInstance(interpreter).set_value(
-            self.instance.value + string_value.value
-        )
+        return self.instance.concat(string_value.value)
 
 
 class StringMultiply(BaseInternalMethod):
@@ -113,6 +118,36 @@ class StringEquals(BaseInternalMethod):
         )
 
 
+class StringJoin(BaseInternalMethod):
+    name = make_internal_token("join")
+
+    @property
+    def parameters(self):
+        return [Parameter(make_internal_token("items"))]
+
+    @property
+    def allowed_types(self):
+        from .List import ListClass
+
+        return [ListClass.name]
+
+    def call(self, interpreter, arguments):
+        from .List import ListClass
+
+        if not is_instance(interpreter, arguments[0], ListClass.name):
+            raise InternalError(
+                f"Cannot {self.name.lexeme} {arguments[0].class_name}, expected a List."
+            )
+
+        stringify = interpreter.stringify
+        return StringInstance(interpreter).set_value(
+            self.instance.value.join(
+                item.value if type(item) is StringInstance else str(stringify(item))
+                for item in arguments[0].vector
+            )
+        )
+
+
 class StringIterate(BaseInternalMethod):
     name = make_internal_token("iterate")
 
@@ -218,6 +253,7 @@ class StringClass(BaseInternalClass):
         StringAdd,
         StringMultiply,
         StringEquals,
+        StringJoin,
         StringIterate,
         StringToUpper,
         StringToLower,
@@ -242,16 +278,69 @@ class StringClass(BaseInternalClass):
 
 
 class StringInstance(BaseInternalInstance):
+    """A String is either flat, its text in `value`, or a rope built by
+    concatenation: the first `count` entries of `parts`, a list of texts it
+    may share with longer ropes built from it.
+
+    A rope has no `value` attribute until it is read, through __getattr__,
+    which joins the parts once. Reading a flat string costs nothing more
+    than an attribute lookup.
+    """
+
     CLASS = StringClass
+    frozen = True
 
     def __init__(self, interpreter):
         super().__init__(interpreter)
-        self.value = None
+        self.parts: list[str] | None = None
+        self.count = 0
+
+    def __getattr__(self, name):
+        # Only called for attributes missing from __dict__, the value of a rope
+        if name != "value":
+            raise AttributeError(name)
+
+        parts = self.__dict__.get("parts")
+        if parts is None:
+            return None
+        if len(parts) == self.count:
+            value = "".join(parts)
+        else:
+            value = "".join(islice(parts, self.count))
+        self.value = value
+        self.parts = None
+        return value
 
     def set_value(self, value):
         value = self.interpreter.stringify(value)
         return set_value(self, value)
 
+    def concat(self, text: str) -> StringInstance:
+        """This string followed by `text`, without copying long strings.
+
+        The result appends `text` to the parts of this rope when this rope
+        ends them, the usual case of a string grown in a loop, so repeated
+        concatenation is amortised O(1). Only a string concatenated twice
+        copies its list of parts, never the text itself.
+        """
+        result = StringInstance(self.interpreter)
+        parts = self.parts
+        if parts is None:
+            value = self.value
+            if len(value) + len(text) < ROPE_THRESHOLD:
+                result.value = value + text
+                return result
+            parts = [value, text]
+        elif len(parts) == self.count:
+            parts.append(text)
+        else:
+            parts = parts[: self.count]
+            parts.append(text)
+
+        result.parts = parts
+        result.count = len(parts)
+        return result
+
     def __str__(self):
         return str(self.value)
 
@@ -0,0 +1,22 @@
+from ..main import BaseInternalInstance
+from maxlang.errors import InternalError
+
+
+class BaseBuilderInstance(BaseInternalInstance):
+    """Mutable companion of an immutable collection, filled in place and then
+    published once with freeze()."""
+
+    def __init__(self, interpreter):
+        super().__init__(interpreter)
+        self.transient = None
+
+    def editable(self):
+        if self.transient is None:
+            raise InternalError(f"Cannot use {self.class_name} after freeze.")
+        return self.transient
+
+    def freeze_transient(self):
+        """The transient's final value, after which the builder is closed."""
+        transient = self.editable()
+        self.transient = None
+        return transient.persistent()
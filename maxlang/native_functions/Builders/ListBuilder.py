@@ -0,0 +1,165 @@
+from __future__ import annotations
+
+from ..main import (
+    BaseInternalClass,
+    BaseInternalMethod,
+    make_internal_token,
+)
+from ..vector import TransientVector
+from .BaseBuilder import BaseBuilderInstance
+from maxlang.errors import InternalError
+from maxlang.parse.expressions import Parameter
+
+
+class ListBuilderPush(BaseInternalMethod):
+    instance: ListBuilderInstance
+    name = make_internal_token("push")
+
+    @property
+    def parameters(self):
+        return [Parameter(make_internal_token("items"), is_varargs=True)]
+
+    @property
+    def return_token(self):
+        return ListBuilderClass.name
+
+    def call(self, interpreter, arguments):
+        transient = self.instance.editable()
+        for item in arguments[0].values:
+            transient.push(item)
+        return self.instance
+
+
+class ListBuilderSet(BaseInternalMethod):
+    instance: ListBuilderInstance
+    name = make_internal_token("set")
+
+    @property
+    def parameters(self):
+        return [
+            Parameter(make_internal_token("index")),
+            Parameter(make_internal_token("value")),
+        ]
+
+    @property
+    def allowed_types(self):
+        from ..BaseTypes.Int import IntClass
+
+        return [IntClass.name]
+
+    @property
+    def return_token(self):
+        return ListBuilderClass.name
+
+    def call(self, interpreter, arguments):
+        transient = self.instance.editable()
+        index = arguments[0].value
+        if index < 0 or index >= len(transient):
+            raise InternalError(f"Index {index} out of range")
+
+        transient.set(index, arguments[1])
+        return self.instance
+
+
+class ListBuilderGet(BaseInternalMethod):
+    instance: ListBuilderInstance
+    name = make_internal_token("get")
+
+    @property
+    def parameters(self):
+        return [Parameter(make_internal_token("other"))]
+
+    @property
+    def allowed_types(self):
+        from ..BaseTypes.Int import IntClass
+
+        return [IntClass.name]
+
+    @property
+    def return_token(self):
+        from ..BaseTypes.Object import ObjectClass
+
+        return ObjectClass.name
+
+    def call(self, interpreter, arguments):
+        try:
+            return self.instance.editable().get(arguments[0].value)
+        except IndexError:
+            raise InternalError(f"{arguments[0]} is not a valid index.")
+
+
+class ListBuilderLength(BaseInternalMethod):
+    instance: ListBuilderInstance
+    name = make_internal_token("length")
+
+    @property
+    def return_token(self):
+        from ..BaseTypes.Int import IntClass
+
+        return IntClass.name
+
+    def call(self, interpreter, arguments):
+        return interpreter.make_int(len(self.instance.editable()))
+
+
+class ListBuilderFreeze(BaseInternalMethod):
+    instance: ListBuilderInstance
+    name = make_internal_token("freeze")
+
+    @property
+    def return_token(self):
+        from ..BaseTypes.List import ListClass
+
+        return ListClass.name
+
+    def call(self, interpreter, arguments):
+        from ..BaseTypes.List import ListInstance
+
+        new_list = ListInstance(interpreter)
+        new_list.vector = self.instance.freeze_transient()
+        return new_list
+
+
+class ListBuilderToString(BaseInternalMethod):
+    instance: ListBuilderInstance
+    name = make_internal_token("toString")
+
+    @property
+    def return_token(self):
+        from ..BaseTypes.String import StringClass
+
+        return StringClass.name
+
+    def call(self, interpreter, arguments):
+        from ..BaseTypes.String import StringInstance
+
+        stringified = (
+            interpreter.stringify(v, True) for v in self.instance.editable()
+        )
+        return StringInstance(interpreter).set_value(
+            f"{self.instance.klass.name.lexeme}({', '.join(stringified)})"
+        )
+
+
+class ListBuilderClass(BaseInternalClass):
+    name = make_internal_token("ListBuilder")
+    FIELDS = (
+        ListBuilderPush,
+        ListBuilderSet,
+        ListBuilderGet,
+        ListBuilderLength,
+        ListBuilderFreeze,
+        ListBuilderToString,
+    )
+
+    @property
+    def instance_class(self):
+        return ListBuilderInstance
+
+
+class ListBuilderInstance(BaseBuilderInstance):
+    CLASS = ListBuilderClass
+
+    def set_value(self, value):
+        self.transient = TransientVector(value.vector)
+        return self
@@ -0,0 +1,189 @@
+from __future__ import annotations
+
+from ..main import (
+    BaseInternalClass,
+    BaseInternalMethod,
+    is_instance,
+    make_internal_token,
+)
+from ..hamt import TransientHamt
+from .BaseBuilder import BaseBuilderInstance
+from maxlang.errors import InternalError
+from maxlang.parse.expressions import Parameter
+
+
+class MapBuilderPush(BaseInternalMethod):
+    instance: MapBuilderInstance
+    name = make_internal_token("push")
+
+    @property
+    def parameters(self):
+        return [Parameter(make_internal_token("items"), is_varargs=True)]
+
+    @property
+    def allowed_types(self):
+        from ..BaseTypes.Pair import PairClass
+
+        return [PairClass.name]
+
+    @property
+    def return_token(self):
+        return MapBuilderClass.name
+
+    def call(self, interpreter, arguments):
+        from ..BaseTypes.Pair import PairClass
+
+        transient = self.instance.editable()
+        for item in arguments[0].values:
+            if not is_instance(interpreter, item, PairClass.name):
+                raise InternalError(
+                    f"Invalid value passed to {self.instance.class_name}."
+                )
+            transient.set(item.first, item.second)
+        return self.instance
+
+
+class MapBuilderSet(BaseInternalMethod):
+    instance: MapBuilderInstance
+    name = make_internal_token("set")
+
+    @property
+    def parameters(self):
+        return [
+            Parameter(make_internal_token("key")),
+            Parameter(make_internal_token("value")),
+        ]
+
+    @property
+    def return_token(self):
+        return MapBuilderClass.name
+
+    def call(self, interpreter, arguments):
+        self.instance.editable().set(arguments[0], arguments[1])
+        return self.instance
+
+
+class MapBuilderRemove(BaseInternalMethod):
+    instance: MapBuilderInstance
+    name = make_internal_token("remove")
+
+    @property
+    def parameters(self):
+        return [Parameter(make_internal_token("key"))]
+
+    @property
+    def return_token(self):
+        return MapBuilderClass.name
+
+    def call(self, interpreter, arguments):
+        try:
+            self.instance.editable().remove(arguments[0])
+        except KeyError:
+            raise InternalError(
+                f"Could not find key {arguments[0]} in {self.instance.class_name}."
+            )
+        return self.instance
+
+
+class MapBuilderGet(BaseInternalMethod):
+    instance: MapBuilderInstance
+    name = make_internal_token("get")
+
+    @property
+    def parameters(self):
+        return [Parameter(make_internal_token("key"))]
+
+    @property
+    def return_token(self):
+        from ..BaseTypes.Object import ObjectClass
+
+        return ObjectClass.name
+
+    def call(self, interpreter, arguments):
+        try:
+            return self.instance.editable()[arguments[0]]
+        except KeyError:
+            raise InternalError(
+                f"Could not find key {arguments[0]} in {self.instance.class_name}."
+            )
+
+
+class MapBuilderLength(BaseInternalMethod):
+    instance: MapBuilderInstance
+    name = make_internal_token("length")
+
+    @property
+    def return_token(self):
+        from ..BaseTypes.Int import IntClass
+
+        return IntClass.name
+
+    def call(self, interpreter, arguments):
+        return interpreter.make_int(len(self.instance.editable()))
+
+
+class MapBuilderFreeze(BaseInternalMethod):
+    instance: MapBuilderInstance
+    name = make_internal_token("freeze")
+
+    @property
+    def return_token(self):
+        from ..BaseTypes.Map import MapClass
+
+        return MapClass.name
+
+    def call(self, interpreter, arguments):
+        from ..BaseTypes.Map import MapInstance
+
+        new_map = MapInstance(interpreter)
+        new_map.hamt = self.instance.freeze_transient()
+        return new_map
+
+
+class MapBuilderToString(BaseInternalMethod):
+    instance: MapBuilderInstance
+    name = make_internal_token("toString")
+
+    @property
+    def return_token(self):
+        from ..BaseTypes.String import StringClass
+
+        return StringClass.name
+
+    def call(self, interpreter, arguments):
+        from ..BaseTypes.String import StringInstance
+
+        stringified = (
+            " -> ".join(
+                (interpreter.stringify(k, True), interpreter.stringify(v, True))
+            )
+            for k, v in self.instance.editable().items()
+        )
+        return StringInstance(interpreter).set_value(
+            f"{self.instance.klass.name.lexeme}({', '.join(stringified)})"
+        )
+
+
+class MapBuilderClass(BaseInternalClass):
+    name = make_internal_token("MapBuilder")
+    FIELDS = (
+        MapBuilderPush,
+        MapBuilderSet,
+        MapBuilderRemove,
+        MapBuilderGet,
+        MapBuilderLength,
+        MapBuilderFreeze,
+        MapBuilderToString,
+    )
+
+    @property
+    def instance_class(self):
+        return MapBuilderInstance
+
+
+class MapBuilderInstance(BaseBuilderInstance):
+    CLASS = MapBuilderClass
+
+    def set_value(self, value):
+        self.transient = TransientHamt(value.hamt)
+        return self
@@ -0,0 +1,100 @@
+from __future__ import annotations
+from abc import ABC, abstractmethod
+
+from ..main import BaseInternalMethod, make_internal_token
+from maxlang.errors import InternalError
+from .BaseIterator import BaseIteratorClass, BaseIteratorInstance
+
+
+class ArrayIteratorNext(BaseInternalMethod):
+    instance: BaseArrayIteratorInstance
+    name = make_internal_token("next")
+
+    @property
+    def return_token(self):
+        return self.instance.element_class.name
+
+    def call(self, interpreter, arguments):
+        from ..BaseTypes.Pair import PairInstance
+
+        # If we're past the end, return None (special marker for end-of-iteration)
+        if self.instance.current >= self.instance.limit:
+            return None
+
+        array = self.instance.value
+        value = array.box(array.view[self.instance.current])
+
+        # Create new iterator with incremented position
+        new_iterator = type(self.instance)(interpreter)
+        new_iterator.value = self.instance.value
+        new_iterator.limit = self.instance.limit
+        new_iterator.current = self.instance.current + 1
+
+        return PairInstance(interpreter).set_values(value, new_iterator)
+
+
+class IntArrayIteratorClass(BaseIteratorClass):
+    name = make_internal_token("IntArrayIterator")
+    FIELDS = (ArrayIteratorNext,)
+
+    @property
+    def instance_class(self):
+        return IntArrayIteratorInstance
+
+
+class FloatArrayIteratorClass(BaseIteratorClass):
+    name = make_internal_token("FloatArrayIterator")
+    FIELDS = (ArrayIteratorNext,)
+
+    @property
+    def instance_class(self):
+        return FloatArrayIteratorInstance
+
+
+class BaseArrayIteratorInstance(BaseIteratorInstance, ABC):
+    def __init__(self, interpreter):
+        super().__init__(interpreter)
+        self.value = None
+        self.limit: int = None
+        self.current = 0
+
+    @property
+    @abstractmethod
+    def element_class(self): ...
+
+    def set_value(self, value):
+        from ..BaseTypes.Array import BaseArrayInstance
+
+        if (
+            isinstance(value, BaseArrayInstance)
+            and value.element_class is self.element_class
+        ):
+            self.value = value
+            self.limit = len(value.view)
+        else:
+            raise InternalError(f"Invalid value passed to {self.class_name}.")
+
+        return self
+
+    def remaining(self):
+        return map(self.value.box, self.value.view[self.current : self.limit])
+
+
+class IntArrayIteratorInstance(BaseArrayIteratorInstance):
+    CLASS = IntArrayIteratorClass
+
+    @property
+    def element_class(self):
+        from ..BaseTypes.Int import IntClass
+
+        return IntClass
+
+
+class FloatArrayIteratorInstance(BaseArrayIteratorInstance):
+    CLASS = FloatArrayIteratorClass
+
+    @property
+    def element_class(self):
+        from ..BaseTypes.Float import FloatClass
+
+        return FloatClass
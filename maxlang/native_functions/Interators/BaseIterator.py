@@ -1,3 +1,5 @@
+from typing import Iterator
+
 from ..main import BaseInternalClass, BaseInternalInstance, BaseInternalMethod, make_internal_token
 
 
@@ -23,4 +25,9 @@ class BaseIteratorClass(BaseInternalClass):
 
 
 class BaseIteratorInstance(BaseInternalInstance):
-    pass
+    def remaining(self) -> Iterator | None:
+        """The values next() would produce from this position on, read
+        straight from the underlying storage. For loops use it instead of
+        allocating an iterator and a Pair on every step. None when the values
+        can only be read through next(), as for a user iterator."""
+        return None
@@ -23,7 +23,7 @@ class IntIteratorNext(BaseInternalMethod):
             return None
 
         # Get current value
-        value = self.instance.current
+        value = interpreter.make_int(self.instance.current)
 
         # Create new iterator with incremented position
         new_iterator = IntIteratorInstance(interpreter)
@@ -59,3 +59,6 @@ class IntIteratorInstance(BaseIteratorInstance):
             raise InternalError(f"Invalid value passed to {self.class_name}.")
 
         return self
+
+    def remaining(self):
+        return map(self.interpreter.make_int, range(self.current, self.limit))
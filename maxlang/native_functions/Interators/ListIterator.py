@@ -1,4 +1,5 @@
 from __future__ import annotations
+from itertools import islice
 
 from ..main import BaseInternalMethod, is_instance, make_internal_token
 from maxlang.errors import InternalError
@@ -22,8 +23,7 @@ class ListIteratorNext(BaseInternalMethod):
         if self.instance.current >= self.instance.limit:
             return None
 
-        # Get current value using _get_value method (List uses persistent structure)
-        value = self.instance.value._get_value(self.instance.current)
+        value = self.instance.value.vector.get(self.instance.current)
 
         # Create new iterator with incremented position
         new_iterator = ListIteratorInstance(interpreter)
@@ -59,8 +59,13 @@ class ListIteratorInstance(BaseIteratorInstance):
 
         if is_instance(self.interpreter, value, ListClass.name):
             self.value = value
-            self.limit = self.value._total_length()
+            self.limit = len(self.value.vector)
         else:
             raise InternalError(f"Invalid value passed to {self.class_name}.")
 
         return self
+
+    def remaining(self):
+        return islice(
+            self.value.vector.iterate_from(self.current), self.limit - self.current
+        )
@@ -1,4 +1,6 @@
 from __future__ import annotations
+from itertools import islice
+from typing import Iterator
 
 from ..main import BaseInternalMethod, is_instance, make_internal_token
 from maxlang.errors import InternalError
@@ -23,12 +25,13 @@ class MapIteratorNext(BaseInternalMethod):
             return None
 
         # Get current value
-        value = self.instance.pairs[self.instance.current]
+        value = self.instance.pair_at(self.instance.current)
 
         # Create new iterator with incremented position
         new_iterator = MapIteratorInstance(interpreter)
         new_iterator.value = self.instance.value
         new_iterator.pairs = self.instance.pairs
+        new_iterator.source = self.instance.source
         new_iterator.limit = self.instance.limit
         new_iterator.current = self.instance.current + 1
 
@@ -53,7 +56,10 @@ class MapIteratorInstance(BaseIteratorInstance):
 
         super().__init__(interpreter)
         self.value: MapClass = None
-        self.pairs: list[PairClass]
+        # Pairs read so far from the map, shared with the iterators next
+        # returns so each entry is only looked up once
+        self.pairs: list[PairClass] = []
+        self.source: Iterator[PairClass] = None
         self.limit: int = None
         self.current = 0
 
@@ -62,9 +68,18 @@ class MapIteratorInstance(BaseIteratorInstance):
 
         if is_instance(self.interpreter, value, MapClass.name):
             self.value = value
-            self.pairs = self.value.get_pairs()
-            self.limit = len(self.value.values)
+            self.source = self.value.iterate_pairs()
+            self.limit = len(self.value.hamt)
         else:
             raise InternalError(f"Invalid value passed to {self.class_name}.")
 
         return self
+
+    def pair_at(self, index: int):
+        while len(self.pairs) <= index:
+            self.pairs.append(next(self.source))
+        return self.pairs[index]
+
+    def remaining(self):
+        # A fresh walk of the trie, nothing needs to be kept for a for loop
+        return islice(self.value.iterate_pairs(), self.current, self.limit)
@@ -0,0 +1,84 @@
+from __future__ import annotations
+from itertools import islice
+from typing import Any, Iterator
+
+from ..main import BaseInternalMethod, is_instance, make_internal_token
+from maxlang.errors import InternalError
+from .BaseIterator import BaseIteratorClass, BaseIteratorInstance
+
+
+class SetIteratorNext(BaseInternalMethod):
+    instance: SetIteratorInstance
+    name = make_internal_token("next")
+
+    @property
+    def return_token(self):
+        from ..BaseTypes.Object import ObjectClass
+
+        return ObjectClass.name
+
+    def call(self, interpreter, arguments):
+        from ..BaseTypes.Pair import PairInstance
+
+        # If we're past the end, return None (special marker for end-of-iteration)
+        if self.instance.current >= self.instance.limit:
+            return None
+
+        # Get current value
+        value = self.instance.item_at(self.instance.current)
+
+        # Create new iterator with incremented position
+        new_iterator = SetIteratorInstance(interpreter)
+        new_iterator.value = self.instance.value
+        new_iterator.items = self.instance.items
+        new_iterator.source = self.instance.source
+        new_iterator.limit = self.instance.limit
+        new_iterator.current = self.instance.current + 1
+
+        return PairInstance(interpreter).set_values(value, new_iterator)
+
+
+class SetIteratorClass(BaseIteratorClass):
+    name = make_internal_token("SetIterator")
+    FIELDS = (SetIteratorNext,)
+
+    @property
+    def instance_class(self):
+        return SetIteratorInstance
+
+
+class SetIteratorInstance(BaseIteratorInstance):
+    CLASS = SetIteratorClass
+
+    def __init__(self, interpreter):
+        from ..BaseTypes.Set import SetClass
+
+        super().__init__(interpreter)
+        self.value: SetClass = None
+        # Items read so far from the set, shared with the iterators next
+        # returns so the trie is only walked once
+        self.items: list[Any] = []
+        self.source: Iterator[Any] = None
+        self.limit: int = None
+        self.current = 0
+
+    def set_value(self, value):
+        from ..BaseTypes.Set import SetClass
+
+        if is_instance(self.interpreter, value, SetClass.name):
+            self.value = value
+            self.source = iter(self.value.hamt)
+            self.limit = len(self.value.hamt)
+        else:
+            raise InternalError(f"Invalid value passed to {self.class_name}.")
+
+        return self
+
+    def item_at(self, index: int):
+        while len(self.items) <= index:
+            self.items.append(next(self.source))
+        return self.items[index]
+
+    def remaining(self):
+        # A fresh walk of the trie, nothing needs to be kept for a for loop
+        return islice(iter(self.value.hamt), self.current, self.limit)
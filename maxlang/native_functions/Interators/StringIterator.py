@@ -64,3 +64,6 @@ class StringIteratorInstance(BaseIteratorInstance):
             raise InternalError(f"Invalid value passed to {self.class_name}.")
 
         return self
+
+    def remaining(self):
+        return iter(self.value.value[self.current : self.limit])
@@ -1,4 +1,5 @@
 from __future__ import annotations
+from itertools import islice
 
 from ..main import BaseInternalMethod, is_instance, make_internal_token
 from maxlang.errors import InternalError
@@ -64,3 +65,6 @@ class VarArgsIteratorInstance(BaseIteratorInstance):
             raise InternalError(f"Invalid value passed to {self.class_name}.")
 
         return self
+
+    def remaining(self):
+        return islice(self.value.values, self.current, self.limit)
@@ -4,6 +4,7 @@ from .print import Print
 from .BaseTypes.List import ListClass
 from .BaseTypes.Map import MapClass
 from .BaseTypes.Pair import PairClass
+from .BaseTypes.Set import SetClass
 from .BaseTypes.Int import IntClass
 from .BaseTypes.Float import FloatClass
 from .BaseTypes.String import StringClass
@@ -12,12 +13,19 @@ from .BaseTypes.VarArgs import VarArgsClass
 from .BaseTypes.Void import VoidClass
 from .BaseTypes.Object import ObjectClass
 from .BaseTypes.Next import NextClass
+from .BaseTypes.IntArray import IntArrayClass
+from .BaseTypes.FloatArray import FloatArrayClass
 
 from .Interators.IntIterator import IntIteratorClass
 from .Interators.ListIterator import ListIteratorClass
 from .Interators.MapIterator import MapIteratorClass
+from .Interators.SetIterator import SetIteratorClass
 from .Interators.StringIterator import StringIteratorClass
 from .Interators.VarArgsIterator import VarArgsIteratorClass
+from .Interators.ArrayIterator import IntArrayIteratorClass, FloatArrayIteratorClass
+
+from .Builders.ListBuilder import ListBuilderClass
+from .Builders.MapBuilder import MapBuilderClass
 
 
 BUILTIN_TYPES = {
@@ -30,8 +38,11 @@ BUILTIN_TYPES = {
         BoolClass,
         ListClass,
         MapClass,
+        SetClass,
         PairClass,
         NextClass,
+        IntArrayClass,
+        FloatArrayClass,
     )
 }
 
@@ -59,8 +70,15 @@ INTERNAL_TYPES = {
         IntIteratorClass,
         ListIteratorClass,
         MapIteratorClass,
+        SetIteratorClass,
         StringIteratorClass,
         VarArgsIteratorClass,
+        IntArrayIteratorClass,
+        FloatArrayIteratorClass,
+
+        # Builders
+        ListBuilderClass,
+        MapBuilderClass,
     )
 }
 
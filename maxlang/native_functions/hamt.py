@@ -0,0 +1,497 @@
+from __future__ import annotations
+from typing import Any, Iterable, Iterator
+
+
+# Each level of the trie consumes BITS bits of a key's hash
+BITS = 5
+MASK = (1 << BITS) - 1
+HASH_MASK = (1 << 64) - 1
+
+_MISSING = object()
+
+
+def _hash(key: Any) -> int:
+    return hash(key) & HASH_MASK
+
+
+class BitmapNode:
+    """Trie node holding at most 32 entries, indexed by a bitmap.
+
+    Bit i of the bitmap is set when the entry for hash fragment i is
+    present, and its position among `entries` is the number of set bits
+    below it. An entry is either a (key, value) tuple or a child node.
+
+    Updates copy the node, unless they are made by the TransientHamt that
+    created it, identified by `owner`, which edits it in place.
+    """
+
+    __slots__ = ("bitmap", "entries", "owner")
+
+    def __init__(self, bitmap: int, entries: list, owner: object = None):
+        self.bitmap = bitmap
+        self.entries = entries
+        self.owner = owner
+
+    def edit(self, owner: object) -> BitmapNode:
+        if owner is not None and self.owner is owner:
+            return self
+        return BitmapNode(self.bitmap, self.entries.copy(), owner)
+
+    def find(self, shift: int, key_hash: int, key: Any) -> Any:
+        bit = 1 << ((key_hash >> shift) & MASK)
+        if not self.bitmap & bit:
+            return _MISSING
+
+        entry = self.entries[(self.bitmap & (bit - 1)).bit_count()]
+        if type(entry) is tuple:
+            return entry[1] if entry[0] == key else _MISSING
+        return entry.find(shift + BITS, key_hash, key)
+
+    def assoc(
+        self, shift: int, key_hash: int, key: Any, value: Any, owner: object = None
+    ):
+        """The node with `key` set to `value`, and whether the key is new."""
+        bit = 1 << ((key_hash >> shift) & MASK)
+        index = (self.bitmap & (bit - 1)).bit_count()
+
+        if not self.bitmap & bit:
+            node = self.edit(owner)
+            node.entries.insert(index, (key, value))
+            node.bitmap |= bit
+            return node, True
+
+        entry = self.entries[index]
+        if type(entry) is tuple:
+            if entry[0] == key:
+                if entry[1] is value:
+                    return self, False
+                replacement, added = (key, value), False
+            else:
+                entry_hash = _hash(entry[0])
+                replacement = _merge(
+                    shift + BITS, entry, entry_hash, key_hash, key, value, owner
+                )
+                added = True
+        else:
+            replacement, added = entry.assoc(
+                shift + BITS, key_hash, key, value, owner
+            )
+            # Either nothing changed or the child was edited in place
+            if replacement is entry:
+                return self, added
+
+        node = self.edit(owner)
+        node.entries[index] = replacement
+        return node, added
+
+    def without(self, shift: int, key_hash: int, key: Any, owner: object = None):
+        """The node without `key`, None once it is empty."""
+        bit = 1 << ((key_hash >> shift) & MASK)
+        if not self.bitmap & bit:
+            return self
+
+        index = (self.bitmap & (bit - 1)).bit_count()
+        entry = self.entries[index]
+        if type(entry) is tuple:
+            if entry[0] != key:
+                return self
+            replacement = None
+        else:
+            replacement = entry.without(shift + BITS, key_hash, key, owner)
+            if replacement is entry:
+                return self
+            # A child left with a single key is folded back into this node
+            if replacement is not None and replacement.single() is not None:
+                replacement = replacement.single()
+
+        node = self.edit(owner)
+        if replacement is None:
+            del node.entries[index]
+            if not node.entries:
+                return None
+            node.bitmap ^= bit
+            return node
+
+        node.entries[index] = replacement
+        return node
+
+    def single(self) -> tuple | None:
+        if len(self.entries) == 1 and type(self.entries[0]) is tuple:
+            return self.entries[0]
+        return None
+
+    def items(self) -> Iterator[tuple]:
+        for entry in self.entries:
+            if type(entry) is tuple:
+                yield entry
+            else:
+                yield from entry.items()
+
+
+class CollisionNode:
+    """Keys whose whole hashes are equal, searched linearly."""
+
+    __slots__ = ("key_hash", "entries", "owner")
+
+    def __init__(self, key_hash: int, entries: list, owner: object = None):
+        self.key_hash = key_hash
+        self.entries = entries
+        self.owner = owner
+
+    def edit(self, owner: object) -> CollisionNode:
+        if owner is not None and self.owner is owner:
+            return self
+        return CollisionNode(self.key_hash, self.entries.copy(), owner)
+
+    def find(self, shift: int, key_hash: int, key: Any) -> Any:
+        for entry_key, value in self.entries:
+            if entry_key == key:
+                return value
+        return _MISSING
+
+    def assoc(
+        self, shift: int, key_hash: int, key: Any, value: Any, owner: object = None
+    ):
+        if key_hash != self.key_hash:
+            # Nest this node under a bitmap node that can tell both hashes apart
+            bit = 1 << ((self.key_hash >> shift) & MASK)
+            return BitmapNode(bit, [self], owner).assoc(
+                shift, key_hash, key, value, owner
+            )
+
+        for index, (entry_key, entry_value) in enumerate(self.entries):
+            if entry_key == key:
+                if entry_value is value:
+                    return self, False
+                node = self.edit(owner)
+                node.entries[index] = (key, value)
+                return node, False
+
+        node = self.edit(owner)
+        node.entries.append((key, value))
+        return node, True
+
+    def without(self, shift: int, key_hash: int, key: Any, owner: object = None):
+        entries = [entry for entry in self.entries if entry[0] != key]
+        if len(entries) == len(self.entries):
+            return self
+        if not entries:
+            return None
+        return CollisionNode(self.key_hash, entries, owner)
+
+    def single(self) -> tuple | None:
+        return self.entries[0] if len(self.entries) == 1 else None
+
+    def items(self) -> Iterator[tuple]:
+        return iter(self.entries)
+
+
+def _merge(
+    shift: int,
+    entry: tuple,
+    entry_hash: int,
+    key_hash: int,
+    key: Any,
+    value: Any,
+    owner: object,
+):
+    """A node holding `entry` and the new (key, value)."""
+    if entry_hash == key_hash:
+        return CollisionNode(key_hash, [entry, (key, value)], owner)
+
+    entry_fragment = (entry_hash >> shift) & MASK
+    key_fragment = (key_hash >> shift) & MASK
+    if entry_fragment == key_fragment:
+        child = _merge(shift + BITS, entry, entry_hash, key_hash, key, value, owner)
+        return BitmapNode(1 << entry_fragment, [child], owner)
+
+    entries = [entry, (key, value)]
+    if key_fragment < entry_fragment:
+        entries.reverse()
+    return BitmapNode((1 << entry_fragment) | (1 << key_fragment), entries, owner)
+
+
+def _unshared_items(node, other) -> Iterator[tuple]:
+    """The entries of `node` outside the subtrees it shares with `other`, the
+    node at the same position in another trie."""
+    if node is other:
+        return
+    if type(node) is not BitmapNode or type(other) is not BitmapNode:
+        yield from node.items()
+        return
+
+    bitmap = node.bitmap
+    for entry in node.entries:
+        bit = bitmap & -bitmap
+        bitmap ^= bit
+        if other.bitmap & bit:
+            other_entry = other.entries[(other.bitmap & (bit - 1)).bit_count()]
+            if entry is other_entry:
+                continue
+            if type(entry) is not tuple and type(other_entry) is not tuple:
+                yield from _unshared_items(entry, other_entry)
+                continue
+
+        if type(entry) is tuple:
+            yield entry
+        else:
+            yield from entry.items()
+
+
+def _size(entry) -> int:
+    if type(entry) is tuple:
+        return 1
+    if type(entry) is CollisionNode:
+        return len(entry.entries)
+    return sum(1 if type(e) is tuple else _size(e) for e in entry.entries)
+
+
+def _filter(node, other, shift: int, inside: bool):
+    """The entries of `node` that are, when `inside`, or are not in `other`,
+    the node at the same position in another trie, with the number of
+    entries dropped.
+
+    Walks both tries in parallel: subtrees they share are kept or dropped
+    whole, and nodes where nothing is dropped are reused as they are. The
+    result is None when nothing is left, and a single entry is returned as
+    its (key, value) tuple for the parent to hold directly.
+    """
+    if node is other:
+        return (node, 0) if inside else (None, _size(node))
+
+    if type(node) is not BitmapNode or type(other) is not BitmapNode:
+        kept = [
+            entry
+            for entry in node.items()
+            if (other.find(shift, _hash(entry[0]), entry[0]) is not _MISSING)
+            is inside
+        ]
+        removed = _size(node) - len(kept)
+        if not removed:
+            return node, 0
+        if not kept:
+            return None, removed
+        if len(kept) == 1:
+            return kept[0], removed
+        if type(node) is CollisionNode:
+            return CollisionNode(node.key_hash, kept), removed
+
+        result = BitmapNode(0, [])
+        for key, value in kept:
+            result, _ = result.assoc(shift, _hash(key), key, value)
+        return result, removed
+
+    entries = []
+    bitmap = 0
+    removed = 0
+    remaining = node.bitmap
+    for entry in node.entries:
+        bit = remaining & -remaining
+        remaining ^= bit
+
+        if not other.bitmap & bit:
+            kept, dropped = (None, _size(entry)) if inside else (entry, 0)
+        else:
+            other_entry = other.entries[(other.bitmap & (bit - 1)).bit_count()]
+            if type(entry) is tuple:
+                key = entry[0]
+                if type(other_entry) is tuple:
+                    found = other_entry[0] == key
+                else:
+                    found = (
+                        other_entry.find(shift + BITS, _hash(key), key)
+                        is not _MISSING
+                    )
+                kept, dropped = (entry, 0) if found is inside else (None, 1)
+            elif type(other_entry) is tuple:
+                # A whole child of this node against a single key of the other
+                key = other_entry[0]
+                value = entry.find(shift + BITS, _hash(key), key)
+                if inside:
+                    kept = None if value is _MISSING else (key, value)
+                    dropped = _size(entry) - (kept is not None)
+                elif value is _MISSING:
+                    kept, dropped = entry, 0
+                else:
+                    kept, dropped = entry.without(shift + BITS, _hash(key), key), 1
+                    if kept is not None and kept.single() is not None:
+                        kept = kept.single()
+            else:
+                kept, dropped = _filter(entry, other_entry, shift + BITS, inside)
+
+        removed += dropped
+        if kept is not None:
+            entries.append(kept)
+            bitmap |= bit
+
+    if not removed:
+        return node, 0
+    if not entries:
+        return None, removed
+    if len(entries) == 1 and type(entries[0]) is tuple:
+        return entries[0], removed
+    return BitmapNode(bitmap, entries), removed
+
+
+class Hamt:
+    """Persistent hash map: a hash array mapped trie.
+
+    Keys are spread over 32-way nodes by successive 5-bit fragments of their
+    hash. get, set and remove touch O(log32 n) nodes; updates copy that path
+    and share every other node with the map they came from. The size is
+    kept up to date by each update, and iteration walks the trie without
+    collecting the keys first.
+    """
+
+    __slots__ = ("count", "root")
+
+    def __init__(self, count: int = 0, root: BitmapNode | None = None):
+        self.count = count
+        self.root = BitmapNode(0, []) if root is None else root
+
+    @classmethod
+    def from_items(cls, items: Iterable[tuple]) -> Hamt:
+        transient = TransientHamt(cls())
+        for key, value in items:
+            transient.set(key, value)
+        return transient.persistent()
+
+    def __len__(self) -> int:
+        return self.count
+
+    def __iter__(self) -> Iterator[Any]:
+        return (key for key, _ in self.root.items())
+
+    def __contains__(self, key: Any) -> bool:
+        return self.root.find(0, _hash(key), key) is not _MISSING
+
+    def items(self) -> Iterator[tuple]:
+        return self.root.items()
+
+    def get(self, key: Any, default: Any = None) -> Any:
+        value = self.root.find(0, _hash(key), key)
+        return default if value is _MISSING else value
+
+    def __getitem__(self, key: Any) -> Any:
+        value = self.root.find(0, _hash(key), key)
+        if value is _MISSING:
+            raise KeyError(key)
+        return value
+
+    def set(self, key: Any, value: Any) -> Hamt:
+        root, added = self.root.assoc(0, _hash(key), key, value)
+        if root is self.root:
+            return self
+        return Hamt(self.count + added, root)
+
+    def remove(self, key: Any) -> Hamt:
+        root = self.root.without(0, _hash(key), key)
+        if root is self.root:
+            return self
+        return Hamt(self.count - 1, root)
+
+    def equals(self, other: Hamt) -> bool:
+        """Same keys mapped to equal values, skipping the subtrees both maps
+        share: only the entries outside of them are looked up in `other`."""
+        if self.root is other.root:
+            return True
+        if self.count != other.count:
+            return False
+
+        find = other.root.find
+        for key, value in _unshared_items(self.root, other.root):
+            found = find(0, _hash(key), key)
+            if found is _MISSING or not (found is value or found == value):
+                return False
+        return True
+
+    def union(self, other: Hamt) -> Hamt:
+        """The keys of both maps, with the values of this one where both
+        have a key. The larger map is reused and only the entries of the
+        smaller one outside of their shared subtrees are inserted into it."""
+        if self.root is other.root or not other.count:
+            return self
+        if not self.count:
+            return other
+
+        if self.count >= other.count:
+            transient = TransientHamt(self)
+            for key, value in _unshared_items(other.root, self.root):
+                if key not in transient:
+                    transient.set(key, value)
+            if transient.count == self.count:
+                return self
+        else:
+            transient = TransientHamt(other)
+            for key, value in _unshared_items(self.root, other.root):
+                transient.set(key, value)
+
+        return transient.persistent()
+
+    def intersection(self, other: Hamt) -> Hamt:
+        """The entries of this map whose key is in `other`."""
+        return self._filtered(other, True)
+
+    def difference(self, other: Hamt) -> Hamt:
+        """The entries of this map whose key is not in `other`."""
+        return self._filtered(other, False)
+
+    def _filtered(self, other: Hamt, inside: bool) -> Hamt:
+        root, removed = _filter(self.root, other.root, 0, inside)
+        if not removed:
+            return self
+        if root is None:
+            return Hamt()
+        if type(root) is not BitmapNode:
+            return Hamt.from_items([root] if type(root) is tuple else root.items())
+        return Hamt(self.count - removed, root)
+
+
+class TransientHamt:
+    """A Hamt being updated in place, to build or bulk update a map without
+    creating a version per change.
+
+    Nodes copied from the source map are tagged with this transient's owner
+    token and edited in place from then on; the source map is never
+    modified. persistent() publishes the result, after which the transient
+    must not be used again.
+    """
+
+    __slots__ = ("count", "root", "owner")
+
+    def __init__(self, hamt: Hamt):
+        self.count = hamt.count
+        self.root = hamt.root
+        self.owner = object()
+
+    def __len__(self) -> int:
+        return self.count
+
+    def __contains__(self, key: Any) -> bool:
+        return self.root.find(0, _hash(key), key) is not _MISSING
+
+    def __getitem__(self, key: Any) -> Any:
+        value = self.root.find(0, _hash(key), key)
+        if value is _MISSING:
+            raise KeyError(key)
+        return value
+
+    def set(self, key: Any, value: Any):
+        self.root, added = self.root.assoc(0, _hash(key), key, value, self.owner)
+        self.count += added
+
+    def remove(self, key: Any):
+        key_hash = _hash(key)
+        if self.root.find(0, key_hash, key) is _MISSING:
+            raise KeyError(key)
+
+        root = self.root.without(0, key_hash, key, self.owner)
+        self.root = BitmapNode(0, [], self.owner) if root is None else root
+        self.count -= 1
+
+    def items(self) -> Iterator[tuple]:
+        return self.root.items()
+
+    def persistent(self) -> Hamt:
+        self.owner = None
+        return Hamt(self.count, self.root)
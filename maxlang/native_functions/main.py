@@ -4,7 +4,7 @@ from typing import TYPE_CHECKING
 from maxlang.parse.callable import InternalCallable, ClassCallable, InstanceCallable
 from maxlang.errors import InternalError
 from maxlang.parse.expressions import Lambda, Parameter
-from maxlang.lex import Token, TokenType
+from maxlang.lex import Token, internal_token
 
 if TYPE_CHECKING:
     from maxlang.parse.interpreter import Interpreter
@@ -15,7 +15,7 @@ def format_class_name(name: str):
 
 
 def make_internal_token(string: str) -> Token:
-    return Token(TokenType.IDENTIFIER, string, None, -1)
+    return internal_token(string)
 
 
 class BaseInternalFunction(InternalCallable):
@@ -32,9 +32,7 @@ class BaseInternalFunction(InternalCallable):
 
     @property
     def declaration(self):
-        return Lambda(
-            Token(TokenType.IDENTIFIER, self.name, None, -1), self.parameters, []
-        )
+        return Lambda(self.name, self.parameters, [])
 
     @property
     def return_token(self) -> Token:
@@ -56,9 +54,7 @@ class BaseInternalMethod(InternalCallable):
 
     @property
     def declaration(self):
-        return Lambda(
-            Token(TokenType.IDENTIFIER, self.name, None, -1), self.parameters, []
-        )
+        return Lambda(self.name, self.parameters, [])
 
     def lower_arity(self):
         return len(
@@ -129,13 +125,11 @@ class SharedIsNotTrue(BaseInternalMethod):
     name = make_internal_token("isNotTrue")
 
     def call(self, interpreter, arguments):
-        from .BaseTypes.Bool import BoolInstance
-
         try:
             bool_value = self.instance.internal_find_method("toBool").call(
                 interpreter, []
             )
-            return BoolInstance(interpreter).set_value(not bool_value.value)
+            return interpreter.make_bool(not bool_value.value)
         except KeyError:
             raise InternalError(
                 f"class {self.class_name} does not implement the toBool method."
@@ -152,20 +146,11 @@ class SharedIsInstance(BaseInternalMethod):
         return 1
 
     def call(self, interpreter, arguments: ClassCallable):
-        from .BaseTypes.Bool import BoolInstance
-
         arg = arguments[0]
         if not isinstance(arg, ClassCallable):
             raise InternalError("isInstance only accepts classes as arguments.")
 
-        if isinstance(self.instance, arg.instance_class):
-            return BoolInstance(interpreter).set_value(True)
-
-        for klass in self.instance.klass.superclasses:
-            if klass is arg:
-                return BoolInstance(interpreter).set_value(True)
-
-        return BoolInstance(interpreter).set_value(False)
+        return interpreter.make_bool(arg in self.instance.klass.ancestors)
 
 
 class BaseInternalClass(ClassCallable):
@@ -187,6 +172,7 @@ class BaseInternalClass(ClassCallable):
         self.interpreter = interpreter
         self.methods = {m.name.lexeme: m for m in self.FIELDS + self._COMMON_FIELDS}
         self.superclasses = []
+        self.ancestors = frozenset((self,))
         if hasattr(self, "init"):
             self.init()
 
@@ -252,10 +238,13 @@ class BaseInternalClass(ClassCallable):
 
 class BaseInternalInstance(InstanceCallable):
     CLASS = BaseInternalClass
+    # Whether neither the instance nor anything it holds can ever change, so
+    # values derived from it, like its string, can be cached on it
+    frozen = False
 
     def __init__(self, interpreter: Interpreter):
         self.interpreter = interpreter
-        self.klass = self.interpreter.environment.get(self.CLASS.name)
+        self.klass = interpreter.builtin_classes[self.CLASS.name.lexeme]
 
     @property
     def class_name(self):
@@ -271,15 +260,19 @@ class BaseInternalInstance(InstanceCallable):
         return self.klass
 
 
+def is_frozen(value) -> bool:
+    return value is None or getattr(value, "frozen", False)
+
+
 def is_instance(
     interpreter: Interpreter, instance: InstanceCallable, *class_names: Token
 ) -> bool:
+    """Whether instance belongs to one of the builtin classes, or inherits
+    from it. Only reads precomputed tables, so it never allocates."""
+    ancestors = instance.klass.ancestors
+    builtin_classes = interpreter.builtin_classes
     for class_name in class_names:
-        klass = interpreter.environment.get(class_name)
-        val = (
-            instance.internal_find_method("isInstance").call(interpreter, [klass]).value
-        )
-        if val:
+        if builtin_classes[class_name.lexeme] in ancestors:
             return True
 
     return False
@@ -0,0 +1,348 @@
+from __future__ import annotations
+from itertools import chain, islice
+from typing import Any, Iterable, Iterator
+
+
+# Each trie node holds up to WIDTH children, indexed by BITS bits of the index
+BITS = 5
+WIDTH = 1 << BITS
+MASK = WIDTH - 1
+
+
+class Vector:
+    """Persistent vector: a 32-way trie of full leaves plus a tail.
+
+    The last, possibly partial, leaf is kept apart as the tail, so pushing
+    and popping only copy it and touch the trie once every 32 items. Every
+    other update copies the path from the root to one leaf, O(log32 n)
+    nodes, and shares the rest with the previous version. Nodes are plain
+    lists that are never modified once a Vector can reach them.
+
+    The trie is left-packed: every leaf but the last one is full and nodes
+    on the right edge only hold the children in use.
+    """
+
+    __slots__ = ("count", "shift", "root", "tail")
+
+    def __init__(
+        self,
+        count: int = 0,
+        shift: int = BITS,
+        root: list | None = None,
+        tail: list | None = None,
+    ):
+        self.count = count
+        self.shift = shift
+        self.root = [] if root is None else root
+        self.tail = [] if tail is None else tail
+
+    @classmethod
+    def from_iterable(cls, values: Iterable[Any]) -> Vector:
+        """Build a vector bottom-up from its values in O(n)."""
+        values = list(values)
+        count = len(values)
+        if count <= WIDTH:
+            return cls(count, BITS, [], values)
+
+        tail_offset = ((count - 1) >> BITS) << BITS
+        nodes = [values[i : i + WIDTH] for i in range(0, tail_offset, WIDTH)]
+        shift = 0
+        while shift == 0 or len(nodes) > 1:
+            nodes = [nodes[i : i + WIDTH] for i in range(0, len(nodes), WIDTH)]
+            shift += BITS
+
+        return cls(count, shift, nodes[0], values[tail_offset:])
+
+    def __len__(self) -> int:
+        return self.count
+
+    def __iter__(self) -> Iterator[Any]:
+        return chain(chain.from_iterable(self.leaves()), self.tail)
+
+    def leaves(self) -> Iterator[list]:
+        """The full leaves of the trie, left to right."""
+        nodes = [self.root]
+        for _ in range(self.shift // BITS - 1):
+            nodes = chain.from_iterable(nodes)
+        return chain.from_iterable(nodes)
+
+    def iterate_from(self, start: int) -> Iterator[Any]:
+        """Values from `start` to the end, skipping whole leaves."""
+        if start >= self.tail_offset():
+            return iter(self.tail[start - self.tail_offset() :])
+
+        leaves = islice(self.leaves(), start >> BITS, None)
+        first = next(leaves)
+        return chain(first[start & MASK :], chain.from_iterable(leaves), self.tail)
+
+    def tail_offset(self) -> int:
+        return self.count - len(self.tail)
+
+    def equals(self, other: Vector) -> bool:
+        """Element-wise equality, skipping the nodes both vectors share.
+
+        Vectors of the same size have the same shape, so nodes at the same
+        position hold the same indexes and a node reached from both tries
+        is only compared once, by identity.
+        """
+        if self is other:
+            return True
+        if self.count != other.count:
+            return False
+        if self.shift != other.shift or len(self.tail) != len(other.tail):
+            return all(_same(x, y) for x, y in zip(self, other))
+
+        return _nodes_equal(self.tail, other.tail, 0) and _nodes_equal(
+            self.root, other.root, self.shift
+        )
+
+    def leaf_for(self, index: int) -> list:
+        if index >= self.count - len(self.tail):
+            return self.tail
+
+        node = self.root
+        for level in range(self.shift, 0, -BITS):
+            node = node[(index >> level) & MASK]
+        return node
+
+    def get(self, index: int) -> Any:
+        """The value at `index`, counting from the end when negative."""
+        if index < 0:
+            index += self.count
+        if not 0 <= index < self.count:
+            raise IndexError(f"Index {index} out of range")
+
+        return self.leaf_for(index)[index & MASK]
+
+    def set(self, index: int, value: Any) -> Vector:
+        if not 0 <= index < self.count:
+            raise IndexError(f"Index {index} out of range")
+
+        tail_offset = self.count - len(self.tail)
+        if index >= tail_offset:
+            tail = self.tail.copy()
+            tail[index - tail_offset] = value
+            return Vector(self.count, self.shift, self.root, tail)
+
+        return Vector(
+            self.count,
+            self.shift,
+            self._set_in(self.shift, self.root, index, value),
+            self.tail,
+        )
+
+    def _set_in(self, level: int, node: list, index: int, value: Any) -> list:
+        node = node.copy()
+        if level == 0:
+            node[index & MASK] = value
+        else:
+            child = (index >> level) & MASK
+            node[child] = self._set_in(level - BITS, node[child], index, value)
+        return node
+
+    def push(self, value: Any) -> Vector:
+        if len(self.tail) < WIDTH:
+            return Vector(self.count + 1, self.shift, self.root, [*self.tail, value])
+
+        shift, root = self._push_tail()
+        return Vector(self.count + 1, shift, root, [value])
+
+    def extend(self, values: Iterable[Any]) -> Vector:
+        transient = TransientVector(self)
+        for value in values:
+            transient.push(value)
+        if transient.count == self.count:
+            return self
+        return transient.persistent()
+
+    def _push_tail(self) -> tuple[int, list]:
+        """Move the full tail into the trie, returning the new shift and root."""
+        # The root is full, the trie grows one level
+        if (self.count >> BITS) > (1 << self.shift):
+            root = [self.root, self._new_path(self.shift, self.tail)]
+            return self.shift + BITS, root
+
+        return self.shift, self._push_tail_in(self.shift, self.root)
+
+    def _push_tail_in(self, level: int, node: list) -> list:
+        child = ((self.count - 1) >> level) & MASK
+        if level == BITS:
+            inserted = self.tail
+        elif child < len(node):
+            inserted = self._push_tail_in(level - BITS, node[child])
+        else:
+            inserted = self._new_path(level - BITS, self.tail)
+
+        node = node.copy()
+        if child < len(node):
+            node[child] = inserted
+        else:
+            node.append(inserted)
+        return node
+
+    def _new_path(self, level: int, leaf: list) -> list:
+        for _ in range(level // BITS):
+            leaf = [leaf]
+        return leaf
+
+    def pop(self) -> Vector:
+        """The vector without its last value."""
+        if self.count == 0:
+            raise IndexError("Cannot pop an empty vector")
+        if self.count == 1:
+            return Vector()
+        if len(self.tail) > 1:
+            return Vector(self.count - 1, self.shift, self.root, self.tail[:-1])
+
+        # The tail is emptied, the last leaf of the trie becomes the new tail
+        tail = self.leaf_for(self.count - 2)
+        root = self._pop_tail_in(self.shift, self.root)
+        shift = self.shift
+        if root is None:
+            root = []
+        if shift > BITS and len(root) == 1:
+            root = root[0]
+            shift -= BITS
+
+        return Vector(self.count - 1, shift, root, tail)
+
+    def _pop_tail_in(self, level: int, node: list) -> list | None:
+        child = ((self.count - 2) >> level) & MASK
+        if level > BITS:
+            popped = self._pop_tail_in(level - BITS, node[child])
+            if popped is None and child == 0:
+                return None
+            if popped is None:
+                return node[:child]
+            return [*node[:child], popped]
+
+        if child == 0:
+            return None
+        return node[:child]
+
+
+def _same(value: Any, other: Any) -> bool:
+    return value is other or value == other
+
+
+def _nodes_equal(node: list, other: list, level: int) -> bool:
+    if node is other:
+        return True
+    if len(node) != len(other):
+        return False
+    if level == 0:
+        return all(map(_same, node, other))
+    return all(_nodes_equal(x, y, level - BITS) for x, y in zip(node, other))
+
+
+class TransientVector:
+    """A Vector being updated in place, to build or bulk update a list
+    without creating a version per change.
+
+    Nodes shared with the source vector are copied the first time they are
+    written to and the copies, remembered by id in `owned`, are edited in
+    place from then on; the source vector is never modified. persistent()
+    publishes the result and gives up ownership, so later changes made
+    through the transient copy again instead of touching the result.
+    """
+
+    __slots__ = ("count", "shift", "root", "tail", "owned", "tail_owned")
+
+    def __init__(self, vector: Vector):
+        self.count = vector.count
+        self.shift = vector.shift
+        self.root = vector.root
+        self.tail = vector.tail
+        self.owned: set[int] = set()
+        self.tail_owned = False
+
+    def __len__(self) -> int:
+        return self.count
+
+    def __iter__(self) -> Iterator[Any]:
+        return iter(self.persistent_view())
+
+    def persistent_view(self) -> Vector:
+        """A Vector over the current nodes, only valid until the next edit."""
+        return Vector(self.count, self.shift, self.root, self.tail)
+
+    def get(self, index: int) -> Any:
+        return self.persistent_view().get(index)
+
+    def editable(self, node: list) -> list:
+        if id(node) in self.owned:
+            return node
+        node = node.copy()
+        self.owned.add(id(node))
+        return node
+
+    def push(self, value: Any):
+        if len(self.tail) == WIDTH:
+            self._push_tail()
+            self.tail = [value]
+            self.tail_owned = True
+        else:
+            if not self.tail_owned:
+                self.tail = self.tail.copy()
+                self.tail_owned = True
+            self.tail.append(value)
+        self.count += 1
+
+    def set(self, index: int, value: Any):
+        if not 0 <= index < self.count:
+            raise IndexError(f"Index {index} out of range")
+
+        tail_offset = self.count - len(self.tail)
+        if index >= tail_offset:
+            if not self.tail_owned:
+                self.tail = self.tail.copy()
+                self.tail_owned = True
+            self.tail[index - tail_offset] = value
+            return
+
+        self.root = node = self.editable(self.root)
+        for level in range(self.shift, 0, -BITS):
+            child = (index >> level) & MASK
+            node[child] = node = self.editable(node[child])
+        node[index & MASK] = value
+
+    def _push_tail(self):
+        """Move the full tail into the trie, as a leaf owned by the trie."""
+        leaf = self.tail
+        if self.tail_owned:
+            self.owned.add(id(leaf))
+
+        if (self.count >> BITS) > (1 << self.shift):
+            root = [self.root, self._new_path(self.shift, leaf)]
+            self.owned.add(id(root))
+            self.root = root
+            self.shift += BITS
+        else:
+            self.root = self._push_tail_in(self.shift, self.root, leaf)
+
+    def _push_tail_in(self, level: int, node: list, leaf: list) -> list:
+        node = self.editable(node)
+        child = ((self.count - 1) >> level) & MASK
+        if level == BITS:
+            inserted = leaf
+        elif child < len(node):
+            inserted = self._push_tail_in(level - BITS, node[child], leaf)
+        else:
+            inserted = self._new_path(level - BITS, leaf)
+
+        if child < len(node):
+            node[child] = inserted
+        else:
+            node.append(inserted)
+        return node
+
+    def _new_path(self, level: int, leaf: list) -> list:
+        for _ in range(level // BITS):
+            leaf = [leaf]
+            self.owned.add(id(leaf))
+        return leaf
+
+    def persistent(self) -> Vector:
+        self.owned = set()
+        self.tail_owned = False
+        return self.persistent_view()
@@ -1,4 +1,4 @@
-from .parser import Parser  # noqa: F401
+from .parser import Parser, StreamingParser  # noqa: F401
 from .ast_printer import AstPrinter  # noqa: F401
 from .interpreter import Interpreter  # noqa: F401
 from .resolver import Resolver  # noqa: F401
@@ -14,6 +14,9 @@ class AstPrinter(Visitor):
             expression.operator.lexeme, expression.left, expression.right
         )
 
+    def visit_interpolation(self, expression) -> str:
+        return self.parenthesize("interpolate", *expression.parts)
+
     def visit_grouping(self, expression) -> str:
         return self.parenthesize("group", expression.expression)
 
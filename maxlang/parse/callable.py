@@ -3,21 +3,22 @@ from typing import Any, TYPE_CHECKING
 
 from .expressions import Lambda, Parameter
 from .environment import Environment
-from maxlang.lex import Token, TokenType
+from maxlang.lex import Token, internal_token
 from maxlang.errors import InterpreterError, InternalError
 
 if TYPE_CHECKING:
     from .interpreter import Interpreter
 
 
-class Return(Exception):
-    def __init__(self, value):
-        self.value = value
-
+INIT = internal_token("init")
 
 # Sentinel value to indicate "no explicit return value" (different from "return null")
 _NO_RETURN_VALUE = object()
 
+# Stands for `return null`, since executing a statement returns None when the
+# statement completed without returning
+_NULL_RETURN_VALUE = object()
+
 
 class InternalCallable:
     def call(self, interpreter: "Interpreter", arguments: list[Any]) -> Any | None:
@@ -66,28 +67,26 @@ class FunctionCallable(InternalCallable):
         self.class_instance = class_instance
 
     def call(self, interpreter: "Interpreter", arguments: list[Any]):
+        # Parameters occupy the first slots of the function scope, in order
         environment = Environment(self.closure)
-        for i, argument in enumerate(arguments):
-            environment.define(self.declaration.params[i].name, argument)
-
-        try:
-            interpreter.execute_block(self.declaration.body, environment)
-        except Return as ret:
-            if ret.value is _NO_RETURN_VALUE:
-                return self.return_self()
+        environment.slots = list(arguments)
 
-            return ret.value
+        value = interpreter.execute_block(self.declaration.body, environment)
+        if value is None or value is _NO_RETURN_VALUE:
+            return self.return_self()
+        if value is _NULL_RETURN_VALUE:
+            return None
 
-        return self.return_self()
+        return value
 
     def bind(self, instance: InstanceCallable) -> FunctionCallable:
         environment = Environment(self.closure)
-        environment.define(Token(TokenType.IDENTIFIER, "self", None, -1), instance)
+        environment.slots.append(instance)
         return FunctionCallable(self.name, self.declaration, environment, instance)
 
     def return_self(self) -> Any | None:
         if self.class_instance is not None:
-            return self.closure.get_at(0, "self")
+            return self.closure.get_at(0, 0)
 
     @property
     def parameters(self):
@@ -117,6 +116,10 @@ class ClassCallable(InternalCallable):
         self.name = name
         self.superclasses = superclasses
         self.methods = methods
+        # The class itself and every class it inherits from, for isInstance
+        self.ancestors = frozenset(
+            {self}.union(*(superclass.ancestors for superclass in superclasses))
+        )
 
     @property
     def instance_class(self):
@@ -124,58 +127,49 @@ class ClassCallable(InternalCallable):
 
     def call(self, interpreter, arguments) -> InstanceCallable:
         instance = InstanceCallable(self)
-        initialiser = self.find_method(Token(TokenType.IDENTIFIER, "init", None, -1))
+        initialiser = self.find_method(INIT)
         if initialiser is not None:
             # Call init and check if it returns a map-like object
             result = initialiser.bind(instance).call(interpreter, arguments)
 
-            # If init returns a map (dict-like with field definitions), use it
-            if (
-                result is not None
-                and hasattr(result, "values")
-                and isinstance(result.values, dict)
-            ):
+            # If init returns a map (field definitions), use it
+            from maxlang.native_functions.BaseTypes.Map import MapInstance
+            from maxlang.native_functions.BaseTypes.String import StringInstance
+
+            if isinstance(result, MapInstance):
                 # Map-based init: create instance from returned map
-                from maxlang.native_functions.BaseTypes.Map import MapInstance
-                from maxlang.native_functions.BaseTypes.String import StringInstance
-
-                if isinstance(result, MapInstance):
-                    for key in result._all_keys():
-                        try:
-                            value = result._get_value(key)
-                            # Convert key to string
-                            if isinstance(key, StringInstance):
-                                field_name = key.value
-                            elif hasattr(key, "value"):
-                                field_name = str(key.value)
-                            else:
-                                field_name = str(key)
-                            instance.fields[field_name] = value
-                        except KeyError:
-                            pass
+                for key, value in result.items():
+                    # Convert key to string
+                    if isinstance(key, StringInstance):
+                        field_name = key.value
+                    elif hasattr(key, "value"):
+                        field_name = str(key.value)
+                    else:
+                        field_name = str(key)
+                    instance.fields[field_name] = value
         return instance
 
     def check_arity(self, arg_count: int) -> bool:
-        initialiser = self.find_method(Token(TokenType.IDENTIFIER, "init", None, -1))
+        initialiser = self.find_method(INIT)
         if initialiser is None:
             return arg_count == 0
         return initialiser.check_arity(arg_count)
 
     def upper_arity(self) -> int:
-        initialiser = self.find_method(Token(TokenType.IDENTIFIER, "init", None, -1))
+        initialiser = self.find_method(INIT)
         if initialiser is None:
             return 0
         return initialiser.upper_arity()
 
     def lower_arity(self) -> int:
-        initialiser = self.find_method(Token(TokenType.IDENTIFIER, "init", None, -1))
+        initialiser = self.find_method(INIT)
         if initialiser is None:
             return 0
         return initialiser.lower_arity()
 
     @property
     def parameters(self):
-        initialiser = self.find_method(Token(TokenType.IDENTIFIER, "init", None, -1))
+        initialiser = self.find_method(INIT)
         if initialiser is None:
             return []
         return initialiser.declaration.params
@@ -202,7 +196,7 @@ class ClassCallable(InternalCallable):
                 return value
 
     def internal_find_method(self, name: str):
-        return self.find_method(Token(TokenType.IDENTIFIER, name, None, -1))
+        return self.find_method(internal_token(name))
 
     @property
     def class_name(self):
@@ -230,7 +224,7 @@ class InstanceCopyMethod(InternalCallable):
         for arg in arguments:
             if not isinstance(arg, PairInstance):
                 raise InterpreterError(
-                    Token(TokenType.IDENTIFIER, "copy", None, -1),
+                    internal_token("copy"),
                     f"copy() arguments must be Pair objects (field -> value), got {type(arg)}",
                 )
 
@@ -245,7 +239,7 @@ class InstanceCopyMethod(InternalCallable):
                     modifications[field_path] = arg.second
             else:
                 raise InterpreterError(
-                    Token(TokenType.IDENTIFIER, "copy", None, -1),
+                    internal_token("copy"),
                     f"Field name must be a String, got {type(key)}",
                 )
 
@@ -275,7 +269,7 @@ class InstanceCopyMethod(InternalCallable):
             # Validate first field exists
             if first_field not in self.instance.fields:
                 raise InterpreterError(
-                    Token(TokenType.IDENTIFIER, "copy", None, -1),
+                    internal_token("copy"),
                     f"Cannot modify undefined field '{first_field}'. Class only defines: {', '.join(sorted(self.instance.fields.keys()))}",
                 )
 
@@ -283,7 +277,7 @@ class InstanceCopyMethod(InternalCallable):
             nested_obj = result.fields.get(first_field)
             if not isinstance(nested_obj, InstanceCallable):
                 raise InterpreterError(
-                    Token(TokenType.IDENTIFIER, "copy", None, -1),
+                    internal_token("copy"),
                     f"Cannot use nested path on non-object field '{first_field}'",
                 )
 
@@ -352,7 +346,7 @@ class InstanceCallable(InternalCallable):
         for field_name in modifications:
             if field_name not in self.fields:
                 raise InterpreterError(
-                    Token(TokenType.IDENTIFIER, field_name, None, -1),
+                    internal_token(field_name),
                     f"Cannot modify undefined field '{field_name}'. "
                     f"Class only defines: {', '.join(self.fields.keys())}",
                 )
@@ -9,8 +9,14 @@ VARIABLE_VALUE_SENTINEL = object()
 
 
 class Environment:
+    """A scope. Globals are looked up by name in `values`, locals resolved by the
+    Resolver live in `slots` and are addressed by (depth, slot)."""
+
+    __slots__ = ("values", "slots", "enclosing", "name")
+
     def __init__(self, enclosing: Environment | None = None, name: str | None = None):
         self.values: dict[str, Any] = {}
+        self.slots: list[Any] = []
         self.enclosing = enclosing
         self.name = name
 
@@ -23,12 +29,27 @@ class Environment:
 
         raise InterpreterError(name, f"Undefined variable '{name.lexeme}'.")
 
-    def get_at(self, distance: int, name: str):
-        return self.ancestor(distance).values.get(name)
+    def get_at(self, distance: int, slot: int):
+        environment = self
+        while distance:
+            environment = environment.enclosing
+            distance -= 1
+
+        return environment.slots[slot]
 
     def define(self, name: Token, value: Any = VARIABLE_VALUE_SENTINEL):
         self.values[name.lexeme] = value
 
+    def define_slot(self, slot: int, value: Any = VARIABLE_VALUE_SENTINEL):
+        slots = self.slots
+        if slot < len(slots):
+            slots[slot] = value
+            return
+
+        # Declarations skipped at runtime leave their slots unset
+        slots.extend([VARIABLE_VALUE_SENTINEL] * (slot - len(slots)))
+        slots.append(value)
+
     def ancestor(self, distance: int):
         environment = self
         for _ in range(distance):
@@ -49,5 +70,10 @@ class Environment:
         if not only_if_found:
             self.values[name.lexeme] = value
 
-    def assign_at(self, distance: int, name: Token, value: Any):
-        self.ancestor(distance).values[name.lexeme] = value
+    def assign_at(self, distance: int, slot: int, value: Any):
+        environment = self
+        while distance:
+            environment = environment.enclosing
+            distance -= 1
+
+        environment.slots[slot] = value
@@ -1,10 +1,11 @@
 from __future__ import annotations
 from dataclasses import dataclass, field
-from typing import Any, TYPE_CHECKING
+from typing import Any, ClassVar, TYPE_CHECKING
 
 from maxlang.lex.lexer import Token
 
 if TYPE_CHECKING:
+    from .inline_cache import InlineCache
     from .statements import Statement
     from .callable import FunctionCallable, ClassCallable
     from maxlang.native_functions.main import BaseInternalClass
@@ -17,6 +18,9 @@ class ExpressionVisitor:
     def visit_binary(self, expression: Binary):
         pass
 
+    def visit_interpolation(self, expression: Interpolation):
+        pass
+
     def visit_call(self, expression: Call):
         pass
 
@@ -66,7 +70,7 @@ class ExpressionVisitor:
         pass
 
 
-@dataclass
+@dataclass(slots=True)
 class Type:
     klass: FunctionCallable | ClassCallable | type[BaseInternalClass]
     token: Token
@@ -81,111 +85,161 @@ class Type:
     )  # Maps field names to their types (from init)
 
 
+def visitor_method_name(class_name: str) -> str:
+    snake_case = "".join(
+        "_" + char.lower() if char.isupper() else char for char in class_name
+    ).lstrip("_")
+    return f"visit_{snake_case}"
+
+
+def node(cls):
+    """Make an AST node class a slotted dataclass hashed by identity, so nodes
+    can key dicts however equal they compare."""
+    cls = dataclass(slots=True)(cls)
+    cls.__hash__ = object.__hash__
+    return cls
+
+
 @dataclass
 class Expression:
+    # Slotted by hand, node would recreate the class and break the
+    # super() of __init_subclass__
+    __slots__ = ()
+
+    # Name of the visitor method handling this node, computed once per class
+    visitor_method: ClassVar[str] = ""
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        cls.visitor_method = visitor_method_name(cls.__name__)
+
     def accept(self, visitor: ExpressionVisitor):
-        class_name = "".join(
-            "_" + char.lower() if char.isupper() else char
-            for char in self.__class__.__name__
-        ).lstrip("_")
-        func = getattr(visitor, f"visit_{class_name}")
-        return func(self)
+        return getattr(visitor, self.visitor_method)(self)
 
 
-@dataclass
+@node
 class Pair(Expression):
     left: Expression
     operator: Token
     right: Expression
 
 
-@dataclass
+@node
 class Binary(Expression):
     left: Expression
     operator: Token
     right: Expression
+    # Created by the interpreter the first time the node is evaluated
+    cache: InlineCache | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
 
 
-@dataclass
+@node
+class Interpolation(Expression):
+    """A string with interpolated expressions, its literal parts and the
+    expressions between them in source order, joined into a single String."""
+
+    token: Token
+    parts: list[Expression]
+    # Created by the interpreter the first time a part needs its toString
+    cache: InlineCache | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
+
+
+@node
 class Call(Expression):
     callee: Variable
     paren: Token
     arguments: list[Argument]
 
 
-@dataclass
+@node
 class Get(Expression):
     obj: Expression
     name: Token
+    # Created by the interpreter the first time the node is evaluated
+    cache: InlineCache | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
 
 
-@dataclass
+@node
 class Grouping(Expression):
     expression: Expression
 
 
-@dataclass
+@node
 class Literal(Expression):
     value: Any
     type_: Type
 
 
-@dataclass
+@node
 class Logical(Expression):
     left: Expression
     operator: Token
     right: Expression
 
 
-@dataclass
+@node
 class Set(Expression):
     obj: Expression
     name: Token
     value: Expression
 
 
-@dataclass
+@node
 class Super(Expression):
     keyword: Token
     method: Token
-
-    def __hash__(self):
-        return id(self)
+    # (depth, slot) of the variable, set by the Resolver unless it is global
+    local: tuple[int, int] | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
 
 
-@dataclass
+@node
 class Self(Expression):
     keyword: Token
-
-    def __hash__(self):
-        return id(self)
+    # (depth, slot) of the variable, set by the Resolver unless it is global
+    local: tuple[int, int] | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
 
 
-@dataclass
+@node
 class Unary(Expression):
     operator: Token
     right: Expression
+    # Created by the interpreter the first time the node is evaluated
+    cache: InlineCache | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
 
 
-@dataclass
+@node
 class Variable(Expression):
     name: Token
     type_: Type | None = None
+    # (depth, slot) of the variable, set by the Resolver unless it is global
+    local: tuple[int, int] | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
 
-    def __hash__(self):
-        return id(self)
 
-
-@dataclass
+@node
 class Assignment(Expression):
     name: Variable
     value: Expression
-
-    def __hash__(self):
-        return id(self)
+    # (depth, slot) of the variable, set by the Resolver unless it is global
+    local: tuple[int, int] | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
 
 
-@dataclass
+@node
 class Parameter:
     name: Token
     default: Expression | None = None
@@ -194,13 +248,13 @@ class Parameter:
     methods_called: list[Token] = field(default_factory=list)
 
 
-@dataclass
+@node
 class Argument(Expression):
     name: Token | None
     value: Expression
 
 
-@dataclass
+@node
 class Lambda(Expression):
     token: Token
     params: list[Parameter]
@@ -208,7 +262,7 @@ class Lambda(Expression):
     # return_logic
 
 
-@dataclass
+@node
 class IfExpression(Expression):
     condition: Expression
     then_branch: Statement
@@ -216,13 +270,13 @@ class IfExpression(Expression):
     keyword: Token
 
 
-@dataclass
+@node
 class Unpack(Expression):
     operator: Token
     expression: Expression
 
 
-@dataclass
+@node
 class FieldUpdate(Expression):
     obj: Expression
     operator: Token
@@ -0,0 +1,70 @@
+from __future__ import annotations
+from typing import Any, TYPE_CHECKING
+
+from maxlang.lex import Token, internal_token
+
+if TYPE_CHECKING:
+    from .callable import ClassCallable
+
+
+# Number of receiver classes a call site remembers before it stops caching
+POLYMORPHIC_LIMIT = 4
+
+
+class InlineCache:
+    """Method lookups of a single call site, keyed by the receiver's class.
+
+    The cache starts monomorphic, holding the methods of the first class it
+    sees. A second class turns it polymorphic, up to POLYMORPHIC_LIMIT
+    classes, after which the site is megamorphic and every lookup goes back
+    to ClassCallable.find_method. Classes never change their methods once
+    created, so entries stay valid for as long as the class is alive, which
+    the cache guarantees by holding on to it.
+    """
+
+    __slots__ = ("klass", "methods", "polymorphic", "megamorphic")
+
+    def __init__(self):
+        self.klass: ClassCallable | None = None
+        self.methods: dict[str, Any] = {}
+        self.polymorphic: dict[ClassCallable, dict[str, Any]] | None = None
+        self.megamorphic = False
+
+    def find(self, klass: ClassCallable, name: Token | str) -> Any | None:
+        """The unbound method `name` of `klass`, or None when it has none."""
+        lexeme = name if isinstance(name, str) else name.lexeme
+
+        if klass is self.klass:
+            methods = self.methods
+        elif self.polymorphic is not None and klass in self.polymorphic:
+            methods = self.polymorphic[klass]
+        else:
+            methods = self.add_class(klass)
+
+        method = methods.get(lexeme)
+        if method is None:
+            if isinstance(name, str):
+                name = internal_token(name)
+            method = klass.find_method(name)
+            if method is not None:
+                methods[lexeme] = method
+
+        return method
+
+    def add_class(self, klass: ClassCallable) -> dict[str, Any]:
+        if self.megamorphic:
+            return {}
+
+        if self.klass is None:
+            self.klass = klass
+            return self.methods
+
+        if self.polymorphic is None:
+            self.polymorphic = {}
+        elif len(self.polymorphic) + 1 >= POLYMORPHIC_LIMIT:
+            self.polymorphic = None
+            self.megamorphic = True
+            return {}
+
+        methods = self.polymorphic[klass] = {}
+        return methods
@@ -1,88 +1,306 @@
-from typing import Any, Callable
+from typing import Any, Callable, Iterator
+import operator
 
-from maxlang.lex import TokenType, Token
+from maxlang.lex import TokenType, Token, internal_token
 from .callable import (
     InternalCallable,
     FunctionCallable,
-    Return,
     ClassCallable,
     InstanceCallable,
+    INIT,
+    _NO_RETURN_VALUE,
+    _NULL_RETURN_VALUE,
 )
-from .expressions import ExpressionVisitor, Expression, Binary, Argument
-from .statements import StatementVisitor, Statement
+from .expressions import (
+    ExpressionVisitor,
+    Expression,
+    Binary,
+    Interpolation,
+    Literal,
+    Argument,
+    Get,
+    Set,
+    Unary,
+    Unpack,
+)
+from .statements import StatementVisitor, Statement, ForStatement
 from .environment import Environment, VARIABLE_VALUE_SENTINEL
+from .inline_cache import InlineCache
 from maxlang.native_functions import ALL_FUNCTIONS
 from maxlang.native_functions.main import BaseInternalInstance
 from maxlang.native_functions.BaseTypes.Pair import PairInstance
 from maxlang.native_functions.BaseTypes.Bool import BoolInstance
 from maxlang.native_functions.BaseTypes.String import StringInstance
+from maxlang.native_functions.BaseTypes.Int import IntInstance
+from maxlang.native_functions.BaseTypes.Float import FloatInstance
 from maxlang.native_functions.BaseTypes.VarArgs import VarArgsInstance
+from maxlang.native_functions.Interators.BaseIterator import BaseIteratorInstance
 from maxlang.errors import InterpreterError, InternalError
 
 
+# Operators computed directly on the values of native Int and Float operands,
+# spelled out the way the equals and greaterThan methods combine for them
+NUMBER_ARITHMETIC = {
+    TokenType.PLUS: operator.add,
+    TokenType.MINUS: operator.sub,
+    TokenType.STAR: operator.mul,
+}
+NUMBER_COMPARISONS = {
+    TokenType.GREATER: lambda left, right: left > right,
+    TokenType.GREATER_EQUAL: lambda left, right: left > right or left == right,
+    TokenType.LESS: lambda left, right: not left > right and not left == right,
+    TokenType.LESS_EQUAL: lambda left, right: not left > right,
+    TokenType.EQUAL_EQUAL: lambda left, right: left == right,
+    TokenType.BANG_EQUAL: lambda left, right: not left == right,
+}
+# The same comparisons between two Ints, which are never unordered, so the
+# Python operators agree with the ones above
+INT_COMPARISONS = {
+    TokenType.GREATER: operator.gt,
+    TokenType.GREATER_EQUAL: operator.ge,
+    TokenType.LESS: operator.lt,
+    TokenType.LESS_EQUAL: operator.le,
+    TokenType.EQUAL_EQUAL: operator.eq,
+    TokenType.BANG_EQUAL: operator.ne,
+}
+NUMBER_TYPES = (IntInstance, FloatInstance)
+
+# Ints handed out by make_int as one shared instance per value
+SMALL_INTS = range(-5, 257)
+
+
 class InterpreterBase:
-    def __init__(self, interpreter_error: Callable[[InterpreterError], None]):
+    def __init__(
+        self,
+        interpreter_error: Callable[[InterpreterError], None],
+        small_ints: range = SMALL_INTS,
+    ):
         self.interpreter_error = interpreter_error
-        self.locals: dict[Expression, int] = {}
 
         self.globals = Environment()
+        # Builtin classes by name, so natives never search the environment
+        self.builtin_classes: dict[str, ClassCallable] = {}
         for name, func in ALL_FUNCTIONS.items():
-            self.globals.define(name, func(self))
+            value = func(self)
+            if isinstance(value, ClassCallable):
+                self.builtin_classes[name.lexeme] = value
+            self.globals.define(name, value)
 
         self.environment = self.globals
 
         self.current_call: InternalCallable | None = None
 
+        # Values are immutable, so every true, false and small Int can share
+        # one instance per interpreter
+        self.true = BoolInstance(self).set_value(True)
+        self.false = BoolInstance(self).set_value(False)
+        if small_ints.step != 1:
+            raise ValueError("small_ints must be a contiguous range.")
+        self.small_ints = small_ints
+        self.int_cache: list[IntInstance | None] = [None] * len(small_ints)
+
     def execute(self, statement: Statement):
-        statement.accept(self)
+        """Execute a statement. Returns None unless a return statement ran,
+        in which case the returned value is passed up instead of raised."""
+        return statement.accept(self)
 
-    def resolve(self, expression: Expression, depth: int):
-        self.locals[expression] = depth
+    def resolve(self, node: Expression | Statement, depth: int, slot: int):
+        """Record where a local variable use or declaration lives, on its node."""
+        node.local = (depth, slot)
+
+    def declare(
+        self,
+        declaration: Statement,
+        name: Token,
+        value: Any = VARIABLE_VALUE_SENTINEL,
+    ):
+        """Define a declared name, in its slot when the Resolver gave it one."""
+        local = declaration.local
+        if local is None:
+            self.environment.define(name, value)
+        else:
+            self.environment.define_slot(local[1], value)
 
     def get_class(self, name: Token):
         return self.environment.get(name)
 
+    def make_bool(self, value: bool) -> BoolInstance:
+        return self.true if value else self.false
+
+    def make_int(self, value: int) -> IntInstance:
+        """Return an Int for value, shared when value is in small_ints."""
+        index = value - self.small_ints.start
+        if 0 <= index < len(self.int_cache):
+            instance = self.int_cache[index]
+            if instance is None:
+                instance = IntInstance(self).set_value(value)
+                self.int_cache[index] = instance
+            return instance
+        return IntInstance(self).set_value(value)
+
 
 class ExpressionInterpreter(InterpreterBase, ExpressionVisitor):
     def visit_binary(self, expression):
+        left = self.evaluate(expression.left)
+        right = self.evaluate(expression.right)
+        return self.binary_values(expression, left, right)
+
+    def binary_values(self, expression: Binary, left: Any, right: Any):
+        value = self.native_binary(expression.operator.type_, left, right)
+        if value is not None:
+            return value
+
         match expression.operator.type_:
             case TokenType.GREATER:
-                return self.binary_operation(expression, "greaterThan")
+                return self.binary_operation(expression, left, right, "greaterThan")
             case TokenType.GREATER_EQUAL:
-                is_greater = self.binary_operation(expression, "greaterThan").value
-                is_equal = self.binary_operation(expression, "equals").value
-                return BoolInstance(self).set_value(is_greater or is_equal)
+                is_greater = self.binary_operation(
+                    expression, left, right, "greaterThan"
+                ).value
+                is_equal = self.binary_operation(
+                    expression, left, right, "equals"
+                ).value
+                return self.make_bool(is_greater or is_equal)
             case TokenType.LESS:
-                is_greater = self.binary_operation(expression, "greaterThan").value
-                is_equal = self.binary_operation(expression, "equals").value
-                return BoolInstance(self).set_value(not is_greater and not is_equal)
+                is_greater = self.binary_operation(
+                    expression, left, right, "greaterThan"
+                ).value
+                is_equal = self.binary_operation(
+                    expression, left, right, "equals"
+                ).value
+                return self.make_bool(not is_greater and not is_equal)
             case TokenType.LESS_EQUAL:
-                is_greater = self.binary_operation(expression, "greaterThan").value
-                return BoolInstance(self).set_value(not is_greater)
+                is_greater = self.binary_operation(
+                    expression, left, right, "greaterThan"
+                ).value
+                return self.make_bool(not is_greater)
             case TokenType.BANG_EQUAL:
-                is_equal = self.binary_operation(expression, "equals").value
-                return BoolInstance(self).set_value(not is_equal)
+                is_equal = self.binary_operation(
+                    expression, left, right, "equals"
+                ).value
+                return self.make_bool(not is_equal)
             case TokenType.EQUAL_EQUAL:
-                return self.binary_operation(expression, "equals")
+                return self.binary_operation(expression, left, right, "equals")
             case TokenType.PLUS:
-                return self.binary_operation(expression, "add")
+                return self.binary_operation(expression, left, right, "add")
             case TokenType.MINUS:
-                return self.binary_operation(expression, "substract")
+                return self.binary_operation(expression, left, right, "substract")
             case TokenType.SLASH:
-                return self.binary_operation(expression, "divide")
+                return self.binary_operation(expression, left, right, "divide")
             case TokenType.STAR:
-                return self.binary_operation(expression, "multiply")
-            case TokenType.INTERPOLATION:
-                return self.binary_operation(expression, "add")
+                return self.binary_operation(expression, left, right, "multiply")
 
         raise ValueError("Max, you forgot to implement something!", expression.operator)
 
-    def binary_operation(self, expression: Binary, method_name: str):
-        left = self.evaluate(expression.left)
-        right = self.evaluate(expression.right)
+    def native_binary(self, operator_type: TokenType, left: Any, right: Any):
+        """Compute operators between native values without going through their
+        methods. Returns None when the operands are not covered, including
+        every operation that would raise, which is left to the methods."""
+        left_type = type(left)
+        right_type = type(right)
+
+        if left_type in NUMBER_TYPES and right_type in NUMBER_TYPES:
+            arithmetic = NUMBER_ARITHMETIC.get(operator_type)
+            if arithmetic is not None:
+                value = arithmetic(left.value, right.value)
+                if left_type is IntInstance and right_type is IntInstance:
+                    return self.make_int(value)
+                return FloatInstance(self).set_value(value)
+
+            comparison = NUMBER_COMPARISONS.get(operator_type)
+            if comparison is not None:
+                return self.make_bool(comparison(left.value, right.value))
+
+            if operator_type == TokenType.SLASH and right.value != 0:
+                return FloatInstance(self).set_value(left.value / right.value)
+
+            return None
 
+        if left_type is StringInstance:
+            if operator_type == TokenType.PLUS:
+                if right_type is StringInstance or right_type in NUMBER_TYPES:
+                    text = str(right.value)
+                elif right_type is BoolInstance:
+                    text = "true" if right.value else "false"
+                else:
+                    return None
+                return left.concat(text)
+
+            if operator_type == TokenType.STAR and right_type is IntInstance:
+                return StringInstance(self).set_value(left.value * right.value)
+
+        if left_type is right_type and left_type in (StringInstance, BoolInstance):
+            if operator_type == TokenType.EQUAL_EQUAL:
+                return self.make_bool(self.native_equals(left, right))
+            if operator_type == TokenType.BANG_EQUAL:
+                return self.make_bool(not self.native_equals(left, right))
+
+        return None
+
+    def visit_interpolation(self, expression):
+        # Literal parts are joined as they are, without a String each
+        values = [
+            (
+                part.value
+                if type(part) is Literal and type(part.value) is str
+                else self.evaluate(part)
+            )
+            for part in expression.parts
+        ]
+        return self.interpolate_values(expression, values)
+
+    def interpolate_values(self, expression: Interpolation, values: list[Any]):
+        """Join the values of the parts of an interpolation into one String,
+        each converted to text as String.add would. Literal parts may be
+        passed as the str they hold."""
+        texts = []
+        for value in values:
+            value_type = type(value)
+            if value_type is str:
+                texts.append(value)
+            elif value_type is StringInstance:
+                texts.append(value.value)
+            elif value_type in NUMBER_TYPES:
+                texts.append(str(value.value))
+            elif value_type is BoolInstance:
+                texts.append("true" if value.value else "false")
+            else:
+                texts.append(self.interpolated_text(expression, value))
+
+        return StringInstance(self).set_value("".join(texts))
+
+    def interpolated_text(self, expression: Interpolation, value: Any) -> str:
+        if value is None:
+            raise InterpreterError(
+                expression.token, "Cannot interpolate null into a String."
+            )
+
+        try:
+            method = self.find_method(expression, value, "toString")
+        except (InternalError, AttributeError):
+            raise InterpreterError(
+                expression.token,
+                f"{value.class_name} does not implement the toString method.",
+            )
+
+        string = self.call(expression.token, method, [])
+        if type(string) is not StringInstance:
+            raise InterpreterError(
+                expression.token,
+                f"toString method did not return a String for {value.class_name}.",
+            )
+        return string.value
+
+    def native_equals(self, left: Any, right: Any) -> bool:
+        if type(left) is BoolInstance:
+            return left.value is right.value
+        return left.value == right.value
+
+    def binary_operation(
+        self, expression: Binary, left: Any, right: Any, method_name: str
+    ):
         try:
-            method = left.internal_find_method(method_name)
+            method = self.find_method(expression, left, method_name)
             value = self.call(expression.operator, method, [right])
             return value
         except (KeyError, AttributeError):
@@ -97,9 +315,6 @@ class ExpressionInterpreter(InterpreterBase, ExpressionVisitor):
         return self.call(expression.paren, callee, arguments)
 
     def build_arguments(self, callee: InternalCallable, arguments: list[Argument]):
-        named_args = (arg for arg in arguments if arg.name is not None)
-        arguments_dict = {a.name.lexeme: a for a in named_args}
-
         args = []
         for argument in arguments:
             if argument.name is not None:
@@ -118,6 +333,27 @@ class ExpressionInterpreter(InterpreterBase, ExpressionVisitor):
             else:
                 args.append(value)
 
+        return self.finish_arguments(callee, args, arguments)
+
+    def flatten_unpacked(self, arguments: list[Any]) -> list[Any]:
+        """Expand the values of unpacked arguments in place."""
+        values = []
+        for value in arguments:
+            if isinstance(value, tuple) and len(value) == 2 and value[0] == "__unpack__":
+                values.extend(value[1])
+            else:
+                values.append(value)
+
+        return values
+
+    def finish_arguments(
+        self, callee: InternalCallable, args: list[Any], arguments: list[Argument]
+    ):
+        """Pack varargs and fill in named and default arguments after the
+        positional ones have been evaluated."""
+        named_args = (arg for arg in arguments if arg.name is not None)
+        arguments_dict = {a.name.lexeme: a for a in named_args}
+
         if callee.parameters and callee.parameters[-1].is_varargs:
             start_index = len(callee.parameters) - 1
             varargs = args[start_index:]
@@ -166,8 +402,62 @@ class ExpressionInterpreter(InterpreterBase, ExpressionVisitor):
             self.current_call = previous_call
             raise InterpreterError(token, str(e))
 
+    def callback(self, function: Any, arity: int) -> Callable[..., Any]:
+        """`function` as a Python callable taking `arity` arguments, for
+        natives calling back into the program once per element. What call
+        checks on every call is checked once, here."""
+        if not isinstance(function, InternalCallable) or isinstance(
+            function, InstanceCallable
+        ):
+            raise InternalError("Can only call functions and classes.")
+        if not function.check_arity(arity):
+            raise InternalError(
+                f"Expected a function taking {arity} arguments but got {function}."
+            )
+
+        call = function.call
+        parameters = function.parameters
+        # Defaults and varargs are filled in as for a call with positional
+        # arguments only, other functions take the arguments as they are
+        finish = None
+        if any(
+            parameter.default is not None or parameter.is_varargs
+            for parameter in parameters
+        ):
+            finish = self.finish_arguments
+
+        def run(*arguments):
+            previous_call = self.current_call
+            self.current_call = function
+            try:
+                if finish is None:
+                    return call(self, list(arguments))
+                return call(self, finish(function, list(arguments), []))
+            finally:
+                self.current_call = previous_call
+
+        return run
+
     def visit_get(self, expression):
-        obj = self.evaluate(expression.obj)
+        return self.get_property(expression, self.evaluate(expression.obj))
+
+    def get_property(self, expression: Get, obj: Any):
+        if type(obj) is InstanceCallable:
+            name = expression.name
+            if name.lexeme in obj.fields:
+                return obj.fields[name.lexeme]
+
+            # copy and undefined properties are left to InstanceCallable.get
+            if name.lexeme != "copy":
+                cache = expression.cache
+                if cache is None:
+                    cache = expression.cache = InlineCache()
+                method = cache.find(obj.klass, name)
+                if method is not None:
+                    return method.bind(obj)
+
+            return obj.get(name)
+
         if isinstance(obj, InstanceCallable):
             return obj.get(expression.name)
         if isinstance(obj, BaseInternalInstance):
@@ -179,7 +469,12 @@ class ExpressionInterpreter(InterpreterBase, ExpressionVisitor):
         if expression.type_.klass is None:
             # null literal - return None (used for end of iteration)
             return None
-        klass = self.get_class(expression.type_.klass.name)
+        # The builtin class, without searching the scopes for its name
+        klass = self.builtin_classes[expression.type_.klass.name.lexeme]
+        if klass.instance_class is BoolInstance:
+            return self.make_bool(expression.value)
+        if klass.instance_class is IntInstance:
+            return self.make_int(expression.value)
         try:
             return klass.instance_class(self).set_value(expression.value)
         except InternalError as e:
@@ -190,7 +485,7 @@ class ExpressionInterpreter(InterpreterBase, ExpressionVisitor):
 
     def visit_logical(self, expression):
         left = self.evaluate(expression.left)
-        isTrue = self.unary_operation(expression.operator, expression.left, "toBool")
+        isTrue = self.truthy(left, expression.operator)
 
         if expression.operator.type_ == TokenType.OR:
             if isTrue:
@@ -203,8 +498,13 @@ class ExpressionInterpreter(InterpreterBase, ExpressionVisitor):
 
     def visit_set(self, expression):
         obj = self.evaluate(expression.obj)
+        if not isinstance(obj, InstanceCallable):
+            raise InterpreterError(expression.name, "Only instances have fields.")
+
+        return self.set_property(expression, obj, self.evaluate(expression.value))
+
+    def set_property(self, expression: Set, obj: Any, value: Any):
         if isinstance(obj, InstanceCallable):
-            value = self.evaluate(expression.value)
             # set() now returns a new instance
             new_obj = obj.set(expression.name, value)
             return new_obj
@@ -212,26 +512,19 @@ class ExpressionInterpreter(InterpreterBase, ExpressionVisitor):
         raise InterpreterError(expression.name, "Only instances have fields.")
 
     def visit_super(self, expression):
-        distance = self.locals.get(expression)
-        superclasses: ClassCallable = self.environment.get_at(distance, "super")
-        obj: InstanceCallable = self.environment.get_at(distance - 1, "self")
+        distance, slot = expression.local
+        superclasses: ClassCallable = self.environment.get_at(distance, slot)
+        obj: InstanceCallable = self.environment.get_at(distance - 1, 0)
 
         if expression.method:
             method_name = expression.method
         elif isinstance(self.current_call, ClassCallable):
-            method_name = Token(
-                TokenType.IDENTIFIER, "init", None, expression.keyword.line
-            )
+            method_name = INIT
         else:
             method_name = (
                 self.current_call.name
                 if isinstance(self.current_call.name, Token)
-                else Token(
-                    TokenType.IDENTIFIER,
-                    self.current_call.name,
-                    None,
-                    expression.keyword.line,
-                )
+                else internal_token(self.current_call.name)
             )
 
         for superclass in superclasses:
@@ -239,8 +532,9 @@ class ExpressionInterpreter(InterpreterBase, ExpressionVisitor):
             if method is not None:
                 return method.bind(obj)
 
+        # Shared tokens have no line, the error is reported at super
         raise InterpreterError(
-            method_name,
+            expression.method or expression.keyword,
             f"'{method_name.lexeme}' not found in superclasses of {obj}.",
         )
 
@@ -248,15 +542,14 @@ class ExpressionInterpreter(InterpreterBase, ExpressionVisitor):
         return self.look_up_variable(expression.keyword, expression)
 
     def visit_unary(self, expression):
+        return self.unary_values(expression, self.evaluate(expression.right))
+
+    def unary_values(self, expression: Unary, right: Any):
         match expression.operator.type_:
             case TokenType.BANG:
-                return self.unary_operation(
-                    expression.operator, expression.right, "isNotTrue", "toBool"
-                )
+                return self.unary_operation(expression, right, "isNotTrue", "toBool")
             case TokenType.MINUS:
-                return self.unary_operation(
-                    expression.operator, expression.right, "negate"
-                )
+                return self.unary_operation(expression, right, "negate")
 
         return None
 
@@ -265,8 +558,9 @@ class ExpressionInterpreter(InterpreterBase, ExpressionVisitor):
         Handle unpacking of iterables using the * operator.
         Returns a special marker that build_arguments will expand.
         """
-        iterable = self.evaluate(expression.expression)
+        return self.unpack_values(expression, self.evaluate(expression.expression))
 
+    def unpack_values(self, expression: Unpack, iterable: Any):
         # Check if the object has an iterate method
         try:
             iterate_method = iterable.internal_find_method("iterate")
@@ -309,15 +603,14 @@ class ExpressionInterpreter(InterpreterBase, ExpressionVisitor):
 
     def unary_operation(
         self,
-        token: Token,
-        obj: Expression,
+        expression: Unary,
+        right: Any,
         method_name: str,
         error_method_name: str | None = None,
     ):
-        right = self.evaluate(obj)
-
+        token = expression.operator
         try:
-            method = right.internal_find_method(method_name)
+            method = self.find_method(expression, right, method_name)
             value = self.call(token, method, [])
             return value
         except KeyError:
@@ -326,22 +619,39 @@ class ExpressionInterpreter(InterpreterBase, ExpressionVisitor):
                 f"class {right.class_name} does not implement the {error_method_name or method_name} method.",
             )
 
+    def find_method(
+        self, expression: Binary | Unary | Interpolation, receiver: Any, name: str
+    ):
+        """Bind the method `name` of `receiver`. Instances of user classes go
+        through the inline cache of the node being evaluated, native instances
+        already find their methods with a single dict lookup."""
+        if type(receiver) is InstanceCallable:
+            cache = expression.cache
+            if cache is None:
+                cache = expression.cache = InlineCache()
+            method = cache.find(receiver.klass, name)
+            if method is not None:
+                return method.bind(receiver)
+
+        # Missing methods raise the receiver's own lookup error
+        return receiver.internal_find_method(name)
+
     def visit_variable(self, expression):
         return self.look_up_variable(expression.name, expression)
 
     def look_up_variable(self, name: Token, expression: Expression):
-        distance = self.locals.get(expression)
-        if distance is not None:
-            return self.environment.get_at(distance, name.lexeme)
+        local = expression.local
+        if local is not None:
+            return self.environment.get_at(*local)
         else:
             return self.globals.get(name)
 
     def visit_assignment(self, expression):
         value = self.evaluate(expression.value)
 
-        distance = self.locals.get(expression)
-        if distance is not None:
-            self.environment.assign_at(distance, expression.name, value)
+        local = expression.local
+        if local is not None:
+            self.environment.assign_at(*local, value)
         else:
             self.globals.assign(expression.name.name, value)
         return value
@@ -379,25 +689,29 @@ class ExpressionInterpreter(InterpreterBase, ExpressionVisitor):
         )
 
         # Call copy() on the object
-        copy_method = obj.get(Token(TokenType.IDENTIFIER, "copy", None, -1))
+        copy_method = obj.get(internal_token("copy"))
         return copy_method.call(self, [pair])
 
     def visit_if_expression(self, expression):
-        isTrue = self.evaluate(expression.condition)
+        if self.is_true(expression.condition, expression.keyword):
+            return self.evaluate(expression.then_branch)
+        else:
+            return self.evaluate(expression.else_branch)
+
+    def is_true(self, condition: Expression, keyword: Token) -> bool:
+        return self.truthy(self.evaluate(condition), keyword)
 
+    def truthy(self, isTrue: Any, keyword: Token) -> bool:
         if not isinstance(isTrue, BoolInstance):
             try:
                 isTrue = isTrue.internal_find_method("toBool").call(self, [])
             except KeyError:
                 raise InterpreterError(
-                    expression.keyword,
+                    keyword,
                     f"class {isTrue.class_name} does not implement the toBool method.",
                 )
 
-        if isTrue.value:
-            return self.evaluate(expression.then_branch)
-        else:
-            return self.evaluate(expression.else_branch)
+        return isTrue.value
 
     def evaluate(self, expression: Expression):
         return expression.accept(self)
@@ -432,10 +746,10 @@ class StatementInterpreter(ExpressionInterpreter, StatementVisitor):
         function = FunctionCallable(
             statement.name, statement.function, self.environment
         )
-        self.environment.define(statement.name, function)
+        self.declare(statement, statement.name, function)
 
     def visit_block(self, statement):
-        self.execute_block(statement.statements, Environment(self.environment))
+        return self.execute_block(statement.statements, Environment(self.environment))
 
     def visit_class(self, statement):
         superclasses: list[Any] = []
@@ -443,12 +757,9 @@ class StatementInterpreter(ExpressionInterpreter, StatementVisitor):
             eval_superclass = self.evaluate(superclass)
             superclasses.append(eval_superclass)
 
-        self.environment.define(statement.name)
+        self.declare(statement, statement.name)
         self.environment = Environment(self.environment)
-
-        self.environment.define(
-            Token(TokenType.IDENTIFIER, "super", None, -1), superclasses
-        )
+        self.environment.slots.append(superclasses)
 
         methods: dict[str, FunctionCallable] = {}
         for method in statement.methods:
@@ -458,72 +769,78 @@ class StatementInterpreter(ExpressionInterpreter, StatementVisitor):
         klass = ClassCallable(statement.name, superclasses, methods)
 
         self.environment = self.environment.enclosing
-        self.environment.assign(statement.name, klass)
+        self.declare(statement, statement.name, klass)
 
     def visit_variable_statement(self, statement):
         value = VARIABLE_VALUE_SENTINEL
         if statement.initializer is not None:
             value = self.evaluate(statement.initializer)
 
-        self.environment.define(statement.name, value)
-        return statement.name
+        self.declare(statement, statement.name, value)
 
     def visit_return_statement(self, statement):
-        from .callable import _NO_RETURN_VALUE
-
-        value = _NO_RETURN_VALUE
-        if statement.value is not None:
-            value = self.evaluate(statement.value)
+        if statement.value is None:
+            return _NO_RETURN_VALUE
 
-        raise Return(value)
+        value = self.evaluate(statement.value)
+        return _NULL_RETURN_VALUE if value is None else value
 
     def visit_while_statement(self, statement):
-        while self.evaluate(statement.condition):
-            self.execute(statement.body)
+        while self.is_true(statement.condition, statement.keyword):
+            value = self.execute(statement.body)
+            if value is not None:
+                return value
 
     def visit_if_statement(self, statement):
-        isTrue = self.evaluate(statement.condition)
-
-        if not isinstance(isTrue, BoolInstance):
-            try:
-                isTrue = isTrue.internal_find_method("toBool").call(self, [])
-            except KeyError:
-                raise InterpreterError(
-                    statement.keyword,
-                    f"class {isTrue.class_name} does not implement the toBool method.",
-                )
-
-        if isTrue.value:
-            self.execute(statement.then_branch)
+        if self.is_true(statement.condition, statement.keyword):
+            return self.execute(statement.then_branch)
         elif statement.else_branch is not None:
-            self.execute(statement.else_branch)
+            return self.execute(statement.else_branch)
 
     def visit_for_statement(self, statement):
         previous = self.environment
         self.environment = Environment(self.environment)
 
-        in_name = self.evaluate(statement.in_name)
         try:
-            iterator = in_name.internal_find_method("iterate").call(self, [])
-        except InternalError:
-            raise InterpreterError(
-                statement.keyword,
-                "Cannot iterate over instance of that does not implement 'iterate'.",
-            )
+            in_name = self.evaluate(statement.in_name)
 
-        while True:
-            pair = self.get_next(iterator, statement)
+            for item in self.iterate(in_name, statement):
+                self.declare(statement.for_name, statement.for_name.name, item)
 
-            if pair is None:
-                break
+                value = self.execute_block(statement.body, self.environment)
+                if value is not None:
+                    return value
+        finally:
+            self.environment = previous
 
-            self.environment.define(statement.for_name.name, pair.first)
+    def iterate(self, in_name: Any, statement: ForStatement) -> Iterator:
+        """The values a for loop over in_name goes through. Native iterators
+        hand out their storage directly, user iterators go through next()."""
+        iterator = self.get_iterator(in_name, statement)
+        if isinstance(iterator, BaseIteratorInstance):
+            values = iterator.remaining()
+            if values is not None:
+                return values
 
-            self.execute_block(statement.body, self.environment)
+        return self.follow_next(iterator, statement)
+
+    def follow_next(self, iterator: Any, statement: ForStatement) -> Iterator:
+        while True:
+            pair = self.get_next(iterator, statement)
+            if pair is None:
+                return
 
+            yield pair.first
             iterator = pair.second
 
-        self.environment = previous
+    def get_iterator(self, in_name, statement):
+        try:
+            return in_name.internal_find_method("iterate").call(self, [])
+        except InternalError:
+            raise InterpreterError(
+                statement.keyword,
+                "Cannot iterate over instance of that does not implement 'iterate'.",
+            )
 
     def get_next(self, iterator, statement):
         try:
@@ -535,13 +852,17 @@ class StatementInterpreter(ExpressionInterpreter, StatementVisitor):
             )
 
     def execute_block(self, statements: list[Statement], environment: Environment):
+        """Execute statements in environment. Returns None, or the value of
+        the return statement that ended the block."""
         previous = self.environment
 
         try:
             self.environment = environment
 
             for statement in statements:
-                self.execute(statement)
+                value = self.execute(statement)
+                if value is not None:
+                    return value
         finally:
             self.environment = previous
 
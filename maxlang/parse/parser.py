@@ -1,10 +1,12 @@
-from typing import Callable
+from enum import IntEnum
+from typing import Callable, Iterator
 
 from maxlang.lex import Token
 from maxlang.lex import TokenType
 from .expressions import (
     Expression,
     Binary,
+    Interpolation,
     Unary,
     Literal,
     Grouping,
@@ -45,6 +47,87 @@ from maxlang.native_functions.BaseTypes.Int import IntClass
 from maxlang.native_functions.BaseTypes.String import StringClass
 
 
+class Precedence(IntEnum):
+    """How tightly infix operators bind their operands, loosest first."""
+
+    OR = 1
+    AND = 2
+    EQUALITY = 3
+    COMPARISON = 4
+    PAIR = 5
+    FIELD_UPDATE = 6
+    TERM = 7
+    FACTOR = 8
+
+
+# The precedence of each infix operator and the node joining its operands.
+# All of them are left associative.
+INFIX_OPERATORS: dict[TokenType, tuple[Precedence, type[Expression]]] = {
+    TokenType.OR: (Precedence.OR, Logical),
+    TokenType.AND: (Precedence.AND, Logical),
+    TokenType.BANG_EQUAL: (Precedence.EQUALITY, Binary),
+    TokenType.EQUAL_EQUAL: (Precedence.EQUALITY, Binary),
+    TokenType.GREATER: (Precedence.COMPARISON, Binary),
+    TokenType.GREATER_EQUAL: (Precedence.COMPARISON, Binary),
+    TokenType.LESS: (Precedence.COMPARISON, Binary),
+    TokenType.LESS_EQUAL: (Precedence.COMPARISON, Binary),
+    TokenType.RIGHT_ARROW: (Precedence.PAIR, Pair),
+    TokenType.COLON: (Precedence.FIELD_UPDATE, FieldUpdate),
+    TokenType.MINUS: (Precedence.TERM, Binary),
+    TokenType.PLUS: (Precedence.TERM, Binary),
+    TokenType.SLASH: (Precedence.FACTOR, Binary),
+    TokenType.STAR: (Precedence.FACTOR, Binary),
+}
+
+PREFIX_OPERATORS = (TokenType.BANG, TokenType.MINUS)
+
+# Literals whose value is the literal of their token
+LITERAL_CLASSES = {
+    TokenType.INT: IntClass,
+    TokenType.FLOAT: FloatClass,
+    TokenType.STRING: StringClass,
+}
+
+# Literals whose value is fixed by their keyword, with its class
+KEYWORD_LITERALS = {
+    TokenType.FALSE: (False, BoolClass),
+    TokenType.TRUE: (True, BoolClass),
+    TokenType.NULL: (None, None),
+}
+
+
+class TokenWindow:
+    """The tokens of an iterator, indexed like the list Parser reads.
+
+    Tokens are taken from the iterator when first indexed and released once
+    the parser moved past them, so only the previous token and the lookahead
+    are held. Indexing past the end returns the last token, EOF.
+    """
+
+    def __init__(self, tokens: Iterator[Token]):
+        self.tokens = tokens
+        self.window: list[Token] = []
+        # Index of the first token of the window
+        self.offset = 0
+
+    def __getitem__(self, index: int) -> Token:
+        position = index - self.offset
+        window = self.window
+        while position >= len(window):
+            token = next(self.tokens, None)
+            if token is None:
+                return window[-1]
+            window.append(token)
+
+        return window[position]
+
+    def release(self, index: int):
+        """Drop the tokens before index."""
+        if index > self.offset:
+            del self.window[: index - self.offset]
+            self.offset = index
+
+
 class ParserControl:
     def __init__(
         self, tokens: list[Token], error_callback: Callable[[Token, str], None]
@@ -57,10 +140,9 @@ class ParserControl:
         self.current = 0
 
     def match(self, *token_types: TokenType) -> bool:
-        for token_type in token_types:
-            if self.check(token_type):
-                self.advance()
-                return True
+        if self.check(*token_types):
+            self.advance()
+            return True
 
         return False
 
@@ -68,10 +150,8 @@ class ParserControl:
         if TokenType.NEWLINE not in token_types:
             self.skip_newlines()
 
-        if self.is_at_end():
-            return False
-
-        return any(self.peek().type_ == type_ for type_ in token_types)
+        type_ = self.peek().type_
+        return type_ in token_types and type_ is not TokenType.EOF
 
     def check_next(self, *token_types: TokenType) -> bool:
         if self.is_at_end() or self.peek_next().type_ == TokenType.EOF:
@@ -112,8 +192,8 @@ class ParserControl:
         return ParserError(message)
 
     def skip_newlines(self):
-        while self.match(TokenType.NEWLINE):
-            pass
+        while self.peek().type_ is TokenType.NEWLINE:
+            self.advance()
 
     def synchronize(self):
         self.advance()
@@ -160,162 +240,111 @@ class ExpressionsParser(ParserControl):
         return expression
 
     def interpolation_expression(self) -> Expression:
-        expression = self.or_expression()
+        expression = self.binary(Precedence.OR)
+        if not self.check(TokenType.INTERPOLATION):
+            return expression
 
+        token = self.peek()
+        parts = [expression]
         while self.match(TokenType.INTERPOLATION):
-            operator = self.previous()
-            right = self.or_expression()
-            expression = Binary(expression, operator, right)
-
-        return expression
-
-    def or_expression(self) -> Expression:
-        expression = self.and_expression()
-
-        while self.match(TokenType.OR):
-            operator = self.previous()
-            right = self.and_expression()
-            expression = Logical(expression, operator, right)
-
-        return expression
-
-    def and_expression(self) -> Expression:
-        expression = self.equality()
-
-        while self.match(TokenType.AND):
-            operator = self.previous()
-            right = self.equality()
-            expression = Logical(expression, operator, right)
-
-        return expression
-
-    def equality(self) -> Expression:
-        expression = self.comparison()
+            parts.append(self.binary(Precedence.OR))
 
-        while self.match(TokenType.BANG_EQUAL, TokenType.EQUAL_EQUAL):
-            operator = self.previous()
-            right = self.comparison()
-            expression = Binary(expression, operator, right)
+        return Interpolation(token, parts)
 
-        return expression
-
-    def comparison(self) -> Expression:
-        expression = self.pair()
-
-        while self.match(
-            TokenType.GREATER,
-            TokenType.GREATER_EQUAL,
-            TokenType.LESS,
-            TokenType.LESS_EQUAL,
-        ):
-            operator = self.previous()
-            right = self.pair()
-            expression = Binary(expression, operator, right)
-
-        return expression
-
-    def pair(self) -> Expression:
-        expression = self.field_update()
-
-        while self.match(TokenType.RIGHT_ARROW):
-            operator = self.previous()
-            right = self.field_update()
-            expression = Pair(expression, operator, right)
-
-        return expression
-
-    def field_update(self) -> Expression:
-        expression = self.term()
-
-        # Only allow : for field updates if left side is a Get expression
-        # This avoids conflict with named arguments which use Variable: expr
-        from .expressions import Get
-
-        if isinstance(expression, Get) and self.match(TokenType.COLON):
-            operator = self.previous()
-            right = self.term()
-            return FieldUpdate(expression, operator, right)
-
-        return expression
-
-    def term(self) -> Expression:
-        expression = self.factor()
-
-        while self.match(TokenType.MINUS, TokenType.PLUS):
-            operator = self.previous()
-            right = self.factor()
-            expression = Binary(expression, operator, right)
-
-        return expression
-
-    def factor(self) -> Expression:
+    def binary(self, precedence: Precedence) -> Expression:
+        """An operand followed by the infix operators binding at least as
+        tightly as precedence and their right operands."""
         expression = self.unary()
 
-        while self.match(TokenType.SLASH, TokenType.STAR):
-            operator = self.previous()
-            right = self.unary()
-            expression = Binary(expression, operator, right)
+        while True:
+            self.skip_newlines()
+            operator = self.peek()
+            infix = INFIX_OPERATORS.get(operator.type_)
+            if infix is None or infix[0] < precedence:
+                return expression
 
-        return expression
+            operator_precedence, node = infix
+            # Only allow : for field updates if left side is a Get expression
+            # This avoids conflict with named arguments which use Variable: expr
+            if node is FieldUpdate and not isinstance(expression, Get):
+                return expression
+
+            self.advance()
+            right = self.binary(operator_precedence + 1)
+            expression = node(expression, operator, right)
 
     def unary(self) -> Expression:
-        if self.match(TokenType.BANG, TokenType.MINUS):
-            operator = self.previous()
+        self.skip_newlines()
+        operator = self.peek()
+        if operator.type_ in PREFIX_OPERATORS:
+            self.advance()
             right = self.unary()
             return Unary(operator, right)
 
-        return self.if_expression()
+        if operator.type_ is TokenType.IF:
+            return self.if_expression()
 
-    def if_expression(self) -> Statement:
-        if self.match(TokenType.IF):
-            keyword = self.previous()
-            condition = self.expression()
-
-            self.consume(
-                TokenType.LEFT_BRACE, "Expect '{' before then branch of if expression."
-            )
-            then_branch = self.expression()
-            self.consume(
-                TokenType.RIGHT_BRACE, "Expect '}' after then branch of if expression."
-            )
-            self.consume(
-                TokenType.ELSE,
-                "Expect 'else' clause after then branch of if expression.",
-            )
-            self.match(TokenType.LEFT_BRACE)
-            else_branch = self.expression()
-            self.match(TokenType.RIGHT_BRACE)
+        return self.call()
 
-            return IfExpression(condition, then_branch, else_branch, keyword)
+    def if_expression(self) -> Expression:
+        keyword = self.advance()
+        condition = self.expression()
 
-        return self.call()
+        self.consume(
+            TokenType.LEFT_BRACE, "Expect '{' before then branch of if expression."
+        )
+        then_branch = self.expression()
+        self.consume(
+            TokenType.RIGHT_BRACE, "Expect '}' after then branch of if expression."
+        )
+        self.consume(
+            TokenType.ELSE,
+            "Expect 'else' clause after then branch of if expression.",
+        )
+        self.match(TokenType.LEFT_BRACE)
+        else_branch = self.expression()
+        self.match(TokenType.RIGHT_BRACE)
+
+        return IfExpression(condition, then_branch, else_branch, keyword)
 
     def call(self) -> Expression:
         expression = self.primary()
 
         while True:
-            if self.match(TokenType.LEFT_PAREN):
+            self.skip_newlines()
+            type_ = self.peek().type_
+            if type_ is TokenType.LEFT_PAREN:
+                self.advance()
                 expression = self.finish_call(expression)
-            elif self.match(TokenType.DOT):
+            elif type_ is TokenType.DOT:
+                self.advance()
                 name = self.consume(
                     TokenType.IDENTIFIER, "Expect property name after '.'."
                 )
                 expression = Get(expression, name)
             else:
-                break
-
-        return expression
+                return expression
 
     def primary(self) -> Expression:
-        if self.match(TokenType.FALSE):
-            return Literal(False, Type(BoolClass, self.previous()))
-        if self.match(TokenType.TRUE):
-            return Literal(True, Type(BoolClass, self.previous()))
-        if self.match(TokenType.NULL):
-            return Literal(None, Type(None, self.previous()))
-
-        if self.match(TokenType.SUPER):
-            keyword = self.previous()
+        self.skip_newlines()
+        token = self.peek()
+        type_ = token.type_
+
+        if type_ is TokenType.IDENTIFIER:
+            self.advance()
+            return Variable(token)
+
+        if type_ in LITERAL_CLASSES:
+            self.advance()
+            return Literal(token.literal, Type(LITERAL_CLASSES[type_], token))
+
+        if type_ in KEYWORD_LITERALS:
+            self.advance()
+            value, klass = KEYWORD_LITERALS[type_]
+            return Literal(value, Type(klass, token))
+
+        if type_ is TokenType.SUPER:
+            self.advance()
             method = None
             if self.match(TokenType.DOT):
                 method = self.consume(
@@ -324,30 +353,23 @@ class ExpressionsParser(ParserControl):
             else:
                 method = self.current_function_name
 
-            return Super(keyword, method)
-
-        if self.match(TokenType.FLOAT):
-            return Literal(self.previous().literal, Type(FloatClass, self.previous()))
-        if self.match(TokenType.STRING):
-            return Literal(self.previous().literal, Type(StringClass, self.previous()))
-        if self.match(TokenType.INT):
-            return Literal(self.previous().literal, Type(IntClass, self.previous()))
+            return Super(token, method)
 
-        if self.match(TokenType.SELF):
-            return Self(self.previous())
-
-        if self.match(TokenType.LAMBDA):
-            return self.function_body("lambda", self.previous())
+        if type_ is TokenType.SELF:
+            self.advance()
+            return Self(token)
 
-        if self.match(TokenType.IDENTIFIER):
-            return Variable(self.previous())
+        if type_ is TokenType.LAMBDA:
+            self.advance()
+            return self.function_body("lambda", token)
 
-        if self.match(TokenType.LEFT_PAREN):
+        if type_ is TokenType.LEFT_PAREN:
+            self.advance()
             expression = self.expression()
             self.consume(TokenType.RIGHT_PAREN, "Expect ')' after expression.")
             return Grouping(expression)
 
-        raise self.error(self.peek(), "Expect expression.")
+        raise self.error(token, "Expect expression.")
 
     def finish_call(self, expression: Variable):
         arguments: list[Expression] = []
@@ -531,10 +553,11 @@ class StatementsParser(ExpressionsParser):
         return VariableStatement(name, None)
 
     def while_statement(self) -> Statement:
+        keyword = self.previous()
         condition = self.expression()
         body = self.statement()
 
-        return WhileStatement(condition, body)
+        return WhileStatement(condition, body, keyword)
 
     def block(self) -> list[Statement]:
         statements: list[Statement] = []
@@ -565,10 +588,29 @@ class StatementsParser(ExpressionsParser):
 
 class Parser(StatementsParser):
     def parse(self) -> list[Statement]:
-        statements: list[Statement] = []
+        return list(self.statements())
+
+    def statements(self) -> Iterator[Statement]:
+        """The top-level statements, parsed one at a time. Statements that
+        failed to parse are None."""
         while not self.is_at_end():
             self.skip_newlines()
-            statements.append(self.declaration())
+            yield self.declaration()
             self.skip_newlines()
 
-        return statements
+
+class StreamingParser(Parser):
+    """Parser taking its tokens from an iterator, typically
+    StreamingLexer.stream_tokens, through a TokenWindow. Tokens are read as
+    statements need them, looking at most one token past the next one, not
+    counting newlines."""
+
+    def __init__(
+        self, tokens: Iterator[Token], error_callback: Callable[[Token, str], None]
+    ):
+        super().__init__(TokenWindow(tokens), error_callback)
+
+    def advance(self) -> Token:
+        token = super().advance()
+        self.tokens.release(self.current - 1)
+        return token
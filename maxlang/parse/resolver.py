@@ -24,6 +24,8 @@ class Resolver(ExpressionVisitor, StatementVisitor):
         self.interpreter = interpreter
         self.parser_error = parser_error
         self.scopes: list[dict[str, bool]] = []
+        # Slot index of every name declared in the matching scope
+        self.slots: list[dict[str, int]] = []
         self.current_function: FunctionType = FunctionType.NONE
         self.current_class: ClassType = ClassType.NONE
 
@@ -35,7 +37,7 @@ class Resolver(ExpressionVisitor, StatementVisitor):
     def visit_class(self, statement):
         enclosing_class = self.current_class
         self.current_class = ClassType.CLASS
-        self.declare(statement.name)
+        self.declare(statement.name, statement)
         self.define(statement.name)
 
         for superclass in statement.superclasses:
@@ -47,9 +49,9 @@ class Resolver(ExpressionVisitor, StatementVisitor):
         self.resolve_many(statement.superclasses)
 
         self.begin_scope()
-        self.scopes[-1]["super"] = True
+        self.declare_internal("super")
         self.begin_scope()
-        self.scopes[-1]["self"] = True
+        self.declare_internal("self")
 
         for method in statement.methods:
             declaration = FunctionType.METHOD
@@ -71,17 +73,24 @@ class Resolver(ExpressionVisitor, StatementVisitor):
 
     def begin_scope(self):
         self.scopes.append({})
+        self.slots.append({})
 
     def end_scope(self):
         self.scopes.pop()
+        self.slots.pop()
 
     def visit_variable_statement(self, statement):
-        self.declare(statement.name)
+        self.declare(statement.name, statement)
         if statement.initializer is not None:
             self.resolve(statement.initializer)
         self.define(statement.name)
 
-    def declare(self, name: Token, skip_validation: bool = False):
+    def declare(
+        self,
+        name: Token,
+        declaration: Statement | None = None,
+        skip_validation: bool = False,
+    ):
         if not self.scopes:
             return
 
@@ -92,6 +101,16 @@ class Resolver(ExpressionVisitor, StatementVisitor):
             )
         scope[name.lexeme] = False
 
+        slots = self.slots[-1]
+        slot = slots.setdefault(name.lexeme, len(slots))
+        if declaration is not None:
+            self.interpreter.resolve(declaration, 0, slot)
+
+    def declare_internal(self, name: str):
+        """Declare a name the interpreter binds itself, like self and super."""
+        self.scopes[-1][name] = True
+        self.slots[-1][name] = len(self.slots[-1])
+
     def define(self, name: Token):
         if not self.scopes:
             return
@@ -113,14 +132,13 @@ class Resolver(ExpressionVisitor, StatementVisitor):
     def resolve_local(
         self, expression: Expression, name: Token, could_be_global: bool = True
     ):
-        for i, scope in enumerate(reversed(self.scopes)):
+        for depth, scope in enumerate(reversed(self.slots)):
             if name.lexeme in scope:
-                self.interpreter.resolve(
-                    expression, len(self.scopes) - (len(self.scopes) - i)
-                )
+                self.interpreter.resolve(expression, depth, scope[name.lexeme])
+                return
 
     def visit_function(self, statement):
-        self.declare(statement.name)
+        self.declare(statement.name, statement)
         self.define(statement.name)
 
         self.resolve_function(statement.function, FunctionType.FUNCTION)
@@ -149,6 +167,10 @@ class Resolver(ExpressionVisitor, StatementVisitor):
         self.resolve(expression.left)
         self.resolve(expression.right)
 
+    def visit_interpolation(self, expression):
+        for part in expression.parts:
+            self.resolve(part)
+
     def visit_pair(self, expression):
         self.resolve(expression.left)
         self.resolve(expression.right)
@@ -1,8 +1,9 @@
 from __future__ import annotations
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+from typing import ClassVar
 
 from maxlang.lex.lexer import Token
-from .expressions import Expression, Lambda, Variable
+from .expressions import Expression, Lambda, Variable, node, visitor_method_name
 
 
 class StatementVisitor:
@@ -36,27 +37,37 @@ class StatementVisitor:
 
 @dataclass
 class Statement:
+    # Slotted by hand, node would recreate the class and break the
+    # super() of __init_subclass__
+    __slots__ = ()
+
+    # Name of the visitor method handling this node, computed once per class
+    visitor_method: ClassVar[str] = ""
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        cls.visitor_method = visitor_method_name(cls.__name__)
+
     def accept(self, visitor: StatementVisitor):
-        class_name = "".join(
-            "_" + char.lower() if char.isupper() else char
-            for char in self.__class__.__name__
-        ).lstrip("_")
-        func = getattr(visitor, f"visit_{class_name}")
-        return func(self)
+        return getattr(visitor, self.visitor_method)(self)
 
 
-@dataclass
+@node
 class ExpressionStatement(Statement):
     expression: Expression
 
 
-@dataclass
+@node
 class Function(Statement):
     name: Token
     function: Lambda
+    # (depth, slot) of the declared name, set by the Resolver unless it is global
+    local: tuple[int, int] | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
 
 
-@dataclass
+@node
 class IfStatement(Statement):
     condition: Expression
     then_branch: Statement
@@ -64,37 +75,46 @@ class IfStatement(Statement):
     keyword: Token
 
 
-@dataclass
+@node
 class VariableStatement(Statement):
     name: Token
     initializer: Expression
+    # (depth, slot) of the declared name, set by the Resolver unless it is global
+    local: tuple[int, int] | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
 
 
-@dataclass
+@node
 class Block(Statement):
     statements: list[Statement]
 
 
-@dataclass
+@node
 class Class(Statement):
     name: Token
     superclasses: list[Variable]
     methods: list[Function]
+    # (depth, slot) of the declared name, set by the Resolver unless it is global
+    local: tuple[int, int] | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
 
 
-@dataclass
+@node
 class ReturnStatement(Statement):
     keyword: Token
     value: Expression
 
 
-@dataclass
+@node
 class WhileStatement(Statement):
     condition: Expression
     body: Statement
+    keyword: Token
 
 
-@dataclass
+@node
 class ForStatement(Statement):
     keyword: Token
     for_name: Variable
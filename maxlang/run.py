@@ -1,5 +1,5 @@
 from argparse import ArgumentParser
-from maxlang.main import Max
+from maxlang.main import Max, ENGINES, LEXERS
 
 
 if __name__ == "__main__":
@@ -7,11 +7,17 @@ if __name__ == "__main__":
     arg_parser.add_argument("script", nargs="?")
     arg_parser.add_argument("--source", "-s")
     arg_parser.add_argument("--decompose", "-d", action="store_true")
+    arg_parser.add_argument("--engine", "-e", choices=ENGINES, default="tree")
+    arg_parser.add_argument("--lexer", "-l", choices=LEXERS, default="scan")
+    arg_parser.add_argument("--stream", action="store_true")
     args = arg_parser.parse_args()
+    if args.stream and args.lexer != "scan":
+        arg_parser.error(f"--stream cannot be used with --lexer {args.lexer}")
 
+    max_ = Max(args.decompose, args.engine, lexer=args.lexer, stream=args.stream)
     if args.script:
-        Max(args.decompose).run_file(args.script)
+        max_.run_file(args.script)
     elif args.source:
-        Max(args.decompose).run_source(args.source)
+        max_.run_source(args.source)
     else:
-        Max(args.decompose).run_prompt()
+        max_.run_prompt()
@@ -0,0 +1,4 @@
+from .chunk import Chunk  # noqa: F401
+from .compiler import Compiler  # noqa: F401
+from .machine import VirtualMachine  # noqa: F401
+from .opcodes import OpCode  # noqa: F401
@@ -0,0 +1,86 @@
+from typing import Any
+
+from .opcodes import OpCode
+
+
+class Chunk:
+    """A compiled list of statements: flat instructions plus their constants."""
+
+    def __init__(self, name: str):
+        self.name = name
+        self.code: list[int] = []
+        self.constants: list[Any] = []
+
+    def emit(self, op: OpCode, argument: int = 0) -> int:
+        """Append an instruction and return the position of its argument."""
+        # Stored as a plain int, which the machine compares faster than an
+        # IntEnum member
+        self.code.append(op.value)
+        self.code.append(argument)
+        return len(self.code) - 1
+
+    def emit_constant(self, op: OpCode, value: Any) -> int:
+        return self.emit(op, self.add_constant(value))
+
+    def add_constant(self, value: Any) -> int:
+        self.constants.append(value)
+        return len(self.constants) - 1
+
+    def patch_jump(self, position: int):
+        """Point the jump whose argument is at `position` to the next instruction."""
+        self.code[position] = len(self.code)
+
+    @property
+    def position(self) -> int:
+        return len(self.code)
+
+    def disassemble(self) -> str:
+        lines = [f"== {self.name} =="]
+        for offset in range(0, len(self.code), 2):
+            op = OpCode(self.code[offset])
+            argument = self.code[offset + 1]
+            line = f"{offset:04d} {op.name:<18} {argument}"
+            if op in CONSTANT_OPERANDS:
+                line += f" ({self.describe(self.constants[argument])})"
+            lines.append(line)
+
+        return "\n".join(lines)
+
+    def describe(self, constant: Any) -> str:
+        if isinstance(constant, (tuple, list)):
+            return ", ".join(self.describe(value) for value in constant)
+        lexeme = getattr(constant, "lexeme", None)
+        if lexeme is not None:
+            return lexeme
+        if hasattr(constant, "visitor_method"):
+            return constant.__class__.__name__
+        return str(constant)
+
+    def __str__(self) -> str:
+        return f"<chunk {self.name}>"
+
+
+CONSTANT_OPERANDS = {
+    OpCode.LOAD_CONST,
+    OpCode.LOAD_LOCAL,
+    OpCode.LOAD_GLOBAL,
+    OpCode.STORE_LOCAL,
+    OpCode.STORE_GLOBAL,
+    OpCode.ASSIGN_LOCAL,
+    OpCode.ASSIGN_GLOBAL,
+    OpCode.DEFINE,
+    OpCode.BINARY,
+    OpCode.ARITHMETIC,
+    OpCode.COMPARE,
+    OpCode.UNARY,
+    OpCode.TEST,
+    OpCode.GET_ITER,
+    OpCode.GET_PROPERTY,
+    OpCode.SET_PROPERTY,
+    OpCode.MAKE_FUNCTION,
+    OpCode.UNPACK,
+    OpCode.CALL,
+    OpCode.EVALUATE,
+    OpCode.EXECUTE,
+    OpCode.INTERPOLATE,
+}
@@ -0,0 +1,281 @@
+from __future__ import annotations
+from typing import TYPE_CHECKING
+
+from maxlang.lex import TokenType
+from maxlang.parse.callable import _NO_RETURN_VALUE
+from maxlang.parse.environment import VARIABLE_VALUE_SENTINEL
+from maxlang.parse.expressions import (
+    ExpressionVisitor,
+    Expression,
+    Assignment,
+    Unpack,
+)
+from maxlang.parse.interpreter import (
+    NUMBER_ARITHMETIC,
+    NUMBER_COMPARISONS,
+    INT_COMPARISONS,
+)
+from maxlang.parse.statements import StatementVisitor, Statement
+from .chunk import Chunk
+from .opcodes import OpCode
+
+if TYPE_CHECKING:
+    from .machine import VirtualMachine
+
+
+class Compiler(ExpressionVisitor, StatementVisitor):
+    """Compiles resolved statements into a Chunk for the virtual machine.
+
+    Variable depths come from the resolver, so the compiler can only run once
+    the resolver stored them on the nodes. Nodes that are rare or tied
+    to the tree-walker's state (classes, super, field updates) are delegated
+    back to it through EVALUATE and EXECUTE.
+    """
+
+    def __init__(self, machine: VirtualMachine):
+        self.machine = machine
+        self.chunk: Chunk | None = None
+
+    def compile(self, statements: list[Statement], name: str) -> Chunk:
+        enclosing = self.chunk
+        self.chunk = Chunk(name)
+        try:
+            for statement in statements:
+                statement.accept(self)
+            self.chunk.emit(OpCode.RETURN, 1)
+            return self.chunk
+        finally:
+            self.chunk = enclosing
+
+    def compile_expression(self, expression: Expression):
+        expression.accept(self)
+
+    def emit_define(self, declaration: Statement, name):
+        local = declaration.local
+        if local is None:
+            self.chunk.emit_constant(OpCode.DEFINE, name)
+        else:
+            self.chunk.emit(OpCode.DEFINE_LOCAL, local[1])
+
+    def emit_test(self, token, jump: OpCode) -> int:
+        # The machine runs the pair as one instruction, TEST taking the jump
+        self.chunk.emit_constant(OpCode.TEST, token)
+        return self.chunk.emit(jump)
+
+    def emit_store(self, expression: Assignment, local_op: OpCode, global_op: OpCode):
+        local = expression.local
+        if local is not None:
+            self.chunk.emit_constant(local_op, local)
+        else:
+            self.chunk.emit_constant(global_op, expression.name.name)
+
+    # Statements
+
+    def visit_expression_statement(self, statement):
+        expression = statement.expression
+        if type(expression) is Assignment:
+            self.compile_expression(expression.value)
+            self.emit_store(expression, OpCode.ASSIGN_LOCAL, OpCode.ASSIGN_GLOBAL)
+            return
+
+        self.compile_expression(expression)
+        self.chunk.emit(OpCode.POP)
+
+    def visit_function(self, statement):
+        self.chunk.emit_constant(
+            OpCode.MAKE_FUNCTION, (statement.name, statement.function)
+        )
+        self.emit_define(statement, statement.name)
+
+    def visit_variable_statement(self, statement):
+        if statement.initializer is not None:
+            self.compile_expression(statement.initializer)
+        else:
+            self.chunk.emit_constant(OpCode.LOAD_CONST, VARIABLE_VALUE_SENTINEL)
+        self.emit_define(statement, statement.name)
+
+    def visit_block(self, statement):
+        self.chunk.emit(OpCode.PUSH_SCOPE)
+        for inner in statement.statements:
+            inner.accept(self)
+        self.chunk.emit(OpCode.POP_SCOPE)
+
+    def visit_class(self, statement):
+        self.chunk.emit_constant(OpCode.EXECUTE, statement)
+
+    def visit_if_statement(self, statement):
+        self.compile_expression(statement.condition)
+        else_jump = self.emit_test(statement.keyword, OpCode.POP_JUMP_IF_FALSE)
+        statement.then_branch.accept(self)
+
+        if statement.else_branch is None:
+            self.chunk.patch_jump(else_jump)
+            return
+
+        end_jump = self.chunk.emit(OpCode.JUMP)
+        self.chunk.patch_jump(else_jump)
+        statement.else_branch.accept(self)
+        self.chunk.patch_jump(end_jump)
+
+    def visit_return_statement(self, statement):
+        if statement.value is not None:
+            self.compile_expression(statement.value)
+        else:
+            self.chunk.emit_constant(OpCode.LOAD_CONST, _NO_RETURN_VALUE)
+        self.chunk.emit(OpCode.RETURN)
+
+    def visit_while_statement(self, statement):
+        loop_start = self.chunk.position
+        self.compile_expression(statement.condition)
+        exit_jump = self.emit_test(statement.keyword, OpCode.POP_JUMP_IF_FALSE)
+        statement.body.accept(self)
+        self.chunk.emit(OpCode.JUMP, loop_start)
+        self.chunk.patch_jump(exit_jump)
+
+    def visit_for_statement(self, statement):
+        self.chunk.emit(OpCode.PUSH_SCOPE)
+        self.compile_expression(statement.in_name)
+        self.chunk.emit_constant(OpCode.GET_ITER, statement)
+
+        # FOR_ITER jumps past the loop once the iterator is exhausted
+        loop_start = self.chunk.position
+        exit_jump = self.chunk.emit(OpCode.FOR_ITER)
+        self.emit_define(statement.for_name, statement.for_name.name)
+        for inner in statement.body:
+            inner.accept(self)
+        self.chunk.emit(OpCode.JUMP, loop_start)
+
+        self.chunk.patch_jump(exit_jump)
+        self.chunk.emit(OpCode.POP_SCOPE)
+
+    # Expressions
+
+    def visit_literal(self, expression):
+        # Literals are immutable, a single instance serves every evaluation
+        value = self.machine.visit_literal(expression)
+        self.chunk.emit_constant(OpCode.LOAD_CONST, value)
+
+    def visit_grouping(self, expression):
+        self.compile_expression(expression.expression)
+
+    def visit_variable(self, expression):
+        self.load_variable(expression.name, expression)
+
+    def visit_self(self, expression):
+        self.load_variable(expression.keyword, expression)
+
+    def load_variable(self, name, expression: Expression):
+        local = expression.local
+        if local is not None:
+            self.chunk.emit_constant(OpCode.LOAD_LOCAL, local)
+        else:
+            self.chunk.emit_constant(OpCode.LOAD_GLOBAL, name)
+
+    def visit_assignment(self, expression):
+        self.compile_expression(expression.value)
+        self.emit_store(expression, OpCode.STORE_LOCAL, OpCode.STORE_GLOBAL)
+
+    def visit_binary(self, expression):
+        self.compile_expression(expression.left)
+        self.compile_expression(expression.right)
+
+        # The operation travels with the expression, which is kept for the
+        # operands the machine does not inline
+        operator_type = expression.operator.type_
+        if operator_type in NUMBER_ARITHMETIC:
+            self.chunk.emit_constant(
+                OpCode.ARITHMETIC, (expression, NUMBER_ARITHMETIC[operator_type])
+            )
+        elif operator_type in INT_COMPARISONS:
+            self.chunk.emit_constant(
+                OpCode.COMPARE,
+                (
+                    expression,
+                    INT_COMPARISONS[operator_type],
+                    NUMBER_COMPARISONS[operator_type],
+                ),
+            )
+        else:
+            self.chunk.emit_constant(OpCode.BINARY, expression)
+
+    def visit_interpolation(self, expression):
+        for part in expression.parts:
+            self.compile_expression(part)
+        self.chunk.emit_constant(
+            OpCode.INTERPOLATE, (expression, len(expression.parts))
+        )
+
+    def visit_unary(self, expression):
+        self.compile_expression(expression.right)
+        self.chunk.emit_constant(OpCode.UNARY, expression)
+
+    def visit_logical(self, expression):
+        self.compile_expression(expression.left)
+        self.chunk.emit(OpCode.DUP)
+        jump = (
+            OpCode.POP_JUMP_IF_TRUE
+            if expression.operator.type_ == TokenType.OR
+            else OpCode.POP_JUMP_IF_FALSE
+        )
+        end_jump = self.emit_test(expression.operator, jump)
+        self.chunk.emit(OpCode.POP)
+        self.compile_expression(expression.right)
+        self.chunk.patch_jump(end_jump)
+
+    def visit_if_expression(self, expression):
+        self.compile_expression(expression.condition)
+        else_jump = self.emit_test(expression.keyword, OpCode.POP_JUMP_IF_FALSE)
+        self.compile_expression(expression.then_branch)
+        end_jump = self.chunk.emit(OpCode.JUMP)
+        self.chunk.patch_jump(else_jump)
+        self.compile_expression(expression.else_branch)
+        self.chunk.patch_jump(end_jump)
+
+    def visit_call(self, expression):
+        self.compile_expression(expression.callee)
+
+        positional = 0
+        has_unpack = False
+        for argument in expression.arguments:
+            if argument.name is not None:
+                break
+
+            self.compile_expression(argument.value)
+            has_unpack = has_unpack or isinstance(argument.value, Unpack)
+            positional += 1
+
+        # Plain calls pass exactly the positional values on the stack
+        plain = not has_unpack and positional == len(expression.arguments)
+        self.chunk.emit_constant(
+            OpCode.CALL, (expression, positional, has_unpack, plain)
+        )
+
+    def visit_unpack(self, expression):
+        self.compile_expression(expression.expression)
+        self.chunk.emit_constant(OpCode.UNPACK, expression)
+
+    def visit_get(self, expression):
+        self.compile_expression(expression.obj)
+        self.chunk.emit_constant(OpCode.GET_PROPERTY, expression)
+
+    def visit_set(self, expression):
+        self.compile_expression(expression.obj)
+        self.compile_expression(expression.value)
+        self.chunk.emit_constant(OpCode.SET_PROPERTY, expression)
+
+    def visit_pair(self, expression):
+        self.compile_expression(expression.left)
+        self.compile_expression(expression.right)
+        self.chunk.emit(OpCode.MAKE_PAIR)
+
+    def visit_lambda(self, expression):
+        self.chunk.emit_constant(OpCode.MAKE_FUNCTION, (None, expression))
+
+    def visit_super(self, expression):
+        self.chunk.emit_constant(OpCode.EVALUATE, expression)
+
+    def visit_field_update(self, expression):
+        self.chunk.emit_constant(OpCode.EVALUATE, expression)
+
+    def visit_argument(self, expression):
+        self.compile_expression(expression.value)
@@ -0,0 +1,380 @@
+from typing import Any, Callable
+
+from maxlang.errors import InterpreterError
+from maxlang.native_functions.BaseTypes.Float import FloatInstance
+from maxlang.native_functions.BaseTypes.Int import IntInstance
+from maxlang.native_functions.BaseTypes.Pair import PairInstance
+from maxlang.parse.callable import (
+    FunctionCallable,
+    _NO_RETURN_VALUE,
+    _NULL_RETURN_VALUE,
+)
+from maxlang.parse.environment import Environment
+from maxlang.parse.expressions import Lambda
+from maxlang.parse.interpreter import Interpreter, SMALL_INTS, NUMBER_TYPES
+from maxlang.parse.statements import Statement
+from .chunk import Chunk
+from .compiler import Compiler
+from .opcodes import OpCode
+
+
+LOAD_CONST = OpCode.LOAD_CONST.value
+POP = OpCode.POP.value
+DUP = OpCode.DUP.value
+LOAD_LOCAL = OpCode.LOAD_LOCAL.value
+LOAD_GLOBAL = OpCode.LOAD_GLOBAL.value
+STORE_LOCAL = OpCode.STORE_LOCAL.value
+STORE_GLOBAL = OpCode.STORE_GLOBAL.value
+DEFINE = OpCode.DEFINE.value
+DEFINE_LOCAL = OpCode.DEFINE_LOCAL.value
+BINARY = OpCode.BINARY.value
+UNARY = OpCode.UNARY.value
+TEST = OpCode.TEST.value
+JUMP = OpCode.JUMP.value
+POP_JUMP_IF_TRUE = OpCode.POP_JUMP_IF_TRUE.value
+GET_ITER = OpCode.GET_ITER.value
+FOR_ITER = OpCode.FOR_ITER.value
+PUSH_SCOPE = OpCode.PUSH_SCOPE.value
+POP_SCOPE = OpCode.POP_SCOPE.value
+GET_PROPERTY = OpCode.GET_PROPERTY.value
+SET_PROPERTY = OpCode.SET_PROPERTY.value
+MAKE_PAIR = OpCode.MAKE_PAIR.value
+MAKE_FUNCTION = OpCode.MAKE_FUNCTION.value
+UNPACK = OpCode.UNPACK.value
+CALL = OpCode.CALL.value
+RETURN = OpCode.RETURN.value
+EVALUATE = OpCode.EVALUATE.value
+EXECUTE = OpCode.EXECUTE.value
+INTERPOLATE = OpCode.INTERPOLATE.value
+ARITHMETIC = OpCode.ARITHMETIC.value
+COMPARE = OpCode.COMPARE.value
+ASSIGN_LOCAL = OpCode.ASSIGN_LOCAL.value
+ASSIGN_GLOBAL = OpCode.ASSIGN_GLOBAL.value
+
+# Returned by run() when the chunk ends without a return statement
+_END_OF_CHUNK = object()
+
+# Returned by the iterator of a for loop once it is exhausted
+_END_OF_ITERATION = object()
+
+
+class VirtualMachine(Interpreter):
+    """Stack based engine running the bytecode produced by the Compiler.
+
+    Chunks are compiled lazily, the first time a list of statements runs, and
+    cached for the lifetime of the machine. Calls to user functions push a
+    frame onto the machine's own frame stack instead of recursing through
+    FunctionCallable.call; every other callable (natives, classes, bound
+    methods called from natives) goes through the regular Interpreter.call.
+
+    Arithmetic and comparisons between Ints and Floats, global variables and
+    calls passing exactly the parameters of a user function are handled
+    inline; anything else falls back to the Interpreter's methods.
+    """
+
+    def __init__(
+        self,
+        interpreter_error: Callable[[InterpreterError], None],
+        small_ints: range = SMALL_INTS,
+    ):
+        super().__init__(interpreter_error, small_ints)
+        self.compiler = Compiler(self)
+        self.chunks: dict[int, tuple[list[Statement], Chunk]] = {}
+        # The body chunk of each function, with its number of parameters when
+        # none of them has a default or packs varargs and None otherwise
+        self.functions: dict[Lambda, tuple[Chunk, int | None]] = {}
+
+    def interpret(self, statements: list[Statement]):
+        try:
+            # Run once, the script is not worth caching
+            self.run(self.compiler.compile(statements, "<script>"), self.environment)
+        except InterpreterError as e:
+            self.interpreter_error(e)
+
+    def compile(self, statements: list[Statement], name: str) -> Chunk:
+        # The statement list is kept alongside its chunk so its id stays unique
+        cached = self.chunks.get(id(statements))
+        if cached is None:
+            cached = (statements, self.compiler.compile(statements, name))
+            self.chunks[id(statements)] = cached
+
+        return cached[1]
+
+    def execute_block(self, statements: list[Statement], environment: Environment):
+        # Reached through FunctionCallable.call, returns like the tree-walker
+        value = self.run(self.compile(statements, "<block>"), environment)
+        if value is _END_OF_CHUNK:
+            return None
+
+        return _NULL_RETURN_VALUE if value is None else value
+
+    def function_chunk(self, function: FunctionCallable) -> Chunk:
+        name = function.name.lexeme if function.name is not None else "<lambda>"
+        return self.compile(function.declaration.body, name)
+
+    def compile_function(self, function: FunctionCallable) -> tuple[Chunk, int | None]:
+        parameters = function.parameters
+        arity = len(parameters)
+        if any(
+            parameter.default is not None or parameter.is_varargs
+            for parameter in parameters
+        ):
+            arity = None
+
+        compiled = (self.function_chunk(function), arity)
+        self.functions[function.declaration] = compiled
+        return compiled
+
+    def run(self, chunk: Chunk, environment: Environment) -> Any:
+        previous_environment = self.environment
+        previous_call = self.current_call
+        self.environment = environment
+
+        frames: list[tuple] = []
+        function: FunctionCallable | None = None
+        code = chunk.code
+        constants = chunk.constants
+        stack: list[Any] = []
+        pc = 0
+
+        global_values = self.globals.values
+        functions = self.functions
+        int_cache = self.int_cache
+        first_int = self.small_ints.start
+        true = self.true
+        false = self.false
+
+        try:
+            while True:
+                op = code[pc]
+                arg = code[pc + 1]
+                pc += 2
+
+                if op == LOAD_LOCAL:
+                    distance, slot = constants[arg]
+                    environment = self.environment
+                    while distance:
+                        environment = environment.enclosing
+                        distance -= 1
+                    stack.append(environment.slots[slot])
+                elif op == LOAD_CONST:
+                    stack.append(constants[arg])
+                elif op == LOAD_GLOBAL:
+                    name = constants[arg]
+                    if name.lexeme in global_values:
+                        stack.append(global_values[name.lexeme])
+                    else:
+                        # Raises the undefined variable error
+                        stack.append(self.globals.get(name))
+                elif op == ARITHMETIC:
+                    expression, arithmetic = constants[arg]
+                    right = stack.pop()
+                    left = stack[-1]
+                    left_type = type(left)
+                    right_type = type(right)
+                    if left_type is IntInstance and right_type is IntInstance:
+                        value = arithmetic(left.value, right.value)
+                        # make_int, inlined
+                        index = value - first_int
+                        if 0 <= index < len(int_cache):
+                            instance = int_cache[index]
+                            if instance is None:
+                                instance = self.make_int(value)
+                        else:
+                            # The value is an int already, set_value would
+                            # only check it
+                            instance = IntInstance(self)
+                            instance.value = value
+                        stack[-1] = instance
+                    elif left_type in NUMBER_TYPES and right_type in NUMBER_TYPES:
+                        # A Float operand makes the result a float already
+                        instance = FloatInstance(self)
+                        instance.value = arithmetic(left.value, right.value)
+                        stack[-1] = instance
+                    else:
+                        stack[-1] = self.binary_values(expression, left, right)
+                elif op == COMPARE:
+                    expression, int_comparison, number_comparison = constants[arg]
+                    right = stack.pop()
+                    left = stack[-1]
+                    left_type = type(left)
+                    right_type = type(right)
+                    if left_type is IntInstance and right_type is IntInstance:
+                        if int_comparison(left.value, right.value):
+                            stack[-1] = true
+                        else:
+                            stack[-1] = false
+                    elif left_type in NUMBER_TYPES and right_type in NUMBER_TYPES:
+                        if number_comparison(left.value, right.value):
+                            stack[-1] = true
+                        else:
+                            stack[-1] = false
+                    else:
+                        stack[-1] = self.binary_values(expression, left, right)
+                elif op == TEST:
+                    # Decides the jump that follows, popping the tested value
+                    value = stack.pop()
+                    if value is true:
+                        condition = True
+                    elif value is false:
+                        condition = False
+                    else:
+                        condition = self.truthy(value, constants[arg])
+
+                    if condition == (code[pc] == POP_JUMP_IF_TRUE):
+                        pc = code[pc + 1]
+                    else:
+                        pc += 2
+                elif op == JUMP:
+                    pc = arg
+                elif op == ASSIGN_LOCAL:
+                    distance, slot = constants[arg]
+                    environment = self.environment
+                    while distance:
+                        environment = environment.enclosing
+                        distance -= 1
+                    environment.slots[slot] = stack.pop()
+                elif op == ASSIGN_GLOBAL:
+                    global_values[constants[arg].lexeme] = stack.pop()
+                elif op == CALL:
+                    node, count, has_unpack, plain = constants[arg]
+                    if count:
+                        arguments = stack[-count:]
+                        del stack[-count:]
+                    else:
+                        arguments = []
+                    callee = stack.pop()
+
+                    if type(callee) is not FunctionCallable:
+                        if has_unpack:
+                            arguments = self.flatten_unpacked(arguments)
+                        arguments = self.finish_arguments(
+                            callee, arguments, node.arguments
+                        )
+                        stack.append(self.call(node.paren, callee, arguments))
+                        continue
+
+                    compiled = functions.get(callee.declaration)
+                    if compiled is None:
+                        compiled = self.compile_function(callee)
+                    callee_chunk, arity = compiled
+
+                    # Arguments matching plain parameters one to one are
+                    # passed as they are
+                    if not plain or arity != count:
+                        if has_unpack:
+                            arguments = self.flatten_unpacked(arguments)
+                        arguments = self.finish_arguments(
+                            callee, arguments, node.arguments
+                        )
+                        if not callee.check_arity(len(arguments)):
+                            raise InterpreterError(
+                                node.paren,
+                                f"Expected between {callee.lower_arity()} and {callee.upper_arity()} arguments but got {len(arguments)}.",
+                            )
+
+                    call_environment = Environment(callee.closure)
+                    call_environment.slots = arguments
+
+                    frames.append(
+                        (
+                            code,
+                            constants,
+                            pc,
+                            stack,
+                            self.environment,
+                            function,
+                            self.current_call,
+                        )
+                    )
+                    function = callee
+                    self.current_call = callee
+                    self.environment = call_environment
+
+                    code = callee_chunk.code
+                    constants = callee_chunk.constants
+                    stack = []
+                    pc = 0
+                elif op == RETURN:
+                    # An argument of 1 marks the implicit return at the end of
+                    # a chunk, otherwise the returned value is on the stack.
+                    value = _END_OF_CHUNK if arg else stack.pop()
+                    if not frames:
+                        return value
+
+                    if value is _END_OF_CHUNK or value is _NO_RETURN_VALUE:
+                        value = function.return_self()
+
+                    (
+                        code,
+                        constants,
+                        pc,
+                        stack,
+                        self.environment,
+                        function,
+                        self.current_call,
+                    ) = frames.pop()
+                    stack.append(value)
+                elif op == PUSH_SCOPE:
+                    self.environment = Environment(self.environment)
+                elif op == POP_SCOPE:
+                    self.environment = self.environment.enclosing
+                elif op == FOR_ITER:
+                    value = next(stack[-1], _END_OF_ITERATION)
+                    if value is _END_OF_ITERATION:
+                        stack.pop()
+                        pc = arg
+                    else:
+                        stack.append(value)
+                elif op == DEFINE_LOCAL:
+                    self.environment.define_slot(arg, stack.pop())
+                elif op == POP:
+                    stack.pop()
+                elif op == STORE_LOCAL:
+                    distance, slot = constants[arg]
+                    environment = self.environment
+                    while distance:
+                        environment = environment.enclosing
+                        distance -= 1
+                    environment.slots[slot] = stack[-1]
+                elif op == STORE_GLOBAL:
+                    # The globals enclose nothing, assigning always defines
+                    global_values[constants[arg].lexeme] = stack[-1]
+                elif op == BINARY:
+                    right = stack.pop()
+                    stack[-1] = self.binary_values(constants[arg], stack[-1], right)
+                elif op == GET_PROPERTY:
+                    stack[-1] = self.get_property(constants[arg], stack[-1])
+                elif op == DEFINE:
+                    self.environment.define(constants[arg], stack.pop())
+                elif op == DUP:
+                    stack.append(stack[-1])
+                elif op == GET_ITER:
+                    stack[-1] = self.iterate(stack[-1], constants[arg])
+                elif op == UNARY:
+                    stack[-1] = self.unary_values(constants[arg], stack[-1])
+                elif op == SET_PROPERTY:
+                    value = stack.pop()
+                    stack[-1] = self.set_property(constants[arg], stack[-1], value)
+                elif op == INTERPOLATE:
+                    expression, count = constants[arg]
+                    values = stack[-count:]
+                    del stack[-count:]
+                    stack.append(self.interpolate_values(expression, values))
+                elif op == MAKE_PAIR:
+                    right = stack.pop()
+                    stack[-1] = PairInstance(self).set_values(stack[-1], right)
+                elif op == MAKE_FUNCTION:
+                    name, declaration = constants[arg]
+                    stack.append(FunctionCallable(name, declaration, self.environment))
+                elif op == UNPACK:
+                    stack[-1] = self.unpack_values(constants[arg], stack[-1])
+                elif op == EVALUATE:
+                    stack.append(self.evaluate(constants[arg]))
+                elif op == EXECUTE:
+                    self.execute(constants[arg])
+                else:
+                    raise ValueError(f"Unknown instruction {op} in {chunk}.")
+        finally:
+            self.environment = previous_environment
+            self.current_call = previous_call
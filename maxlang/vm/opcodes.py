@@ -0,0 +1,64 @@
+from enum import IntEnum
+
+
+class OpCode(IntEnum):
+    """Instructions understood by the virtual machine.
+
+    Every instruction is followed by exactly one integer argument, an index
+    into the constant pool, a jump target or an unused 0.
+    """
+
+    # Stack
+    LOAD_CONST = 0
+    POP = 1
+    DUP = 2
+
+    # Variables
+    LOAD_LOCAL = 3
+    LOAD_GLOBAL = 4
+    STORE_LOCAL = 5
+    STORE_GLOBAL = 6
+    DEFINE = 7
+    DEFINE_LOCAL = 8
+
+    # Operators
+    BINARY = 9
+    UNARY = 10
+    # Takes the POP_JUMP_IF_FALSE or POP_JUMP_IF_TRUE that always follows it
+    TEST = 11
+
+    # Control flow
+    JUMP = 12
+    POP_JUMP_IF_FALSE = 13
+    POP_JUMP_IF_TRUE = 14
+    GET_ITER = 15
+    FOR_ITER = 16
+
+    # Scopes
+    PUSH_SCOPE = 17
+    POP_SCOPE = 18
+
+    # Objects and functions
+    GET_PROPERTY = 19
+    SET_PROPERTY = 20
+    MAKE_PAIR = 21
+    MAKE_FUNCTION = 22
+    UNPACK = 23
+    CALL = 24
+    RETURN = 25
+
+    # Delegated to the tree-walking interpreter
+    EVALUATE = 26
+    EXECUTE = 27
+
+    # Strings
+    INTERPOLATE = 28
+
+    # Binary operators specialised by the compiler, inlined for Int and
+    # Float operands
+    ARITHMETIC = 29
+    COMPARE = 30
+
+    # Assignments used as statements, storing the value without keeping it
+    ASSIGN_LOCAL = 31
+    ASSIGN_GLOBAL = 32
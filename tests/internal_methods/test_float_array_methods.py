@@ -0,0 +1,61 @@
+from ..main import run_source, formatted_error
+
+
+def test_toString():
+    assert run_source("print(FloatArray(1.5, 2).toString())") == "FloatArray(1.5, 2.0)"
+
+
+def test_init():
+    assert run_source('print(FloatArray("1"))') == formatted_error(
+        "Invalid value passed to <FloatArray>.", 1
+    )
+
+
+def test_get():
+    assert run_source("print(FloatArray(1, 2.5).get(1) + 0.5)") == "3.0"
+
+
+def test_aggregates():
+    source = """
+array = FloatArray(0.5, 1.5, -2)
+print(array.sum(), array.min(), array.max(), array.mean())
+"""
+    assert run_source(source) == "0.0 -2.0 1.5 0.0"
+    assert run_source("print(FloatArray().mean())") == formatted_error(
+        "Cannot take the mean of an empty <FloatArray>.", 1
+    )
+
+
+def test_elementwise():
+    source = """
+floats = FloatArray(1, 2, 3)
+print(floats + IntArray(1, 1, 1), floats * 0.5, floats - 1, floats / FloatArray(2, 4, 6))
+"""
+    assert run_source(source) == (
+        "FloatArray(2.0, 3.0, 4.0) FloatArray(0.5, 1.0, 1.5) "
+        "FloatArray(0.0, 1.0, 2.0) FloatArray(0.5, 0.5, 0.5)"
+    )
+    assert run_source("print(FloatArray(1) / 0.0)") == formatted_error(
+        "Attempted division by zero.", 1
+    )
+    assert run_source('print(FloatArray(1) + "a")') == formatted_error(
+        "Error at '\"a\"': Expected FloatArray or IntArray or Float or Int but got String for parameter other in call to add.",
+        1,
+    )
+
+
+def test_equals():
+    assert run_source("print(FloatArray(1, 2) == FloatArray(1.0, 2.0))") == "true"
+    assert run_source("print(FloatArray(1).equals(IntArray(1)))") == formatted_error(
+        "Error at 'IntArray': Expected FloatArray but got IntArray for parameter other in call to equals.",
+        1,
+    )
+
+
+def test_iterate():
+    source = """
+for value in FloatArray(1, 2) {
+    print(value + 0.25)
+}
+"""
+    assert run_source(source) == "1.25\n2.25"
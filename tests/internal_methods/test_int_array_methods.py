@@ -0,0 +1,102 @@
+from ..main import run_source, formatted_error
+
+
+def test_toString():
+    assert run_source("print(IntArray(1, 2, 3).toString())") == "IntArray(1, 2, 3)"
+    assert run_source("print(IntArray())") == "IntArray()"
+
+
+def test_init():
+    assert run_source("print(IntArray(*List(1, 2)))") == "IntArray(1, 2)"
+    assert run_source("print(IntArray(1.5))") == formatted_error(
+        "Invalid value passed to <IntArray>.", 1
+    )
+    assert run_source("print(IntArray(9223372036854775808))") == formatted_error(
+        "Value out of range for <IntArray>.", 1
+    )
+
+
+def test_get_and_set():
+    assert run_source("print(IntArray(1, 2, 3).get(-1))") == "3"
+    assert run_source("print(IntArray(1, 2, 3).get(3))") == formatted_error(
+        "3 is not a valid index.", 1
+    )
+    source = """
+array = IntArray(1, 2, 3)
+print(array.set(1, 5), array)
+"""
+    assert run_source(source) == "IntArray(1, 5, 3) IntArray(1, 2, 3)"
+    assert run_source("print(IntArray(1).set(1, 2))") == formatted_error(
+        "Index 1 out of range", 1
+    )
+
+
+def test_length():
+    assert run_source("print(IntArray(1, 2, 3).length())") == "3"
+
+
+def test_slice():
+    source = """
+array = IntArray(1, 2, 3, 4, 5)
+print(array.slice(1, -1), array.slice(-2, 10), array.slice(3, 1))
+print(array.slice(1, 4).slice(1, 2).get(0))
+"""
+    assert run_source(source) == "IntArray(2, 3, 4) IntArray(4, 5) IntArray()\n3"
+
+
+def test_aggregates():
+    source = """
+array = IntArray(3, -1, 4, 1)
+print(array.sum(), array.min(), array.max(), array.mean())
+print(IntArray().sum())
+"""
+    assert run_source(source) == "7 -1 4 1.75\n0"
+    assert run_source("print(IntArray().max())") == formatted_error(
+        "Cannot take the max of an empty <IntArray>.", 1
+    )
+
+
+def test_elementwise():
+    source = """
+left = IntArray(1, 2, 3)
+right = IntArray(4, 5, 6)
+print(left + right, left - right, left * right, right / left)
+print(left + 1, left * 3, left.slice(1, 3) + right.slice(0, 2))
+"""
+    assert run_source(source) == (
+        "IntArray(5, 7, 9) IntArray(-3, -3, -3) IntArray(4, 10, 18) FloatArray(4.0, 2.5, 2.0)\n"
+        "IntArray(2, 3, 4) IntArray(3, 6, 9) IntArray(6, 8)"
+    )
+    assert run_source("print(IntArray(1, 2) + IntArray(1))") == formatted_error(
+        "Cannot add arrays of lengths 2 and 1.", 1
+    )
+    assert run_source("print(IntArray(1) / IntArray(0))") == formatted_error(
+        "Attempted division by zero.", 1
+    )
+    assert run_source("print(IntArray(1) + 1.5)") == formatted_error(
+        "Error at '1.5': Expected IntArray or Int but got Float for parameter other in call to add.",
+        1,
+    )
+
+
+def test_equals():
+    assert run_source("print(IntArray(1, 2).equals(IntArray(1, 2)))") == "true"
+    assert run_source("print(IntArray(1, 2) == IntArray(1, 3))") == "false"
+    assert run_source("print(IntArray(1, 2, 3).slice(0, 2) == IntArray(1, 2))") == "true"
+    assert run_source("print(Map(IntArray(1) -> 2).get(IntArray(1)))") == "2"
+
+
+def test_iterate():
+    source = """
+total = 0
+for value in IntArray(1, 2, 3).slice(1, 3) {
+    total = value + total
+}
+print(total)
+"""
+    assert run_source(source) == "5"
+
+
+def test_toList_and_toBool():
+    assert run_source("print(IntArray(1, 2).toList())") == "List(1, 2)"
+    assert run_source("print(IntArray().toBool(), IntArray(0).toBool())") == "false true"
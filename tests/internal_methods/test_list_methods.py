@@ -224,3 +224,152 @@ print(container.items.length())
         )
         == "3"
     )
+
+
+def test_map():
+    assert (
+        run_source(
+            """
+double = lambda: x {
+    return x * 2
+}
+print(List(1, 2, 3).map(double))
+print(List().map(double))
+        """
+        )
+        == "List(2, 4, 6)\nList()"
+    )
+    assert run_source("print(List(1).map(1))") == formatted_error(
+        "Can only call functions and classes.", 1
+    )
+
+
+def test_filter():
+    assert (
+        run_source(
+            """
+print(List(3, 1, 4, 1, 5).filter(lambda: x {
+    return x > 2
+}))
+        """
+        )
+        == "List(3, 4, 5)"
+    )
+
+
+def test_reduce():
+    assert (
+        run_source(
+            """
+add = lambda: total, x {
+    return total + x
+}
+print(List(1, 2, 3, 4).reduce(add, 10))
+print(List().reduce(add, 10))
+        """
+        )
+        == "20\n10"
+    )
+    assert run_source(
+        """
+print(List(1).reduce(lambda: x {
+    return x
+}, 0))
+        """
+    ) == formatted_error(
+        "Expected a function taking 2 arguments but got <lambda>.", 4
+    )
+
+
+def test_flatMap():
+    assert (
+        run_source(
+            """
+print(List(1, 2).flatMap(lambda: x {
+    return List(x, x * 10)
+}))
+        """
+        )
+        == "List(1, 10, 2, 20)"
+    )
+
+
+def test_sortBy():
+    assert (
+        run_source(
+            """
+print(List(3, 1, 2).sortBy(lambda: x {
+    return 0 - x
+}))
+print(List("pear", "fig", "apple").sortBy(lambda: x {
+    return x
+}))
+        """
+        )
+        == 'List(3, 2, 1)\nList("apple", "fig", "pear")'
+    )
+
+
+def test_slice():
+    assert run_source("print(List(1, 2, 3, 4).slice(1, 3))") == "List(2, 3)"
+    assert run_source("print(List(1, 2, 3, 4).slice(-2, 10))") == "List(3, 4)"
+    assert run_source("print(List(1, 2, 3, 4).slice(3, 1))") == "List()"
+    assert run_source("print(List(1).slice(true, 1))") == formatted_error(
+        "Error at 'true': Expected Int but got Bool for parameter start in call to slice.",
+        1,
+    )
+
+
+def test_indexOf_and_contains():
+    assert run_source("print(List(1, 2, 3).indexOf(3))") == "2"
+    assert run_source("print(List(1, 2, 3).indexOf(4))") == "-1"
+    assert run_source("print(List(1, 2, 3).contains(2))") == "true"
+    assert run_source("print(List(1, 2, 3).contains('2'))") == "false"
+
+
+def test_reverse():
+    assert run_source("print(List(1, 2, 3).reverse())") == "List(3, 2, 1)"
+    assert run_source("print(List().reverse())") == "List()"
+
+
+def test_callbacks_fill_in_default_arguments():
+    assert (
+        run_source(
+            """
+add = lambda: x, y = 5 {
+    return x + y
+}
+print(List(1, 2).map(add))
+print(List(1, 2, 3).filter(lambda: x, limit = 2 {
+    return x > limit
+}))
+print(List(1, 2).reduce(lambda: total, x, step = 10 {
+    return total + x + step
+}, 0))
+print(List(3, 1, 2).sortBy(lambda: x, sign = -1 {
+    return x * sign
+}))
+print(List(1, 2).flatMap(lambda: x, times = 2 {
+    return List(x, x * times)
+}))
+        """
+        )
+        == "List(6, 7)\nList(3)\n23\nList(3, 2, 1)\nList(1, 2, 2, 4)"
+    )
+
+
+def test_callbacks_pack_varargs():
+    assert (
+        run_source(
+            """
+pack = lambda: varargs values {
+    return values
+}
+print(List(1, 2).map(pack))
+print(List(1, 2, 3).reduce(lambda: total, varargs values {
+    return total + values.get(0)
+}, 0))
+        """
+        )
+        == "List(VarArgs(1), VarArgs(2))\n6"
+    )
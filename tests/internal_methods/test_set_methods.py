@@ -0,0 +1,72 @@
+from ..main import run_source, formatted_error
+
+
+def test_toString():
+    assert run_source("print(Set(1, 2, 2).toString())") == "Set(1, 2)"
+    assert run_source('print(Set("a"))') == 'Set("a")'
+
+
+def test_add():
+    source = """
+numbers = Set(1, 2)
+print(numbers.add(3), numbers + 1, numbers)
+"""
+    assert run_source(source) == "Set(1, 2, 3) Set(1, 2) Set(1, 2)"
+
+
+def test_remove():
+    assert run_source("print(Set(1, 2).remove(1))") == "Set(2)"
+    assert run_source("print(Set(1).remove(2))") == formatted_error(
+        "Could not find 2 in <Set>.", 1
+    )
+
+
+def test_contains():
+    assert run_source("print(Set(1, List(2)).contains(List(2)))") == "true"
+    assert run_source("print(Set(1).contains(2))") == "false"
+
+
+def test_length_and_toBool():
+    assert run_source("print(Set(1, 1, 2).length(), Set().toBool())") == "2 false"
+
+
+def test_union():
+    assert run_source("print(Set(1, 2).union(Set(2, 3)))") == "Set(1, 2, 3)"
+    assert run_source("print(Set(1).union(List(1)))") == formatted_error(
+        "Error at 'List': Expected Set but got List for parameter other in call to union.",
+        1,
+    )
+
+
+def test_intersection():
+    assert run_source("print(Set(1, 2, 3).intersection(Set(2, 3, 4)))") == "Set(2, 3)"
+    assert run_source("print(Set(1).intersection(Set(2)))") == "Set()"
+
+
+def test_difference():
+    assert run_source("print(Set(1, 2, 3).difference(Set(2, 4)))") == "Set(1, 3)"
+    assert run_source("print(Set(1).difference(Set(1)))") == "Set()"
+
+
+def test_equals():
+    assert run_source("print(Set(1, 2).equals(Set(2, 1)))") == "true"
+    assert run_source("print(Set(1, 2) == Set(1))") == "false"
+    assert run_source("print(Map(Set(1) -> 2).get(Set(1)))") == "2"
+
+
+def test_iterate_and_unpack():
+    source = """
+total = 0
+for item in Set(1, 2, 2, 3) {
+    total = item + total
+}
+sum: a, b, c {
+    return a + b + c
+}
+print(total, sum(*Set(4, 5, 6)), Set(*List(1, 1, 2)))
+"""
+    assert run_source(source) == "6 15 Set(1, 2)"
+
+
+def test_toList():
+    assert run_source("print(Set(1, 2).toList())") == "List(1, 2)"
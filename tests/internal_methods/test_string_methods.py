@@ -79,3 +79,29 @@ def test_to_upper():
 def test_to_lower():
     assert run_source("print('TEST'.toLower())") == "test"
     assert run_source("print('TeSt123!'.toLower())") == "test123!"
+
+
+def test_join():
+    assert run_source("print(', '.join(List('a', 'b', 'c')))") == "a, b, c"
+    assert run_source("print('-'.join(List(1, 2.5, true, List(1))))") == "1-2.5-true-List(1)"
+    assert run_source("print('['.add(''.join(List())).add(']'))") == "[]"
+    assert run_source("print(', '.join('abc'))") == formatted_error(
+        "Error at ''abc'': Expected List but got String for parameter items in call to join.",
+        1,
+    )
+
+
+def test_repeated_add_keeps_earlier_strings():
+    source = """
+text = "x" * 300
+long = text
+for i in 100 {
+    long = long + i
+}
+first = text + "a"
+second = text + "b"
+third = first + "c"
+print(first == text + "a", second == text + "b", third == text + "ac")
+print(long.toLower() == long, Map(third -> 1).get(text + "ac"))
+"""
+    assert run_source(source) == "true true true\ntrue 1"
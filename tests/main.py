@@ -1,11 +1,21 @@
 from contextlib import redirect_stdout, redirect_stderr
 from maxlang import Max
+from maxlang.parse import Interpreter
 import io
+import os
+
+
+# Lets the whole suite run against another engine, e.g. MAXLANG_ENGINE=vm
+ENGINE = os.environ.get("MAXLANG_ENGINE", "tree")
+# and MAXLANG_LEXER=regex against the other lexer
+LEXER = os.environ.get("MAXLANG_LEXER", "scan")
+# and MAXLANG_STREAM=1 one statement at a time
+STREAM = os.environ.get("MAXLANG_STREAM") == "1"
 
 
 class SourceRunner:
     def __init__(self):
-        self.max = Max()
+        self.max = Max(engine=ENGINE, lexer=LEXER, stream=STREAM)
 
     def run(self, source) -> str:
         out = io.StringIO()
@@ -15,13 +25,18 @@ class SourceRunner:
         return out.getvalue().strip() or err.getvalue().strip()
 
 
-def run_source(source) -> str:
+def run_source(source, engine=ENGINE) -> str:
     out = io.StringIO()
     err = io.StringIO()
     with redirect_stdout(out), redirect_stderr(err):
-        Max().run_source(source)
+        Max(engine=engine, lexer=LEXER, stream=STREAM).run_source(source)
     return out.getvalue().strip() or err.getvalue().strip()
 
 
+def make_interpreter(**options) -> Interpreter:
+    """An interpreter ignoring its errors, for tests using values directly."""
+    return Interpreter(lambda error: None, **options)
+
+
 def formatted_error(message, line):
     return f"[line {line}] {message}"
@@ -101,3 +101,31 @@ def test_division():
     assert run_source("print((1 -> 'test') / 1)") == formatted_error(
         "Error at '/': <class Pair> does not implement the divide method.", 1
     )
+
+
+def test_mixed_number_arithmetic():
+    assert run_source("print(2 - 1.5)") == "0.5"
+    assert run_source("print(2.5 * 2)") == "5.0"
+    assert run_source("print(3 / 2.0)") == "1.5"
+    assert run_source("print(1 / 0)") == formatted_error(
+        "Attempted division by zero.", 1
+    )
+
+
+def test_user_class_operators_use_magic_methods():
+    assert (
+        run_source(
+            """
+class Box {
+    init: value {
+        return Map("value" -> value)
+    }
+    add: other {
+        return self.value * 10
+    }
+}
+print(Box(1) + 2)
+"""
+        )
+        == "10"
+    )
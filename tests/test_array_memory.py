@@ -0,0 +1,114 @@
+"""Memory tests for the typed numeric arrays, compared to Lists of boxed numbers."""
+
+import gc
+import tracemalloc
+
+from maxlang.native_functions.BaseTypes.FloatArray import FloatArrayInstance
+from maxlang.native_functions.BaseTypes.Float import FloatInstance
+from maxlang.native_functions.BaseTypes.IntArray import IntArrayInstance
+from maxlang.native_functions.BaseTypes.List import ListInstance
+from tests.main import make_interpreter
+from tests.test_memory_management import measure_memory_usage
+
+
+SIZE = 20_000
+
+
+def retained_memory(build):
+    """Memory still allocated once build() returns, while its result is alive."""
+    gc.collect()
+    tracemalloc.start()
+    value = build()
+    current, _peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del value
+    return current
+
+
+def test_int_array_smaller_than_list():
+    """Ints outside the shared small ints take one Python object each in a List."""
+    interpreter = make_interpreter()
+    start = 1 << 20
+
+    list_memory = retained_memory(
+        lambda: ListInstance(interpreter).set_values(
+            *map(interpreter.make_int, range(start, start + SIZE))
+        )
+    )
+    array_memory = retained_memory(
+        lambda: IntArrayInstance(interpreter).set_values(range(start, start + SIZE))
+    )
+
+    # 8 bytes per element against an IntInstance with its __dict__ and int
+    assert array_memory * 10 < list_memory, (
+        f"IntArray not compact: list={list_memory}, array={array_memory}"
+    )
+
+
+def test_float_array_smaller_than_list():
+    interpreter = make_interpreter()
+
+    list_memory = retained_memory(
+        lambda: ListInstance(interpreter).set_values(
+            *(FloatInstance(interpreter).set_value(i / 2) for i in range(SIZE))
+        )
+    )
+    array_memory = retained_memory(
+        lambda: FloatArrayInstance(interpreter).set_values(i / 2 for i in range(SIZE))
+    )
+
+    assert array_memory * 10 < list_memory, (
+        f"FloatArray not compact: list={list_memory}, array={array_memory}"
+    )
+
+
+def test_slices_share_storage():
+    interpreter = make_interpreter()
+    array = IntArrayInstance(interpreter).set_values(range(SIZE))
+
+    slices = retained_memory(
+        lambda: [
+            array.internal_find_method("slice").call(
+                interpreter, [interpreter.make_int(i), interpreter.make_int(-i)]
+            )
+            for i in range(100)
+        ]
+    )
+
+    # 100 slices of nearly the whole array, each well under a copy's 8 * SIZE
+    assert slices < 8 * SIZE, f"Slices copied their storage: {slices}"
+    assert array.internal_find_method("slice").call(
+        interpreter, [interpreter.make_int(1), interpreter.make_int(-1)]
+    ).view.obj is array.view.obj
+
+
+def test_slicing_from_source_does_not_copy():
+    code_base = """
+values = List()
+for i in 5000 {
+    values = values.push(i)
+}
+array = IntArray(*values)
+print(array.length())
+"""
+
+    code_slices = """
+values = List()
+for i in 5000 {
+    values = values.push(i)
+}
+array = IntArray(*values)
+slices = List()
+for i in 100 {
+    slices = slices.push(array.slice(i, 0 - i))
+}
+print(slices.length())
+"""
+
+    base_memory = measure_memory_usage(code_base)
+    slices_memory = measure_memory_usage(code_slices)
+
+    # 100 copies of the 40kB storage would add 4MB
+    assert slices_memory < base_memory * 1.5, (
+        f"Slicing copied the array: base={base_memory}, slices={slices_memory}"
+    )
@@ -0,0 +1,89 @@
+from maxlang.native_functions.vector import Vector, TransientVector
+from maxlang.native_functions.hamt import Hamt, TransientHamt
+from .main import run_source, formatted_error
+
+
+def test_transient_vector_leaves_source_intact():
+    source = Vector.from_iterable(range(1000))
+    transient = TransientVector(source)
+    for value in range(1000, 1100):
+        transient.push(value)
+    transient.set(0, "x")
+    transient.set(1050, "y")
+
+    built = transient.persistent()
+    assert list(source) == list(range(1000))
+    assert built.get(0) == "x" and built.get(1050) == "y" and len(built) == 1100
+
+    # After persistent() the transient copies again instead of editing in place
+    transient.set(1, "z")
+    transient.push("w")
+    assert built.get(1) == 1 and len(built) == 1100
+
+
+def test_transient_vector_edits_in_place():
+    transient = TransientVector(Vector())
+    for value in range(2000):
+        transient.push(value)
+    root = transient.root
+    transient.set(5, "x")
+    assert transient.root is root
+
+
+def test_transient_hamt_leaves_source_intact():
+    source = Hamt.from_items((i, i) for i in range(1000))
+    transient = TransientHamt(source)
+    for key in range(500):
+        transient.remove(key)
+    transient.set("new", 1)
+
+    built = transient.persistent()
+    assert len(source) == 1000 and source[0] == 0
+    assert len(built) == 501 and 0 not in built and built["new"] == 1
+
+
+def test_list_builder():
+    source = """
+    builder = List(1, 2).toBuilder()
+    for i in 100 {
+        builder.push(i)
+    }
+    builder.set(0, "first").push(7, 8)
+    items = builder.freeze()
+    print(items.length(), items.get(0), items.get(-1))
+    """
+    assert run_source(source) == "104 first 8"
+
+
+def test_map_builder():
+    source = """
+    original = Map(1 -> "a")
+    builder = original.toBuilder()
+    for i in 50 {
+        builder.set(i, i * 2)
+    }
+    builder.remove(3).push(100 -> "x")
+    frozen = builder.freeze()
+    print(frozen.length(), frozen.get(1), frozen.get(100), original.get(1), original.length())
+    """
+    assert run_source(source) == "50 2 x a 1"
+
+
+def test_builder_is_closed_after_freeze():
+    source = """
+    builder = List().toBuilder()
+    items = builder.freeze()
+    builder.push(1)
+    """
+    assert run_source(source) == formatted_error(
+        "Cannot use <ListBuilder> after freeze.", 4
+    )
+
+
+def test_builder_errors():
+    assert run_source("print(Map().toBuilder().get(1))") == formatted_error(
+        "Could not find key 1 in <MapBuilder>.", 1
+    )
+    assert run_source("print(List().toBuilder().set(0, 1))") == formatted_error(
+        "Index 0 out of range", 1
+    )
@@ -0,0 +1,95 @@
+from maxlang.lex import Lexer
+from maxlang.parse import Parser, Resolver
+from maxlang.closure import ClosureInterpreter
+from .main import run_source, formatted_error
+
+
+def compile_source(source):
+    statements = Parser(Lexer(source).scan_tokens(), print).parse()
+    interpreter = ClosureInterpreter(print)
+    Resolver(interpreter, print).resolve_many(statements)
+    return interpreter, statements
+
+
+def test_statements_are_compiled_once():
+    interpreter, statements = compile_source(
+        """
+total = 0
+add: n {
+    total = total + n
+}
+add(1)
+add(2)
+"""
+    )
+    interpreter.interpret(statements)
+    assert interpreter.compile(statements) is interpreter.compile(statements)
+
+    # The script and the body of add
+    assert len(interpreter.closures) == 2
+    assert str(interpreter.globals.values["total"]) == "3"
+
+
+def test_closure_engine_runs_program():
+    assert (
+        run_source(
+            """
+fib: n {
+    if n < 2 {
+        return n
+    }
+    return fib(n - 1) + fib(n - 2)
+}
+class Counter {
+    init: count {
+        return Map("count" -> count)
+    }
+    toString {
+        return "Counter(${self.count})"
+    }
+}
+for i in List(1, 2) {
+    print(fib(i + 9), Counter(i))
+}
+""",
+            engine="closure",
+        )
+        == "55 Counter(1)\n89 Counter(2)"
+    )
+
+
+def test_closure_engine_returns_from_loops():
+    assert (
+        run_source(
+            """
+items = List(1, 2, 3)
+find: wanted {
+    for item in items {
+        i = 0
+        while i < 3 {
+            if item == wanted {
+                return item
+            }
+            i = i + 1
+        }
+    }
+    return null
+}
+print(find(2), find(5))
+""",
+            engine="closure",
+        )
+        == "2 null"
+    )
+
+
+def test_closure_engine_runtime_error():
+    assert run_source(
+        """
+divide: a, b {
+    return a / b
+}
+print(divide(1, 0))
+""",
+        engine="closure",
+    ) == formatted_error("Attempted division by zero.", 3)
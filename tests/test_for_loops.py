@@ -1,3 +1,5 @@
+from maxlang.native_functions.Interators.BaseIterator import BaseIteratorInstance
+from maxlang.native_functions.Interators.IntIterator import IntIteratorInstance
 from .main import run_source, formatted_error
 
 
@@ -235,3 +237,35 @@ for i in List(1, 2, 3) {
     ) == formatted_error(
         "Error at 'i': <class Int> does not have required method 'inexistent'.", 2
     )
+
+
+def test_for_loop_on_varargs():
+    assert (
+        run_source(
+            """
+tester: varargs values {
+    for value in values {
+        print(value)
+    }
+}
+tester("test", "other_test")
+        """
+        )
+        == "test\nother_test"
+    )
+
+
+def test_native_iterator_without_remaining_uses_next(monkeypatch):
+    monkeypatch.setattr(
+        IntIteratorInstance, "remaining", BaseIteratorInstance.remaining
+    )
+    assert (
+        run_source(
+            """
+for i in 3 {
+    print(i)
+}
+"""
+        )
+        == "0\n1\n2"
+    )
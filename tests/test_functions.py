@@ -74,6 +74,23 @@ print(test_ret)
     )
 
 
+def test_recursive_calls_as_binary_operands():
+    assert (
+        run_source(
+            """
+fib: n {
+    if n < 2 {
+        return n
+    }
+    return fib(n - 1) + fib(n - 2)
+}
+print(fib(10))
+"""
+        )
+        == "55"
+    )
+
+
 def test_missing_arguments():
     assert run_source(
         """
@@ -209,3 +226,46 @@ print(t)
         "Error at 't': Cannot redefine variable of type <class Int> to type <class String>.",
         14,
     )
+
+
+def test_parameter_shadows_enclosing_parameter():
+    assert (
+        run_source(
+            """
+outer: n {
+    inner: n {
+        return n
+    }
+    return inner("inner")
+}
+print(outer("outer"))
+"""
+        )
+        == "inner"
+    )
+
+
+def test_return_leaves_nested_loops_and_blocks():
+    assert (
+        run_source(
+            """
+items = List(1, 2, 3)
+find: wanted {
+    for item in items {
+        {
+            i = 0
+            while i < 2 {
+                if item == wanted {
+                    return item
+                }
+                i = i + 1
+            }
+        }
+    }
+    return null
+}
+print(find(2), find(5))
+"""
+        )
+        == "2 null"
+    )
@@ -0,0 +1,109 @@
+from maxlang.native_functions.hamt import Hamt, CollisionNode
+from .main import run_source
+
+
+class CollidingKey:
+    def __init__(self, value):
+        self.value = value
+
+    def __eq__(self, other):
+        return isinstance(other, CollidingKey) and other.value == self.value
+
+    def __hash__(self):
+        return 7
+
+
+def test_set_get_remove():
+    hamt = Hamt.from_items((i, str(i)) for i in range(5000))
+    assert len(hamt) == 5000
+    assert hamt[1234] == "1234"
+    assert hamt.get(5000) is None
+
+    updated = hamt.set(1234, "x").remove(10)
+    assert updated[1234] == "x" and 10 not in updated
+    assert hamt[1234] == "1234" and 10 in hamt
+    assert len(updated) == 4999 and len(hamt) == 5000
+
+
+def test_no_op_updates_return_the_same_map():
+    hamt = Hamt.from_items([(1, "a")])
+    assert hamt.remove(2) is hamt
+    assert hamt.set(1, hamt[1]) is hamt
+
+
+def test_updates_share_untouched_nodes():
+    hamt = Hamt.from_items((i, i) for i in range(5000))
+    updated = hamt.set(0, "x")
+    shared = sum(a is b for a, b in zip(hamt.root.entries, updated.root.entries))
+    assert shared == len(hamt.root.entries) - 1
+
+
+def test_colliding_keys():
+    keys = [CollidingKey(i) for i in range(5)]
+    hamt = Hamt.from_items((key, key.value) for key in keys)
+    assert isinstance(hamt.root.entries[0], CollisionNode)
+    assert [hamt[key] for key in keys] == [0, 1, 2, 3, 4]
+
+    for key in keys:
+        hamt = hamt.remove(key)
+    assert len(hamt) == 0 and list(hamt.items()) == []
+
+
+def test_map_iterator_next_is_immutable():
+    source = """
+    map = Map(1 -> "a", 2 -> "b")
+    iterator = map.iterate()
+    step = iterator.next()
+    again = iterator.next()
+    print(step.first, step.second.next().first, again.first)
+    """
+    assert run_source(source) == 'Pair(1, "a") Pair(2, "b") Pair(1, "a")'
+
+
+def test_large_map_from_source():
+    source = """
+    map = Map()
+    for i in 3000 {
+        map = map.set(i, i * 2)
+    }
+    result = map.remove(1500)
+    print(map.length(), result.first.length(), map.get(2999), result.second)
+    """
+    assert run_source(source) == "3000 2999 5998 3000"
+
+
+def test_union_intersection_difference():
+    evens = Hamt.from_items((i, "even") for i in range(0, 2000, 2))
+    thirds = Hamt.from_items((i, "third") for i in range(0, 2000, 3))
+
+    union = evens.union(thirds)
+    assert set(union) == set(range(0, 2000, 2)) | set(range(0, 2000, 3))
+    assert union[6] == "even" and union[3] == "third"
+    assert set(evens.intersection(thirds)) == set(range(0, 2000, 6))
+    assert thirds.intersection(evens)[6] == "third"
+    assert set(evens.difference(thirds)) == set(range(0, 2000, 2)) - set(range(0, 2000, 6))
+    assert set(thirds.difference(evens)) == set(range(0, 2000, 3)) - set(range(0, 2000, 6))
+
+
+def test_bulk_operations_reuse_maps():
+    hamt = Hamt.from_items((i, i) for i in range(1000))
+    extended = hamt.set(-1, -1)
+    assert hamt.union(hamt) is hamt
+    assert hamt.union(Hamt()) is hamt
+    assert Hamt().union(hamt) is hamt
+    assert extended.union(hamt) is extended
+    assert hamt.intersection(extended) is hamt
+    assert hamt.difference(Hamt.from_items([(5000, 0)])) is hamt
+    assert len(extended.difference(hamt)) == 1
+    assert len(hamt.difference(hamt)) == 0
+
+
+def test_bulk_operations_with_collisions():
+    colliding = Hamt.from_items((CollidingKey(i), i) for i in range(10))
+    mixed = colliding.union(Hamt.from_items((i, i) for i in range(100)))
+    assert len(mixed) == 110
+
+    odd = Hamt.from_items((CollidingKey(i), i) for i in range(1, 10, 2))
+    assert [key.value for key in mixed.intersection(odd)] == [1, 3, 5, 7, 9]
+    assert len(mixed.difference(odd)) == 105
+    assert CollidingKey(2) in mixed.difference(odd)
@@ -0,0 +1,92 @@
+from maxlang.parse.callable import ClassCallable
+from maxlang.parse.inline_cache import InlineCache, POLYMORPHIC_LIMIT
+from maxlang.lex import Token, TokenType
+from .main import run_source
+
+
+def make_class(name, *methods):
+    token = Token(TokenType.IDENTIFIER, name, None, 1)
+    return ClassCallable(token, [], {method: f"{name}.{method}" for method in methods})
+
+
+def test_cache_is_monomorphic_then_polymorphic():
+    cache = InlineCache()
+    first = make_class("First", "area")
+    second = make_class("Second", "area")
+
+    assert cache.find(first, "area") == "First.area"
+    assert cache.klass is first and cache.polymorphic is None
+
+    assert cache.find(second, "area") == "Second.area"
+    assert cache.find(first, "area") == "First.area"
+    assert list(cache.polymorphic) == [second]
+
+
+def test_cache_becomes_megamorphic():
+    cache = InlineCache()
+    classes = [make_class(f"C{i}", "area") for i in range(POLYMORPHIC_LIMIT + 1)]
+    for klass in classes:
+        assert cache.find(klass, "area") == f"{klass.name.lexeme}.area"
+
+    assert cache.megamorphic and cache.polymorphic is None
+    assert cache.find(classes[-1], "area") == f"C{POLYMORPHIC_LIMIT}.area"
+
+
+def test_cache_does_not_remember_missing_methods():
+    cache = InlineCache()
+    klass = make_class("Test")
+    assert cache.find(klass, "area") is None
+    assert cache.methods == {}
+
+
+def test_polymorphic_call_site():
+    assert (
+        run_source(
+            """
+class Square {
+    init: side {
+        return Map("side" -> side)
+    }
+    area {
+        return self.side * self.side
+    }
+}
+class Circle {
+    init: radius {
+        return Map("radius" -> radius)
+    }
+    area {
+        return self.radius * 3
+    }
+}
+for shape in List(Square(2), Circle(1), Square(3), Circle(2)) {
+    print(shape.area())
+}
+"""
+        )
+        == "4\n3\n9\n6"
+    )
+
+
+def test_cached_binary_operator_sees_new_receiver_class():
+    assert (
+        run_source(
+            """
+class Money {
+    init: amount {
+        return Map("amount" -> amount)
+    }
+    add: other {
+        return self.amount + other.amount
+    }
+}
+add: a, b {
+    return a + b
+}
+print(add(1, 2))
+print(add("a", "b"))
+print(add(Money(1), Money(2)))
+"""
+        )
+        == "3\nab\n3"
+    )
@@ -0,0 +1,47 @@
+from maxlang.parse.callable import ClassCallable, InstanceCallable
+from maxlang.parse.environment import Environment
+from maxlang.native_functions.main import is_instance
+from maxlang.native_functions.BaseTypes.Int import IntClass
+from maxlang.native_functions.BaseTypes.Float import FloatClass
+from maxlang.lex import Token, TokenType
+from .main import run_source, make_interpreter
+
+
+def make_class(name, *superclasses):
+    return ClassCallable(Token(TokenType.IDENTIFIER, name, None, 1), list(superclasses), {})
+
+
+def test_ancestors_include_every_superclass():
+    base = make_class("Base")
+    middle = make_class("Middle", base)
+    other = make_class("Other")
+    leaf = make_class("Leaf", middle, other)
+
+    assert leaf.ancestors == {leaf, middle, base, other}
+    assert base.ancestors == {base}
+
+
+def test_is_instance_ignores_environment_depth():
+    interpreter = make_interpreter()
+    value = interpreter.make_int(3)
+    for _ in range(100):
+        interpreter.environment = Environment(interpreter.environment)
+
+    assert is_instance(interpreter, value, IntClass.name)
+    assert is_instance(interpreter, value, FloatClass.name, IntClass.name)
+    assert not is_instance(interpreter, value, FloatClass.name)
+
+
+def test_is_instance_of_user_instance():
+    interpreter = make_interpreter()
+    instance = InstanceCallable(make_class("Point"))
+    assert not is_instance(interpreter, instance, IntClass.name)
+
+
+def test_is_instance_method():
+    source = """
+    class A {}
+    class B: A {}
+    print(5.isInstance(Int), 5.isInstance(Float), 5.isInstance(A))
+    """
+    assert run_source(source) == "true false false"
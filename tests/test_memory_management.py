@@ -1,11 +1,15 @@
 """Memory management tests to ensure structural sharing and efficient memory usage."""
 
+import gc
 import tracemalloc
 from tests.main import run_source
 
 
 def measure_memory_usage(code):
     """Measure peak memory usage while executing code."""
+    # Start from a collected heap so garbage from earlier tests does not
+    # decide when the collector runs during the measurement
+    gc.collect()
     tracemalloc.start()
     print(run_source(code))
     _current, peak = tracemalloc.get_traced_memory()
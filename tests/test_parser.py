@@ -0,0 +1,91 @@
+from maxlang.lex import Lexer
+from maxlang.parse import AstPrinter, Interpreter, Resolver
+from maxlang.parse.parser import Parser
+
+
+def parse(source):
+    errors = []
+    statements = Parser(
+        Lexer(source).scan_tokens(),
+        lambda token, message: errors.append((token.lexeme, message)),
+    ).parse()
+    printer = AstPrinter()
+    return [
+        statement.accept(printer) for statement in statements if statement
+    ], errors
+
+
+def test_operators_bind_by_precedence():
+    assert parse("a or b and c == d < e + f * -g") == (
+        [
+            "(or (getvar a) (and (getvar b) (== (getvar c) "
+            "(< (getvar d) (+ (getvar e) (* (getvar f) (- (getvar g))))))))"
+        ],
+        [],
+    )
+
+
+def test_operators_are_left_associative():
+    assert parse("a - b - c / d * e") == (
+        ["(- (- (getvar a) (getvar b)) (* (/ (getvar c) (getvar d)) (getvar e)))"],
+        [],
+    )
+    assert parse("x = y = !!z") == (["(setvar x (setvar y (! (! (getvar z)))))"], [])
+
+
+def test_field_update_only_follows_a_get():
+    assert parse("p.x: 1 + 2") == (["(field_update (get x (getvar p)) (+ 1 2))"], [])
+    assert parse("f(x: 1)") == (["(call (getvar f) x:1)"], [])
+    assert parse("f(x: 1, p.y: 2)") == (
+        [],
+        [("2", "Cannot call with an unnamed argument after a named argument.")],
+    )
+
+
+def test_operators_continue_on_the_next_line():
+    assert parse("a\n+ b\n(c)") == (
+        ["(+ (getvar a) (call (getvar b) (getvar c)))"],
+        [],
+    )
+
+
+def test_if_expression_is_an_operand():
+    assert parse("a + if b { c } else { d } * e") == (
+        [
+            "(+ (getvar a) (* (if (getvar b))\n(then (getvar c))\n"
+            "(else (getvar d)) (getvar e)))"
+        ],
+        [],
+    )
+
+
+def test_parse_errors():
+    assert parse("1 +") == ([], [("", "Expect expression.")])
+    assert parse("(1") == ([], [("", "Expect ')' after expression.")])
+    assert parse("1 = 2") == (["1"], [("=", "Invalid assignment target.")])
+    assert parse("a.") == ([], [("", "Expect property name after '.'.")])
+
+
+def test_nodes_are_slotted_and_hashed_by_identity():
+    first, second = Parser(Lexer("a + 1\na + 1").scan_tokens(), print).parse()
+
+    assert first == second
+    assert len({first, second, first.expression, second.expression}) == 4
+    assert not hasattr(first.expression, "__dict__")
+
+
+def test_resolver_stores_local_depths_on_nodes():
+    source = "x = 1\nf: a {\n    b = a\n    g {\n        return a + x\n    }\n}\n"
+    statements = Parser(Lexer(source).scan_tokens(), print).parse()
+    Resolver(Interpreter(print), print).resolve_many(statements)
+
+    assign_x, function = statements
+    assign_b, inner = function.function.body
+    (return_sum,) = inner.function.body
+
+    assert assign_x.expression.local is None
+    assert function.local is None
+    assert assign_b.expression.value.local == (0, 0)
+    assert inner.local == (0, 1)
+    assert return_sum.value.left.local == (1, 0)
+    assert return_sum.value.right.local is None
@@ -0,0 +1,70 @@
+from maxlang.native_functions.vector import Vector, WIDTH
+from .main import run_source
+
+
+SIZES = (0, 1, WIDTH, WIDTH + 1, WIDTH * WIDTH, WIDTH * WIDTH + WIDTH + 1)
+
+
+def test_from_iterable_matches_pushes():
+    for size in SIZES:
+        built = Vector.from_iterable(range(size))
+        pushed = Vector()
+        for value in range(size):
+            pushed = pushed.push(value)
+
+        assert list(built) == list(pushed) == list(range(size))
+        assert len(built) == len(pushed) == size
+        assert built.shift == pushed.shift
+
+
+def test_get_and_set():
+    vector = Vector.from_iterable(range(5000))
+    for index in (0, 31, 32, 1023, 1024, 4999):
+        assert vector.get(index) == index
+    assert vector.get(-1) == 4999
+
+    updated = vector.set(1500, "x").set(4999, "y")
+    assert updated.get(1500) == "x" and updated.get(4999) == "y"
+    assert vector.get(1500) == 1500 and vector.get(4999) == 4999
+
+
+def test_updates_share_untouched_leaves():
+    vector = Vector.from_iterable(range(5000))
+    updated = vector.set(0, "x")
+    assert updated.root[-1] is vector.root[-1]
+    assert updated.tail is vector.tail
+
+    pushed = vector.push(5000)
+    assert pushed.root is vector.root
+
+
+def test_pop_until_empty():
+    size = WIDTH * WIDTH + 3
+    vector = Vector.from_iterable(range(size))
+    for expected in range(size - 1, -1, -1):
+        assert vector.get(-1) == expected
+        vector = vector.pop()
+        assert len(vector) == expected
+
+    assert list(vector) == []
+    assert vector.shift == Vector().shift
+
+
+def test_extend_and_iterate_from():
+    vector = Vector.from_iterable(range(40)).extend(range(40, 2000))
+    assert list(vector) == list(range(2000))
+    for start in (0, 5, WIDTH, 1000, 1999, 2000):
+        assert list(vector.iterate_from(start)) == list(range(start, 2000))
+
+
+def test_large_list_from_source():
+    source = """
+    items = List()
+    for i in 2000 {
+        items = items.push(i)
+    }
+    items = items.set(1500, -1)
+    popped = items.pop()
+    print(items.length(), items.get(1500), items.get(1999), popped.first.length(), popped.second)
+    """
+    assert run_source(source) == "2000 -1 1999 1999 1999"
@@ -0,0 +1,81 @@
+from contextlib import redirect_stdout
+from random import Random
+import io
+
+from maxlang import Max
+from maxlang.lex import Lexer, RegexLexer, Token, TokenType, internal_token
+
+
+SOURCES = (
+    "",
+    "x = 1\nprint(x + 2.5, x // 3 -> 4)\n",
+    "a += 1\nb -= 2\nc *= 3\nd /= 4\ne = !f != g == h <= i >= j < k > l\n",
+    "class A {\n    init: x {\n        return Map(\"x\" -> x)\n    }\n}\n",
+    "for i in List(1, 2) {\n    print(i)\n}\nwhile true and not_false or null {}\n",
+    "1.5 1. 1.x .5 12345678901234567890 x_1 _y",
+    "-- a comment\nx -- another\n-* a\nblock\ncomment *-\ny",
+    "-* never closed\n\n",
+    "x *- y",
+    '"Hello ${name}!"',
+    "'single ${a + b} quoted' `back ${c} ticked`",
+    '"nested ${"inner ${deep} end"} outer ${x}"',
+    '"escaped \\${name} and ${name}"',
+    '"multi\nline ${x\n+ y}\nstring"',
+    '"${}" "${"${"${}"}"}"',
+    '"unterminated',
+    '"unterminated ${interpolation',
+    '"${',
+    "é = ٣ + $ @ ",
+)
+
+
+def scan(lexer_class, source):
+    lexer = lexer_class(source)
+    tokens = [
+        (token.type_, token.lexeme, token.literal, token.line)
+        for token in lexer.scan_tokens()
+    ]
+    return tokens, [(error.line, error.message) for error in lexer.errors]
+
+
+def test_same_tokens_as_the_scanning_lexer():
+    for source in SOURCES:
+        assert scan(RegexLexer, source) == scan(Lexer, source), source
+
+
+def test_same_tokens_on_random_sources():
+    fragments = [source for source in SOURCES if len(source) < 12]
+    fragments += ['"', "'", "${", "}", "\\", "\n", " ", "-", "*", "=", "x", "1"]
+    random = Random(20)
+
+    for _ in range(2000):
+        source = "".join(random.choices(fragments, k=random.randint(1, 10)))
+        assert scan(RegexLexer, source) == scan(Lexer, source), source
+
+
+def test_run_with_regex_lexer():
+    out = io.StringIO()
+    with redirect_stdout(out):
+        Max(lexer="regex").run_source('name = "world"\nprint("Hello ${name}!")\n')
+
+    assert out.getvalue().strip() == "Hello world!"
+
+
+def test_identifier_lexemes_are_interned():
+    source = "total = total + other_total\nprint(total)\n"
+    for lexer_class in (Lexer, RegexLexer):
+        names = [
+            token.lexeme
+            for token in lexer_class(source).scan_tokens()
+            if token.lexeme == "total"
+        ]
+        assert len(names) == 3
+        assert all(name is names[0] for name in names)
+
+
+def test_internal_tokens_are_shared():
+    token = internal_token("init")
+
+    assert internal_token("init") is token
+    assert token == Token(TokenType.IDENTIFIER, "init", None, -1)
+    assert not hasattr(token, "__dict__")
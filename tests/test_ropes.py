@@ -0,0 +1,37 @@
+from maxlang.native_functions.BaseTypes.String import StringInstance, ROPE_THRESHOLD
+from .main import make_interpreter
+
+
+def make_string(text):
+    return StringInstance(make_interpreter()).set_value(text)
+
+
+def test_short_strings_are_copied():
+    result = make_string("a").concat("b")
+    assert result.parts is None and result.value == "ab"
+
+
+def test_long_strings_share_their_parts():
+    base = make_string("x" * ROPE_THRESHOLD)
+    grown = base
+    for i in range(100):
+        grown = grown.concat(str(i))
+
+    assert "value" not in grown.__dict__
+    assert grown.count == 101
+    assert grown.value == "x" * ROPE_THRESHOLD + "".join(map(str, range(100)))
+    assert grown.parts is None
+
+
+def test_branches_read_their_own_parts():
+    base = make_string("x" * ROPE_THRESHOLD).concat("a")
+    left = base.concat("b")
+    right = base.concat("c")
+    further = left.concat("d")
+
+    assert left.parts is further.parts and right.parts is not left.parts
+    assert (base.value, left.value, right.value, further.value) == tuple(
+        "x" * ROPE_THRESHOLD + suffix for suffix in ("a", "ab", "ac", "abd")
+    )
+    assert base == make_string("x" * ROPE_THRESHOLD + "a")
+    assert hash(further) == hash("x" * ROPE_THRESHOLD + "abd")
@@ -0,0 +1,129 @@
+from contextlib import redirect_stdout, redirect_stderr
+from dataclasses import astuple
+import io
+
+import pytest
+
+from maxlang import Max
+from maxlang.lex import Lexer, StreamingLexer, Token, TokenType
+from maxlang.parse.parser import StreamingParser
+from .main import formatted_error
+from .test_regex_lexer import SOURCES
+
+
+PROGRAM = """
+-* A block comment
+   over two lines *-
+class Point {
+    init: x, y {
+        return Map("x" -> x, "y" -> y)
+    }
+    toString {
+        return "Point(${self.x}, ${self.y})"
+    }
+}
+square: n {
+    return n * n
+}
+total = 0
+for i in List(1, 2, 3) {
+    total = i + total
+}
+print("total ${square(total)},
+at ${Point(1, 2)}")
+"""
+
+
+class Lines:
+    """A file read line by line, counting the lines read."""
+
+    def __init__(self, source):
+        self.lines = io.StringIO(source).readlines()
+        self.read = 0
+
+    def __iter__(self):
+        for line in self.lines:
+            self.read += 1
+            yield line
+
+
+def run(source, **options):
+    out = io.StringIO()
+    with redirect_stdout(out), redirect_stderr(out):
+        Max(**options).run_source(source)
+    return out.getvalue().strip()
+
+
+def test_same_tokens_as_the_lexer():
+    for source in SOURCES:
+        lexer = Lexer(source)
+        streaming_lexer = StreamingLexer(io.StringIO(source))
+
+        assert [astuple(token) for token in streaming_lexer.stream_tokens()] == [
+            astuple(token) for token in lexer.scan_tokens()
+        ], source
+        assert streaming_lexer.errors == lexer.errors
+
+
+def test_same_output_as_a_whole_run():
+    for engine in ("tree", "vm", "closure"):
+        assert run(PROGRAM, engine=engine, stream=True) == run(PROGRAM, engine=engine)
+        assert run(PROGRAM, engine=engine) == "total 36,\nat Point(1, 2)"
+
+
+def test_statements_are_parsed_as_lines_are_read():
+    lines = Lines(PROGRAM)
+    lexer = StreamingLexer(lines)
+    parser = StreamingParser(lexer.stream_tokens(), print)
+    statements = parser.statements()
+
+    # Each statement is read up to its last line
+    next(statements)
+    assert lines.read == 11
+    assert len(parser.tokens.window) <= 2
+
+    next(statements)
+    assert lines.read == 14
+
+    assert len(list(statements)) == 3
+    assert lines.read == len(lines.lines)
+
+
+def test_statements_run_before_later_ones_are_read():
+    output = run('print("first")\nprint(1 +)\nprint("second")\n', stream=True)
+
+    assert output == "first\n" + formatted_error("Error at ')': Expect expression.", 2)
+
+
+def test_window_repeats_the_end_of_file():
+    tokens = iter([Token(TokenType.EOF, "", None, 1)])
+    parser = StreamingParser(tokens, print)
+
+    assert parser.is_at_end()
+    assert parser.tokens[5].type_ == TokenType.EOF
+
+
+def test_only_the_scanning_lexer_streams():
+    with pytest.raises(ValueError, match="Cannot stream with the regex lexer."):
+        Max(lexer="regex", stream=True)
+
+
+def test_lines_of_comments_and_strings_are_not_copied():
+    body = "".join(f"line {index}\n" for index in range(200))
+    source = f'-* {body} *-\nprint("{body}")\n'
+    held = []
+
+    class Lines:
+        def __iter__(self):
+            for line in io.StringIO(source):
+                held.append(len(lexer.source) + sum(map(len, lexer.pending)))
+                yield line
+
+    lexer = StreamingLexer(Lines())
+
+    assert [astuple(token) for token in lexer.stream_tokens()] == [
+        astuple(token) for token in Lexer(source).scan_tokens()
+    ]
+    # The comment is dropped line by line, the string is kept until it ends
+    assert max(held[:201]) < 20
+    assert max(held) < len(body) + 20
@@ -26,3 +26,78 @@ name = "world"
 print("Hello \${name}!")
         """
 ) == "Hello ${name}!"
+
+
+def test_string_interpolation_of_several_values():
+    assert run_source(
+        """
+class Point {
+    init: x, y {
+        return Map("x" -> x, "y" -> y)
+    }
+    toString {
+        return "(${self.x}, ${self.y})"
+    }
+}
+flag = true
+print("${1} + ${2.5} is ${1 + 2.5}, ${flag} at ${Point(1, 2)} in ${List("a")}")
+        """
+) == '1 + 2.5 is 3.5, true at (1, 2) in List("a")'
+
+
+def test_string_interpolation_is_a_single_expression():
+    from maxlang.lex.lexer import Lexer
+    from maxlang.parse.parser import Parser
+    from maxlang.parse.expressions import Interpolation, Literal, Variable
+
+    tokens = Lexer('"a ${x} b ${y}"\n').scan_tokens()
+    statements = Parser(tokens, lambda token, message: None).parse()
+    expression = statements[0].expression
+
+    assert isinstance(expression, Interpolation)
+    assert [type(part) for part in expression.parts] == [
+        Literal,
+        Variable,
+        Literal,
+        Variable,
+        Literal,
+    ]
+    assert [part.value for part in expression.parts[::2]] == ["a ", " b ", ""]
+
+
+def test_string_interpolation_of_null():
+    assert run_source(
+        """
+print("Hello ${null}!")
+        """
+) == formatted_error("Cannot interpolate null into a String.", 2)
+
+
+def test_string_interpolation_without_to_string():
+    assert run_source(
+        """
+class Empty {
+    init {
+        return Map()
+    }
+}
+print("Hello ${Empty()}!")
+        """
+) == formatted_error("Empty does not implement the toString method.", 7)
+
+
+def test_escaped_interpolation_keeps_its_source_text():
+    from maxlang.lex import Lexer, RegexLexer
+
+    source = '"a \\${b} ${c} \\\\${d}"\nx'
+    for lexer_class in (Lexer, RegexLexer):
+        tokens = lexer_class(source).scan_tokens()
+
+        assert [(token.lexeme, token.literal) for token in tokens[:5]] == [
+            ('"a \\${b} ', "a ${b} "),
+            ("${", None),
+            ("c", None),
+            ("", None),
+            ('} \\\\${d}"', " \\${d}"),
+        ]
+        assert (tokens[-2].lexeme, tokens[-2].line) == ("x", 2)
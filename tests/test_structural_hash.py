@@ -0,0 +1,96 @@
+from maxlang.native_functions.hamt import Hamt
+from maxlang.native_functions.vector import Vector
+from .main import run_source
+
+
+class Uncomparable:
+    """Fails the test when compared with another one, to check shared nodes
+    are skipped."""
+
+    def __eq__(self, other):
+        if isinstance(other, Uncomparable):
+            raise AssertionError("compared a shared value")
+        return False
+
+    def __hash__(self):
+        return id(self)
+
+
+def test_vector_equality_skips_shared_nodes():
+    vector = Vector.from_iterable(Uncomparable() for _ in range(5000))
+    updated = vector.set(1234, 1).set(1234, 2)
+    assert updated.equals(vector.set(1234, 2))
+    assert not updated.equals(vector.set(1234, 3))
+    assert not vector.equals(vector.push(1))
+
+
+def test_vector_equality_compares_values():
+    assert Vector.from_iterable(range(1000)).equals(Vector.from_iterable(range(1000)))
+    assert not Vector.from_iterable(range(1000)).equals(
+        Vector.from_iterable(range(1, 1001))
+    )
+    assert Vector.from_iterable(range(40)).pop().equals(Vector.from_iterable(range(39)))
+
+
+def test_hamt_equality_skips_shared_subtrees():
+    hamt = Hamt.from_items((i, Uncomparable()) for i in range(5000))
+    assert hamt.equals(hamt.remove(10).set(10, hamt[10]))
+    assert not hamt.equals(hamt.set(10, 1))
+    assert not hamt.equals(hamt.remove(10))
+
+
+def test_hamt_equality_ignores_insertion_order():
+    first = Hamt.from_items((i, i) for i in range(1000))
+    second = Hamt.from_items((i, i) for i in reversed(range(1000)))
+    assert first.equals(second)
+    assert not first.equals(second.set(999, 0))
+
+
+def test_collections_as_map_keys():
+    source = """
+    map = Map(List(1, 2) -> "list", (1 -> 2) -> "pair", Map(1 -> 2) -> "map")
+    print(map.get(List(1, 2)), map.get(1 -> 2), map.get(Map(1 -> 2)))
+    """
+    assert run_source(source) == "list pair map"
+
+
+def test_equal_collections_hash_equally():
+    source = """
+    list = List(1, 2).push(3)
+    map = Map(1 -> 1).set(2, 2).remove(1).first
+    keys = Map(list -> 1, map -> 2, (list -> map) -> 3)
+    print(keys.get(List(1, 2, 3)), keys.get(Map(2 -> 2)), keys.get(List(1, 2, 3) -> Map(2 -> 2)))
+    """
+    assert run_source(source) == "1 2 3"
+
+
+def test_nested_equality():
+    source = """
+    print(List(List(1), Map(1 -> "a")).equals(List(List(1), Map(1 -> "a"))))
+    print(List(List(1), Map(1 -> "a")).equals(List(List(1), Map(1 -> "b"))))
+    print(Map(1 -> List(1)).equals(Map(1 -> List(1))))
+    print((1 -> List(2)).equals(1 -> List(3)))
+    """
+    assert run_source(source) == "true\nfalse\ntrue\nfalse"
+
+
+def test_string_is_cached_only_for_frozen_values():
+    source = """
+    label = "a"
+    class Label {
+        toString {
+            return label
+        }
+    }
+    frozen = List(1, "a", List(2.5, true), 1 -> Map(2 -> 3))
+    print(frozen.toString(), frozen.toString())
+    labels = List(Label())
+    print(labels)
+    label = "b"
+    print(labels)
+    """
+    assert run_source(source) == (
+        'List(1, "a", List(2.5, true), Pair(1, Map(2 -> 3))) '
+        'List(1, "a", List(2.5, true), Pair(1, Map(2 -> 3)))\n'
+        "List(a)\nList(b)"
+    )
@@ -0,0 +1,58 @@
+from maxlang.parse.environment import Environment
+from maxlang.parse.expressions import Literal, Type
+from maxlang.native_functions.BaseTypes.Bool import BoolClass
+from maxlang.native_functions.BaseTypes.Int import IntClass
+from maxlang.lex import Token, TokenType
+from .main import run_source, make_interpreter
+
+
+def make_literal(value, klass):
+    token = Token(TokenType.IDENTIFIER, str(value), value, 1)
+    return Literal(value, Type(klass, token))
+
+
+def test_bools_are_shared():
+    interpreter = make_interpreter()
+    assert interpreter.make_bool(True) is interpreter.true
+    assert interpreter.make_bool(False) is interpreter.false
+    assert interpreter.visit_literal(make_literal(True, BoolClass)) is interpreter.true
+
+    other = make_interpreter()
+    assert other.true is not interpreter.true
+
+
+def test_small_ints_are_shared():
+    interpreter = make_interpreter()
+    assert interpreter.make_int(7) is interpreter.make_int(7)
+    assert interpreter.make_int(-5) is interpreter.make_int(-5)
+    assert interpreter.visit_literal(make_literal(7, IntClass)) is interpreter.make_int(7)
+
+    assert interpreter.make_int(257) is not interpreter.make_int(257)
+    assert interpreter.make_int(257) == interpreter.make_int(257)
+
+
+def test_literals_do_not_search_the_scopes():
+    interpreter = make_interpreter()
+    # A scope reaching no builtin class
+    interpreter.environment = Environment()
+    assert interpreter.visit_literal(make_literal(7, IntClass)) is interpreter.make_int(7)
+
+
+def test_small_int_range_is_configurable():
+    interpreter = make_interpreter(small_ints=range(1000, 1010))
+    assert interpreter.make_int(1005) is interpreter.make_int(1005)
+    assert interpreter.make_int(5) is not interpreter.make_int(5)
+
+    interpreter = make_interpreter(small_ints=range(0))
+    assert interpreter.make_int(0) is not interpreter.make_int(0)
+
+
+def test_int_loop_variable_is_an_int():
+    source = """
+    total = 0
+    for i in 4 {
+        total = total + i * 2
+    }
+    print(total)
+    """
+    assert run_source(source) == "12"
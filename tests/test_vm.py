@@ -0,0 +1,139 @@
+from maxlang.lex import Lexer
+from maxlang.parse import Parser, Resolver
+from maxlang.vm import VirtualMachine, OpCode
+from .main import run_source, formatted_error
+
+
+def compile_source(source):
+    statements = Parser(Lexer(source).scan_tokens(), print).parse()
+    machine = VirtualMachine(print)
+    Resolver(machine, print).resolve_many(statements)
+    return machine.compile(statements, "<script>")
+
+
+def test_while_loop_compiles_to_backward_jump():
+    chunk = compile_source(
+        """
+i = 0
+while i < 3 {
+    i = i + 1
+}
+"""
+    )
+    jumps = [
+        (chunk.code[offset], chunk.code[offset + 1])
+        for offset in range(0, len(chunk.code), 2)
+        if chunk.code[offset] == OpCode.JUMP
+    ]
+    assert len(jumps) == 1
+    assert jumps[0][1] < chunk.code.index(OpCode.JUMP)
+    assert "POP_JUMP_IF_FALSE" in chunk.disassemble()
+
+
+def test_locals_and_globals_use_different_instructions():
+    chunk = compile_source(
+        """
+total = 0
+add: n {
+    total = total + n
+}
+"""
+    )
+    function = chunk.constants[chunk.code[chunk.code.index(OpCode.MAKE_FUNCTION) + 1]]
+    assert OpCode.ASSIGN_GLOBAL in chunk.code
+
+    machine = VirtualMachine(print)
+    body_chunk = machine.compiler.compile(function[1].body, "add")
+    assert OpCode.LOAD_GLOBAL in body_chunk.code
+    assert OpCode.LOAD_LOCAL in body_chunk.code
+
+
+def test_number_operators_and_assignment_statements_are_specialised():
+    chunk = compile_source(
+        """
+i = 0
+while i < 3 {
+    i = i + 1
+}
+j = i = i / 2
+"""
+    )
+    instructions = chunk.code[::2]
+    assert OpCode.COMPARE in instructions
+    assert OpCode.ARITHMETIC in instructions
+    assert OpCode.BINARY in instructions
+    # An assignment inside an expression keeps its value on the stack
+    assert instructions.count(OpCode.ASSIGN_GLOBAL) == 3
+    assert instructions.count(OpCode.STORE_GLOBAL) == 1
+
+
+def test_vm_number_operators():
+    assert (
+        run_source(
+            """
+print(1 + 2, 7 - 10, 3 * 4, 1.5 + 0.5, 2.5 * 2.0, 100000 * 100000, 7 / 2)
+print(1 < 2, 2 <= 1, 1.5 > 1.0, 2.0 >= 2.0, 3 == 3, 1.0 != 2.0)
+print("a" + "b", "ab" == "b", true != false)
+""",
+            engine="vm",
+        )
+        == "3 -3 12 2.0 5.0 10000000000 3.5\ntrue false true true true true\nab false true"
+    )
+
+
+def test_vm_runs_program():
+    assert (
+        run_source(
+            """
+fib: n {
+    if n < 2 {
+        return n
+    }
+    return fib(n - 1) + fib(n - 2)
+}
+class Counter {
+    init: count {
+        return Map("count" -> count)
+    }
+    toString {
+        return "Counter(${self.count})"
+    }
+}
+for i in List(1, 2) {
+    print(fib(i + 9), Counter(i))
+}
+""",
+            engine="vm",
+        )
+        == "55 Counter(1)\n89 Counter(2)"
+    )
+
+
+def test_vm_deep_recursion_does_not_use_python_stack():
+    assert (
+        run_source(
+            """
+count: n {
+    if n == 0 {
+        return 0
+    }
+    return count(n - 1) + 1
+}
+print(count(3000))
+""",
+            engine="vm",
+        )
+        == "3000"
+    )
+
+
+def test_vm_runtime_error():
+    assert run_source(
+        """
+divide: a, b {
+    return a / b
+}
+print(divide(1, 0))
+""",
+        engine="vm",
+    ) == formatted_error("Attempted division by zero.", 3)
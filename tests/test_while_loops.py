@@ -0,0 +1,45 @@
+from .main import run_source
+
+
+def test_while_loop():
+    assert (
+        run_source(
+            """
+i = 0
+while i < 3 {
+    print(i)
+    i = i + 1
+}
+        """
+        )
+        == "0\n1\n2"
+    )
+
+
+def test_while_loop_never_entered():
+    assert (
+        run_source(
+            """
+while false {
+    print("never")
+}
+print("done")
+        """
+        )
+        == "done"
+    )
+
+
+def test_while_loop_uses_to_bool():
+    assert (
+        run_source(
+            """
+i = 3
+while i {
+    print(i)
+    i = i - 1
+}
+        """
+        )
+        == "3\n2\n1"
+    )